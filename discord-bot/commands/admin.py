@@ -4,18 +4,31 @@ Restricted commands for bot administrators
 """
 
 import os
+import asyncio
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from utils.logger import logger
 from utils.api_client import APIClient
+from utils.formatting import truncate
+from utils.command_tree import command_tree_signature
 from handlers.error import handle_api_error
+from handlers.events import get_total_users
 
 # Admin Discord IDs from environment
-ADMIN_IDS = [int(uid) for uid in os.getenv("ADMIN_DISCORD_IDS", "").split(",") if uid.strip()]
+ADMIN_IDS = frozenset(int(uid) for uid in os.getenv("ADMIN_DISCORD_IDS", "").split(",") if uid.strip())
 ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
 
+# Flagged result sets larger than this build their embed in a worker thread
+FLAGGED_EMBED_THREAD_THRESHOLD = 20
+
+# Risk levels that get called out in the flagged-queries embed
+_HIGH_RISKS = frozenset(("high", "critical"))
+
 
 def is_admin():
     """Check if user is an admin"""
@@ -24,6 +37,50 @@ def is_admin():
     return app_commands.check(predicate)
 
 
+def _build_flagged_embed(flagged: List[Dict[str, Any]], timestamp: datetime) -> discord.Embed:
+    """
+    Build the flagged-queries review embed.
+
+    Args:
+        flagged: Flagged queries from the API
+        timestamp: Embed timestamp
+
+    Returns:
+        Embed listing up to 5 flagged queries
+    """
+    embed = discord.Embed(
+        title="⚠️ Flagged Queries for Review",
+        description=f"Showing {len(flagged)} flagged queries",
+        color=discord.Color.orange(),
+        timestamp=timestamp,
+    )
+
+    for i, query in enumerate(flagged[:5], 1):  # Show max 5 in embed
+        query_text = truncate(query["query_text"], 80)
+
+        risk_level = query["risk_level"]
+        flags = [
+            name
+            for condition, name in (
+                (query["confidence_score"] < 0.5, "Low Confidence"),
+                (query["is_escalated"], "Escalated"),
+                (risk_level in _HIGH_RISKS, f"{risk_level.upper()} Risk"),
+            )
+            if condition
+        ]
+
+        embed.add_field(
+            name=f"{i}. {query_text}",
+            value=f"User: {query['discord_username']}\n"
+                  f"Confidence: {query['confidence_score']:.2f}\n"
+                  f"Flags: {', '.join(flags)}\n"
+                  f"Query ID: `{query['query_id']}`",
+            inline=False,
+        )
+
+    return embed
+
+
 class AdminCommands(commands.Cog):
     """
     Cog for admin-only slash commands.
@@ -32,6 +89,11 @@ class AdminCommands(commands.Cog):
     def __init__(self, bot: commands.Bot, api_client: APIClient):
         self.bot = bot
         self.api = api_client
+        self.log = logger.bind(cog="admin")
+
+        # Signature of the command tree at the last successful sync
+        self._last_sync_signature: Optional[bytes] = None
+        self._last_sync_count = 0
 
     @app_commands.command(name="stats", description="View system statistics (Admin only)")
     @is_admin()
@@ -42,7 +104,8 @@ class AdminCommands(commands.Cog):
         Args:
             interaction: Discord interaction
         """
-        logger.info("command.admin.stats", admin_id=str(interaction.user.id))
+        now = discord.utils.utcnow()
+        self.log.info("command.admin.stats", admin_id=str(interaction.user.id))
 
         await interaction.response.defer(ephemeral=True, thinking=True)
 
@@ -52,7 +115,7 @@ class AdminCommands(commands.Cog):
             embed = discord.Embed(
                 title="📊 System Statistics",
                 color=discord.Color.blue(),
-                timestamp=discord.utils.utcnow(),
+                timestamp=now,
             )
 
             # User statistics
@@ -96,6 +159,10 @@ class AdminCommands(commands.Cog):
             )
 
             await interaction.followup.send(embed=embed, ephemeral=True)
+            self.log.info(
+                "command.admin.stats.completed",
+                duration_ms=int((discord.utils.utcnow() - now).total_seconds() * 1000),
+            )
 
         except Exception as e:
             await handle_api_error(interaction, e)
@@ -111,7 +178,8 @@ class AdminCommands(commands.Cog):
             interaction: Discord interaction
             limit: Number of queries to show
         """
-        logger.info("command.admin.flagged", admin_id=str(interaction.user.id), limit=limit)
+        now = discord.utils.utcnow()
+        self.log.info("command.admin.flagged", admin_id=str(interaction.user.id), limit=limit)
 
         if limit < 1 or limit > 20:
             await interaction.response.send_message(
@@ -132,56 +200,55 @@ class AdminCommands(commands.Cog):
                 )
                 return
 
-            embed = discord.Embed(
-                title="⚠️ Flagged Queries for Review",
-                description=f"Showing {len(flagged)} flagged queries",
-                color=discord.Color.orange(),
-                timestamp=discord.utils.utcnow(),
-            )
-
-            for i, query in enumerate(flagged[:5], 1):  # Show max 5 in embed
-                query_text = query["query_text"][:80] + "..." if len(query["query_text"]) > 80 else query["query_text"]
-
-                flags = []
-                if query["confidence_score"] < 0.5:
-                    flags.append("Low Confidence")
-                if query["is_escalated"]:
-                    flags.append("Escalated")
-                if query["risk_level"] in ["high", "critical"]:
-                    flags.append(f"{query['risk_level'].upper()} Risk")
-
-                embed.add_field(
-                    name=f"{i}. {query_text}",
-                    value=f"User: {query['discord_username']}\n"
-                          f"Confidence: {query['confidence_score']:.2f}\n"
-                          f"Flags: {', '.join(flags)}\n"
-                          f"Query ID: `{query['query_id']}`",
-                    inline=False,
-                )
+            # Build off the event loop for large result sets
+            if len(flagged) > FLAGGED_EMBED_THREAD_THRESHOLD:
+                embed = await asyncio.to_thread(_build_flagged_embed, flagged, now)
+            else:
+                embed = _build_flagged_embed(flagged, now)
 
             await interaction.followup.send(embed=embed, ephemeral=True)
+            self.log.info(
+                "command.admin.flagged.completed",
+                count=len(flagged),
+                duration_ms=int((discord.utils.utcnow() - now).total_seconds() * 1000),
+            )
 
         except Exception as e:
             await handle_api_error(interaction, e)
 
     @app_commands.command(name="sync", description="Sync slash commands (Admin only)")
     @is_admin()
-    async def sync_commands(self, interaction: discord.Interaction):
+    @app_commands.describe(force="Sync even if commands haven't changed since the last sync")
+    async def sync_commands(self, interaction: discord.Interaction, force: bool = False):
         """
         Manually sync slash commands to Discord.
+        Skips the Discord API call when the command tree is unchanged since the last sync.
 
         Args:
             interaction: Discord interaction
+            force: Sync even if the command tree is unchanged
         """
-        logger.info("command.admin.sync", admin_id=str(interaction.user.id))
+        self.log.info("command.admin.sync", admin_id=str(interaction.user.id), force=force)
 
         await interaction.response.defer(ephemeral=True, thinking=True)
 
         try:
+            signature = command_tree_signature(self.bot.tree)
+
+            if not force and signature == self._last_sync_signature:
+                self.log.info("commands.sync.skipped", count=self._last_sync_count)
+                await interaction.followup.send(
+                    f"✅ Commands already up to date ({self._last_sync_count} synced).",
+                    ephemeral=True,
+                )
+                return
+
             # Sync commands globally
             synced = await self.bot.tree.sync()
 
-            logger.info("commands.synced", count=len(synced))
+            self._last_sync_signature = signature
+            self._last_sync_count = len(synced)
+            self.log.info("commands.synced", count=len(synced))
 
             await interaction.followup.send(
                 f"✅ Successfully synced {len(synced)} commands globally.",
@@ -189,7 +256,7 @@ class AdminCommands(commands.Cog):
             )
 
         except Exception as e:
-            logger.error("commands.sync.failed", error=str(e))
+            self.log.error("commands.sync.failed", error=str(e))
             await interaction.followup.send(
                 f"❌ Failed to sync commands: {str(e)}",
                 ephemeral=True,
@@ -204,11 +271,12 @@ class AdminCommands(commands.Cog):
         Args:
             interaction: Discord interaction
         """
-        logger.info("command.admin.botstatus", admin_id=str(interaction.user.id))
+        now = discord.utils.utcnow()
+        self.log.info("command.admin.botstatus", admin_id=str(interaction.user.id))
 
         # Calculate bot statistics
         total_guilds = len(self.bot.guilds)
-        total_users = sum(guild.member_count for guild in self.bot.guilds)
+        total_users = get_total_users()
         latency_ms = round(self.bot.latency * 1000, 2)
 
         # Check API health
@@ -218,7 +286,7 @@ class AdminCommands(commands.Cog):
         embed = discord.Embed(
             title="🤖 Bot Status",
             color=discord.Color.green() if api_status == "healthy" else discord.Color.red(),
-            timestamp=discord.utils.utcnow(),
+            timestamp=now,
         )
 
         embed.add_field(
@@ -239,6 +307,10 @@ class AdminCommands(commands.Cog):
         embed.set_footer(text=f"Bot User: {self.bot.user}")
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
+        self.log.info(
+            "command.admin.botstatus.completed",
+            duration_ms=int((discord.utils.utcnow() - now).total_seconds() * 1000),
+        )
 
 
 async def setup(bot: commands.Bot, api_client: APIClient):
@@ -3,15 +3,41 @@ Compliance query commands for Discord bot
 User-facing commands for asking compliance questions
 """
 
+import asyncio
+
 import discord
 from discord import app_commands
 from discord.ext import commands
-import httpx
 
 from utils.logger import logger
 from utils.api_client import APIClient
+from utils.cache import LRUDict
+from utils.feedback_batcher import FeedbackBatcher
+from utils.formatting import truncate
+from utils.exceptions import PermanentAPIError
 from handlers.error import handle_api_error
 
+# Static formatting tables for response embeds
+_CONFIDENCE_COLORS = {
+    "high": discord.Color.green(),
+    "medium": discord.Color.orange(),
+    "low": discord.Color.red(),
+}
+_DEFAULT_CONFIDENCE_COLOR = discord.Color.red()
+
+_CONFIDENCE_EMOJI = {
+    "high": "✅",
+    "medium": "⚠️",
+    "low": "❌",
+}
+
+_RISK_EMOJI = {
+    "low": "🟢",
+    "medium": "🟡",
+    "high": "🔴",
+    "critical": "🚨",
+}
+
 
 class ComplianceCommands(commands.Cog):
     """
@@ -21,9 +47,15 @@ class ComplianceCommands(commands.Cog):
     def __init__(self, bot: commands.Bot, api_client: APIClient):
         self.bot = bot
         self.api = api_client
+        self.log = logger.bind(cog="compliance")
+        self.feedback_batcher = FeedbackBatcher(api_client)
+
+        # Track user sessions for context (bounded, least recently used evicted)
+        self.user_sessions = LRUDict(maxsize=10_000)
 
-        # Track user sessions for context
-        self.user_sessions = {}
+    async def cog_unload(self):
+        """Flush pending feedback when the cog is removed"""
+        await self.feedback_batcher.stop()
 
     @app_commands.command(name="ask", description="Ask a compliance question")
     @app_commands.describe(question="Your compliance question (minimum 10 characters)")
@@ -35,9 +67,10 @@ class ComplianceCommands(commands.Cog):
             interaction: Discord interaction
             question: User's compliance question
         """
+        now = discord.utils.utcnow()
         user_id = str(interaction.user.id)
 
-        logger.info(
+        self.log.info(
             "command.ask",
             user_id=user_id,
             question_length=len(question),
@@ -73,7 +106,7 @@ class ComplianceCommands(commands.Cog):
                 title="📋 Compliance Response",
                 description=result["answer"],
                 color=self._get_confidence_color(result["confidence"]),
-                timestamp=discord.utils.utcnow(),
+                timestamp=now,
             )
 
             embed.add_field(
@@ -96,10 +129,10 @@ class ComplianceCommands(commands.Cog):
 
             # Add sources if available
             if result.get("sources"):
-                sources_text = "\n".join([
+                sources_text = "\n".join(
                     f"• {src['document_title']} (chunk {src['chunk_index']})"
                     for src in result["sources"][:3]  # Limit to 3 sources
-                ])
+                )
                 embed.add_field(
                     name="📚 Sources",
                     value=sources_text,
@@ -109,9 +142,14 @@ class ComplianceCommands(commands.Cog):
             embed.set_footer(text=f"Query ID: {result['query_id']}")
 
             # Create feedback button view
-            view = FeedbackView(result["query_id"], self.api)
+            view = FeedbackView(result["query_id"], self.feedback_batcher)
 
             await interaction.followup.send(embed=embed, view=view)
+            self.log.info(
+                "command.ask.completed",
+                user_id=user_id,
+                duration_ms=int((discord.utils.utcnow() - now).total_seconds() * 1000),
+            )
 
         except Exception as e:
             await handle_api_error(interaction, e)
@@ -126,9 +164,10 @@ class ComplianceCommands(commands.Cog):
             interaction: Discord interaction
             limit: Number of queries to retrieve
         """
+        now = discord.utils.utcnow()
         user_id = str(interaction.user.id)
 
-        logger.info("command.history", user_id=user_id, limit=limit)
+        self.log.info("command.history", user_id=user_id, limit=limit)
 
         # Validate limit
         if limit < 1 or limit > 20:
@@ -155,11 +194,11 @@ class ComplianceCommands(commands.Cog):
                 title="📚 Your Query History",
                 description=f"Showing your last {len(history)} queries",
                 color=discord.Color.blue(),
-                timestamp=discord.utils.utcnow(),
+                timestamp=now,
             )
 
             for i, query in enumerate(history[:5], 1):  # Show max 5 in embed
-                query_text = query["query_text"][:100] + "..." if len(query["query_text"]) > 100 else query["query_text"]
+                query_text = truncate(query["query_text"], 100)
 
                 embed.add_field(
                     name=f"{i}. {query_text}",
@@ -169,37 +208,26 @@ class ComplianceCommands(commands.Cog):
                 )
 
             await interaction.followup.send(embed=embed, ephemeral=True)
+            self.log.info(
+                "command.history.completed",
+                user_id=user_id,
+                duration_ms=int((discord.utils.utcnow() - now).total_seconds() * 1000),
+            )
 
         except Exception as e:
             await handle_api_error(interaction, e)
 
     def _get_confidence_color(self, confidence: str) -> discord.Color:
         """Get embed color based on confidence level"""
-        if confidence == "high":
-            return discord.Color.green()
-        elif confidence == "medium":
-            return discord.Color.orange()
-        else:
-            return discord.Color.red()
+        return _CONFIDENCE_COLORS.get(confidence, _DEFAULT_CONFIDENCE_COLOR)
 
     def _format_confidence(self, level: str, score: float) -> str:
         """Format confidence with emoji"""
-        emoji_map = {
-            "high": "✅",
-            "medium": "⚠️",
-            "low": "❌",
-        }
-        return f"{emoji_map.get(level, '❓')} {level.upper()} ({score:.2f})"
+        return f"{_CONFIDENCE_EMOJI.get(level, '❓')} {level.upper()} ({score:.2f})"
 
     def _format_risk(self, risk: str) -> str:
         """Format risk level with emoji"""
-        emoji_map = {
-            "low": "🟢",
-            "medium": "🟡",
-            "high": "🔴",
-            "critical": "🚨",
-        }
-        return f"{emoji_map.get(risk, '❓')} {risk.upper()}"
+        return f"{_RISK_EMOJI.get(risk, '❓')} {risk.upper()}"
 
 
 class FeedbackView(discord.ui.View):
@@ -207,10 +235,10 @@ class FeedbackView(discord.ui.View):
     Interactive feedback buttons for query responses.
     """
 
-    def __init__(self, query_id: str, api_client: APIClient):
+    def __init__(self, query_id: str, feedback_batcher: FeedbackBatcher):
         super().__init__(timeout=300)  # 5 minute timeout
         self.query_id = query_id
-        self.api = api_client
+        self.feedback_batcher = feedback_batcher
 
     @discord.ui.button(label="👍 Helpful", style=discord.ButtonStyle.success)
     async def helpful_button(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -240,27 +268,31 @@ class FeedbackView(discord.ui.View):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            await self.api.submit_feedback(
-                query_id=self.query_id,
-                overall_rating=overall,
-                helpfulness_rating=helpfulness,
-                accuracy_rating=accuracy,
-                feedback_text=message,
-                escalated=escalated,
-            )
-
-            await interaction.followup.send(
-                f"✅ Thank you for your feedback! {message}",
-                ephemeral=True,
-            )
+            await self.feedback_batcher.enqueue({
+                "query_id": self.query_id,
+                "overall_rating": overall,
+                "helpfulness_rating": helpfulness,
+                "accuracy_rating": accuracy,
+                "feedback_text": message,
+                "follow_up_needed": False,
+                "escalated": escalated,
+            })
 
             # Disable buttons after feedback
             for item in self.children:
                 item.disabled = True
-            await interaction.message.edit(view=self)
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 409:
+            # Send confirmation and update the original message concurrently
+            await asyncio.gather(
+                interaction.followup.send(
+                    f"✅ Thank you for your feedback! {message}",
+                    ephemeral=True,
+                ),
+                interaction.edit_original_response(view=self),
+            )
+
+        except PermanentAPIError as e:
+            if e.status_code == 409:
                 await interaction.followup.send(
                     "ℹ️ You've already provided feedback for this query.",
                     ephemeral=True,
@@ -274,4 +306,6 @@ class FeedbackView(discord.ui.View):
 
 async def setup(bot: commands.Bot, api_client: APIClient):
     """Add compliance commands to bot"""
-    await bot.add_cog(ComplianceCommands(bot, api_client))
\ No newline at end of file
+    cog = ComplianceCommands(bot, api_client)
+    cog.feedback_batcher.start()
+    await bot.add_cog(cog)
\ No newline at end of file
@@ -7,6 +7,7 @@ from handlers.events import (
     on_guild_remove,
     on_command_completion,
     on_app_command_error,
+    get_total_users,
 )
 
 __all__ = [
@@ -17,4 +18,5 @@ __all__ = [
     "on_guild_remove",
     "on_command_completion",
     "on_app_command_error",
+    "get_total_users",
 ]
\ No newline at end of file
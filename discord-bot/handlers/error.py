@@ -5,9 +5,26 @@ Error handlers for Discord bot
 import discord
 from discord import app_commands
 from discord.ext import commands
-import httpx
 
 from utils.logger import logger
+from utils.circuit_breaker import CircuitOpenError
+from utils.exceptions import APIError
+
+# User-facing messages for API status codes (429 is handled separately)
+_STATUS_MESSAGES = {
+    400: "❌ Invalid request. Please check your input and try again.",
+    403: "🚫 You don't have permission to perform this action.",
+    404: "❓ Resource not found. Please check your input.",
+    409: "⚠️ This action has already been completed.",
+    503: "🔧 The compliance service is temporarily unavailable. Please try again in a few moments.",
+}
+
+
+def _responder(interaction: discord.Interaction):
+    """Pick followup.send if the interaction was already answered, else response.send_message"""
+    if interaction.response.is_done():
+        return interaction.followup.send
+    return interaction.response.send_message
 
 
 async def handle_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
@@ -26,11 +43,7 @@ async def handle_command_error(interaction: discord.Interaction, error: app_comm
         error_type=type(error).__name__,
     )
 
-    # Check if already responded
-    if interaction.response.is_done():
-        send_method = interaction.followup.send
-    else:
-        send_method = interaction.response.send_message
+    send_method = _responder(interaction)
 
     # Handle specific error types
     if isinstance(error, app_commands.CommandOnCooldown):
@@ -79,6 +92,8 @@ async def handle_api_error(interaction: discord.Interaction, error: Exception):
         interaction: Discord interaction
         error: HTTP or API error
     """
+    import httpx
+
     logger.error(
         "api.error",
         user_id=str(interaction.user.id),
@@ -86,36 +101,16 @@ async def handle_api_error(interaction: discord.Interaction, error: Exception):
         error_type=type(error).__name__,
     )
 
-    # Check if already responded
-    if interaction.response.is_done():
-        send_method = interaction.followup.send
-    else:
-        send_method = interaction.response.send_message
+    send_method = _responder(interaction)
+
+    # Classified client errors wrap the original httpx exception
+    if isinstance(error, APIError) and error.__cause__ is not None:
+        error = error.__cause__
 
     if isinstance(error, httpx.HTTPStatusError):
         status_code = error.response.status_code
 
-        if status_code == 400:
-            await send_method(
-                "❌ Invalid request. Please check your input and try again.",
-                ephemeral=True,
-            )
-        elif status_code == 403:
-            await send_method(
-                "🚫 You don't have permission to perform this action.",
-                ephemeral=True,
-            )
-        elif status_code == 404:
-            await send_method(
-                "❓ Resource not found. Please check your input.",
-                ephemeral=True,
-            )
-        elif status_code == 409:
-            await send_method(
-                "⚠️ This action has already been completed.",
-                ephemeral=True,
-            )
-        elif status_code == 429:
+        if status_code == 429:
             # Rate limit
             try:
                 data = error.response.json()
@@ -129,17 +124,19 @@ async def handle_api_error(interaction: discord.Interaction, error: Exception):
                     "⏳ Rate limit exceeded. Please try again later.",
                     ephemeral=True,
                 )
-        elif status_code == 503:
-            await send_method(
-                "🔧 The compliance service is temporarily unavailable. Please try again in a few moments.",
-                ephemeral=True,
-            )
         else:
+            message = _STATUS_MESSAGES.get(status_code)
             await send_method(
-                f"❌ API error (status {status_code}). Please try again later.",
+                message or f"❌ API error (status {status_code}). Please try again later.",
                 ephemeral=True,
             )
 
+    elif isinstance(error, CircuitOpenError):
+        await send_method(
+            _STATUS_MESSAGES[503],
+            ephemeral=True,
+        )
+
     elif isinstance(error, httpx.TimeoutException):
         await send_method(
             "⏱️ Request timed out. The query may be taking longer than expected. Please try again.",
@@ -2,11 +2,27 @@
 Event handlers for Discord bot lifecycle
 """
 
+import asyncio
+from typing import Dict, Set
+
 import discord
 from discord.ext import commands
 
 from utils.logger import logger
 
+# Aggregate member count across all guilds, maintained incrementally
+_total_users = 0
+
+# Bounded concurrency for error dispatch, ordered per channel
+_DISPATCH_SEM = asyncio.Semaphore(32)
+_channel_queues: Dict[int, asyncio.Queue] = {}
+_dispatch_tasks: Set[asyncio.Task] = set()
+
+
+def get_total_users() -> int:
+    """Get cached member count across all guilds"""
+    return _total_users
+
 
 async def on_ready(bot: commands.Bot):
     """
@@ -15,11 +31,14 @@ async def on_ready(bot: commands.Bot):
     Args:
         bot: Discord bot instance
     """
+    global _total_users
+    _total_users = sum(guild.member_count or 0 for guild in bot.guilds)
+
     logger.info(
         "bot.ready",
         bot_user=str(bot.user),
         guild_count=len(bot.guilds),
-        user_count=sum(guild.member_count for guild in bot.guilds),
+        user_count=_total_users,
     )
 
     # Set bot presence
@@ -41,6 +60,9 @@ async def on_guild_join(guild: discord.Guild):
     Args:
         guild: Guild that was joined
     """
+    global _total_users
+    _total_users += guild.member_count or 0
+
     logger.info(
         "bot.guild.joined",
         guild_id=str(guild.id),
@@ -56,6 +78,9 @@ async def on_guild_remove(guild: discord.Guild):
     Args:
         guild: Guild that was left
     """
+    global _total_users
+    _total_users = max(0, _total_users - (guild.member_count or 0))
+
     logger.info(
         "bot.guild.removed",
         guild_id=str(guild.id),
@@ -81,10 +106,59 @@ async def on_command_completion(interaction: discord.Interaction):
 async def on_app_command_error(interaction: discord.Interaction, error: discord.app_commands.AppCommandError):
     """
     Global error handler for application commands.
+    Queues the error on a per-channel worker so a slow response in one
+    channel never delays error handling in another.
 
     Args:
         interaction: Discord interaction
         error: Error that occurred
     """
+    channel_id = interaction.channel_id or 0
+
+    queue = _channel_queues.get(channel_id)
+    spawn_worker = queue is None
+    if spawn_worker:
+        queue = asyncio.Queue()
+        _channel_queues[channel_id] = queue
+
+    # Enqueue before spawning: under the eager task factory the worker runs
+    # immediately and would otherwise find the queue empty and exit
+    queue.put_nowait((interaction, error))
+
+    if spawn_worker:
+        task = asyncio.create_task(_drain_channel_errors(channel_id, queue))
+        _dispatch_tasks.add(task)
+        task.add_done_callback(_dispatch_tasks.discard)
+
+
+async def _drain_channel_errors(channel_id: int, queue: asyncio.Queue):
+    """
+    Handle queued errors for a single channel in order.
+
+    Runs until the queue is empty; errors queued while one is being
+    handled are picked up by the same worker.
+
+    Args:
+        channel_id: Channel the queue belongs to
+        queue: Queue of (interaction, error) pairs
+    """
     from handlers.error import handle_command_error
-    await handle_command_error(interaction, error)
\ No newline at end of file
+
+    try:
+        while True:
+            try:
+                interaction, error = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            async with _DISPATCH_SEM:
+                try:
+                    await handle_command_error(interaction, error)
+                except Exception as e:
+                    logger.error("command.error.dispatch_failed", channel_id=str(channel_id), error=str(e))
+    finally:
+        # Nothing awaits between the final empty check and here, so no error
+        # can be queued unseen. A non-empty queue means we were cancelled.
+        if not queue.empty():
+            logger.warning("command.error.dropped", channel_id=str(channel_id), count=queue.qsize())
+        if _channel_queues.get(channel_id) is queue:
+            del _channel_queues[channel_id]
\ No newline at end of file
@@ -6,13 +6,21 @@ Main entry point for Discord bot connecting to FastAPI backend
 import os
 import sys
 import asyncio
+from pathlib import Path
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 from utils.logger import logger
 from utils.api_client import APIClient
+from utils.retry import backoff_delay
+from utils.command_tree import command_tree_signature
 from handlers import events
 from commands import setup_compliance, setup_admin
 
@@ -24,6 +32,9 @@ DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
+# Signature of the last command tree synced from this checkout
+COMMAND_TREE_HASH_FILE = Path(os.getenv("COMMAND_TREE_HASH_FILE", ".command_tree.hash"))
+
 # Validate required configuration
 if not DISCORD_BOT_TOKEN:
     logger.error("startup.config.missing", variable="DISCORD_BOT_TOKEN")
@@ -65,12 +76,11 @@ class ComplianceBot(commands.Bot):
         """
         logger.info("bot.setup.started")
 
-        # Load compliance commands
-        await setup_compliance(self, self.api_client)
+        # Load compliance and admin commands concurrently
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(setup_compliance(self, self.api_client))
+            tg.create_task(setup_admin(self, self.api_client))
         logger.info("bot.cog.loaded", cog="compliance")
-
-        # Load admin commands
-        await setup_admin(self, self.api_client)
         logger.info("bot.cog.loaded", cog="admin")
 
         # Register event handlers
@@ -82,11 +92,17 @@ class ComplianceBot(commands.Bot):
         """Called when bot successfully connects to Discord"""
         await events.on_ready(self)
 
-        # Sync commands in development
+        # Sync commands in development, only when the tree changed since the last sync
         if ENVIRONMENT == "development":
+            signature = command_tree_signature(self.tree)
+            if COMMAND_TREE_HASH_FILE.exists() and COMMAND_TREE_HASH_FILE.read_bytes() == signature:
+                logger.info("bot.commands.sync.skipped")
+                return
+
             logger.info("bot.commands.syncing")
             try:
                 synced = await self.tree.sync()
+                COMMAND_TREE_HASH_FILE.write_bytes(signature)
                 logger.info("bot.commands.synced", count=len(synced))
             except Exception as e:
                 logger.error("bot.commands.sync.failed", error=str(e))
@@ -115,6 +131,10 @@ async def main():
     """
     Main entry point for Discord bot.
     """
+    # Run new tasks eagerly until their first await, saving a loop iteration
+    # for the many short-lived tasks spawned per gateway event (Python 3.12+)
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     logger.info(
         "bot.starting",
         environment=ENVIRONMENT,
@@ -127,7 +147,6 @@ async def main():
     # Check API health with retries before starting
     logger.info("bot.api.health_check")
     max_retries = 3
-    retry_delay = 5
 
     for attempt in range(max_retries):
         health = await bot.api_client.health_check()
@@ -137,12 +156,14 @@ async def main():
             break
 
         if attempt < max_retries - 1:
+            # Full-jitter backoff so restarting replicas don't retry in lockstep
+            retry_delay = backoff_delay(attempt, base=2.0, cap=30.0)
             logger.warning(
                 "bot.api.unhealthy.retrying",
                 attempt=attempt + 1,
                 max_retries=max_retries,
                 status=health.get("status"),
-                retry_in=retry_delay,
+                retry_in=round(retry_delay, 2),
             )
             await asyncio.sleep(retry_delay)
         else:
@@ -169,7 +190,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
     except KeyboardInterrupt:
         logger.info("bot.stopped")
     except Exception as e:
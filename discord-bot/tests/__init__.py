@@ -0,0 +1,3 @@
+"""
+Test suite for the Discord S&P Compliance Bot
+"""
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+Tests for in-process caching helpers
+"""
+
+import gc
+import weakref
+
+from utils.cache import LRUDict, async_ttl_cache
+
+
+class Service:
+    """Counts calls to its cached method"""
+
+    def __init__(self):
+        self.calls = 0
+
+    @async_ttl_cache(ttl=60.0, maxsize=2)
+    async def fetch(self, key: str) -> str:
+        self.calls += 1
+        return f"{key}-{self.calls}"
+
+
+async def test_caches_per_instance():
+    """Test results are cached per instance, not shared between instances"""
+    a, b = Service(), Service()
+
+    assert await a.fetch("x") == "x-1"
+    assert await a.fetch("x") == "x-1"
+    assert await b.fetch("x") == "x-1"
+    assert (a.calls, b.calls) == (1, 1)
+
+
+async def test_cache_is_bounded_per_instance():
+    """Test the least recently used entry is evicted beyond maxsize"""
+    service = Service()
+
+    await service.fetch("a")
+    await service.fetch("b")
+    await service.fetch("a")
+    await service.fetch("c")  # Evicts "b"
+    await service.fetch("a")
+    assert service.calls == 3
+
+    await service.fetch("b")
+    assert service.calls == 4
+
+
+async def test_cache_does_not_keep_instances_alive():
+    """Test a cached instance can still be garbage collected"""
+    service = Service()
+    await service.fetch("x")
+    ref = weakref.ref(service)
+
+    del service
+    gc.collect()
+
+    assert ref() is None
+
+
+async def test_cache_clear_one_instance():
+    """Test cache_clear(instance) only drops that instance's results"""
+    a, b = Service(), Service()
+    await a.fetch("x")
+    await b.fetch("x")
+
+    Service.fetch.cache_clear(a)
+    await a.fetch("x")
+    await b.fetch("x")
+
+    assert (a.calls, b.calls) == (2, 1)
+
+
+def test_lru_dict_evicts_least_recently_used():
+    """Test reads refresh recency and the oldest entry is evicted"""
+    cache = LRUDict(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
\ No newline at end of file
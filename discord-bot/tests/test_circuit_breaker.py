@@ -0,0 +1,83 @@
+"""
+Tests for the API circuit breaker
+"""
+
+import pytest
+
+from utils import circuit_breaker
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the breaker module"""
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_opens_after_consecutive_failures(clock):
+    """Test CLOSED -> OPEN once failure_threshold failures happen in a row"""
+    breaker = CircuitBreaker("test", failure_threshold=3, timeout_duration=30)
+
+    breaker.record_outcome(False)
+    breaker.record_outcome(False)
+    assert breaker.state == CLOSED
+    assert breaker.can_execute()
+
+    breaker.record_outcome(False)
+    assert breaker.state == OPEN
+    assert not breaker.can_execute()
+    assert breaker.retry_after() == pytest.approx(30)
+
+
+def test_success_resets_failure_count(clock):
+    """Test failures must be consecutive to open the breaker"""
+    breaker = CircuitBreaker("test", failure_threshold=2)
+
+    breaker.record_outcome(False)
+    breaker.record_outcome(True)
+    breaker.record_outcome(False)
+
+    assert breaker.state == CLOSED
+
+
+def test_half_opens_after_timeout(clock):
+    """Test OPEN -> HALF_OPEN once timeout_duration has passed"""
+    breaker = CircuitBreaker("test", failure_threshold=1, timeout_duration=30)
+    breaker.record_outcome(False)
+
+    clock[0] += 29
+    assert breaker.state == OPEN
+    assert breaker.retry_after() == pytest.approx(1)
+
+    clock[0] += 1
+    assert breaker.state == HALF_OPEN
+    assert breaker.can_execute()
+    assert breaker.retry_after() == 0.0
+
+
+def test_half_open_closes_after_successes(clock):
+    """Test HALF_OPEN -> CLOSED after success_threshold successful probes"""
+    breaker = CircuitBreaker("test", failure_threshold=1, timeout_duration=30, success_threshold=2)
+    breaker.record_outcome(False)
+    clock[0] += 30
+
+    breaker.record_outcome(True)
+    assert breaker.state == HALF_OPEN
+
+    breaker.record_outcome(True)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_reopens_on_failure(clock):
+    """Test any failure while HALF_OPEN reopens the breaker with a fresh timeout"""
+    breaker = CircuitBreaker("test", failure_threshold=5, timeout_duration=30)
+    for _ in range(5):
+        breaker.record_outcome(False)
+    clock[0] += 30
+    assert breaker.state == HALF_OPEN
+
+    breaker.record_outcome(False)
+    assert breaker.state == OPEN
+    assert breaker.retry_after() == pytest.approx(30)
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Tests for feedback batching
+"""
+
+import asyncio
+
+import pytest
+
+from utils.exceptions import APIError
+from utils.feedback_batcher import FeedbackBatcher
+
+
+class FakeAPIClient:
+    """Records bulk submissions; per-item results come from `reject`"""
+
+    def __init__(self, reject=None, fail=None):
+        self.batches = []
+        self.reject = reject or set()
+        self.fail = fail
+
+    async def submit_feedback_bulk(self, items):
+        self.batches.append(items)
+        if self.fail is not None:
+            raise self.fail
+        return [
+            APIError("Feedback already submitted", 409) if item["query_id"] in self.reject
+            else {"status": "success", "feedback_id": f"fb-{item['query_id']}"}
+            for item in items
+        ]
+
+
+@pytest.fixture
+async def make_batcher():
+    """Build started batchers and stop them after the test"""
+    batchers = []
+
+    def make(api, **kwargs):
+        batcher = FeedbackBatcher(api, **kwargs)
+        batcher.start()
+        batchers.append(batcher)
+        return batcher
+
+    yield make
+
+    for batcher in batchers:
+        await batcher.stop()
+
+
+async def test_flushes_when_batch_is_full(make_batcher):
+    """Test a full batch is sent without waiting for max_wait_ms"""
+    api = FakeAPIClient()
+    batcher = make_batcher(api, max_batch_size=3, max_wait_ms=60_000)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.enqueue({"query_id": str(i)}) for i in range(3))),
+        timeout=1,
+    )
+
+    assert [result["feedback_id"] for result in results] == ["fb-0", "fb-1", "fb-2"]
+    assert len(api.batches) == 1
+    assert len(api.batches[0]) == 3
+
+
+async def test_flushes_partial_batch_after_max_wait(make_batcher):
+    """Test a partial batch is sent once its oldest item has waited max_wait_ms"""
+    api = FakeAPIClient()
+    batcher = make_batcher(api, max_batch_size=50, max_wait_ms=20)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.enqueue({"query_id": str(i)}) for i in range(2))),
+        timeout=1,
+    )
+
+    assert len(results) == 2
+    assert api.batches == [[{"query_id": "0"}, {"query_id": "1"}]]
+
+
+async def test_splits_overflow_into_next_batch(make_batcher):
+    """Test items beyond max_batch_size go out in a following batch"""
+    api = FakeAPIClient()
+    batcher = make_batcher(api, max_batch_size=2, max_wait_ms=20)
+
+    await asyncio.wait_for(
+        asyncio.gather(*(batcher.enqueue({"query_id": str(i)}) for i in range(5))),
+        timeout=1,
+    )
+
+    assert [len(batch) for batch in api.batches] == [2, 2, 1]
+
+
+async def test_rejected_item_only_fails_its_caller(make_batcher):
+    """Test a per-item error is raised to that item's caller alone"""
+    api = FakeAPIClient(reject={"1"})
+    batcher = make_batcher(api, max_batch_size=2, max_wait_ms=60_000)
+
+    ok, rejected = await asyncio.wait_for(
+        asyncio.gather(
+            batcher.enqueue({"query_id": "0"}),
+            batcher.enqueue({"query_id": "1"}),
+            return_exceptions=True,
+        ),
+        timeout=1,
+    )
+
+    assert ok["feedback_id"] == "fb-0"
+    assert isinstance(rejected, APIError)
+    assert rejected.status_code == 409
+
+
+async def test_failed_request_fails_whole_batch(make_batcher):
+    """Test a failed bulk request is raised to every caller in the batch"""
+    api = FakeAPIClient(fail=APIError("Service unavailable", 503))
+    batcher = make_batcher(api, max_batch_size=2, max_wait_ms=60_000)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            batcher.enqueue({"query_id": "0"}),
+            batcher.enqueue({"query_id": "1"}),
+            return_exceptions=True,
+        ),
+        timeout=1,
+    )
+
+    assert all(isinstance(result, APIError) and result.status_code == 503 for result in results)
+
+
+async def test_stop_fails_queued_items():
+    """Test items still queued at stop() are failed rather than left waiting"""
+    batcher = FeedbackBatcher(FakeAPIClient())
+
+    pending = asyncio.ensure_future(batcher.enqueue({"query_id": "0"}))
+    await asyncio.sleep(0)
+    await batcher.stop()
+
+    with pytest.raises(RuntimeError):
+        await pending
\ No newline at end of file
@@ -2,5 +2,7 @@
 
 from utils.logger import logger
 from utils.api_client import APIClient
+from utils.feedback_batcher import FeedbackBatcher
+from utils.formatting import truncate
 
-__all__ = ["logger", "APIClient"]
\ No newline at end of file
+__all__ = ["logger", "APIClient", "FeedbackBatcher", "truncate"]
\ No newline at end of file
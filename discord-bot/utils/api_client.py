@@ -3,13 +3,135 @@ API client for communicating with FastAPI backend
 """
 
 import os
-from typing import Dict, Any, List, Optional
+import socket
+import asyncio
+import hashlib
+from typing import Dict, Any, List, Optional, Union
 
 import httpx
+import orjson
 from utils.logger import logger
+from utils.cache import async_ttl_cache
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.exceptions import APIError, RetryableAPIError, PermanentAPIError, PayloadTooLargeError
+from utils.transport import SizeLimitedTransport
+from utils.retry import execute_with_retry
 
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
-TIMEOUT = 30.0
+
+# Client-wide fallback: fail fast on connect/pool waits; reads allow for slow RAG generation
+TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+
+# Per-endpoint timeouts, set a little above each endpoint's p95
+TIMEOUTS = {
+    "health": httpx.Timeout(3.0),
+    "query": httpx.Timeout(25.0, connect=5.0),
+    "feedback": httpx.Timeout(5.0),
+    "history": httpx.Timeout(10.0, connect=5.0),
+    "admin": httpx.Timeout(8.0, connect=5.0),
+}
+
+# Connection pool shared by every cog through the single APIClient instance
+CONNECTION_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=30.0,
+)
+
+# Small JSON POSTs shouldn't wait on Nagle; keep idle pooled sockets alive
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Largest response body accepted from the API; bigger ones are aborted mid-stream
+MAX_RESPONSE_BYTES = 1 << 20
+
+# Endpoint groups, each with its own circuit breaker and cap on in-flight requests.
+# Slow RAG queries can't take every pooled connection away from feedback and admin.
+ROUTE_CONCURRENCY = {
+    "query": 32,
+    "feedback": 16,
+    "history": 8,
+    "admin": 4,
+}
+
+# Attempts per route. Queries aren't retried: they are not idempotent (each one
+# is logged and billed against the LLM) and a retry would outlast the user's wait.
+ROUTE_ATTEMPTS = {
+    "query": 1,
+    "feedback": 3,
+    "history": 3,
+    "admin": 3,
+}
+
+# Status codes worth retrying; every other error status is permanent
+RETRYABLE_STATUS_CODES = frozenset((408, 429, 500, 502, 503, 504))
+
+
+def classify_http_error(error: httpx.HTTPError) -> APIError:
+    """
+    Translate an httpx error into a retryable or permanent API error.
+
+    Args:
+        error: HTTP status or transport error from httpx
+
+    Returns:
+        RetryableAPIError for network failures and 408/429/5xx,
+        PermanentAPIError for any other error status
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        if status_code in RETRYABLE_STATUS_CODES:
+            api_error = RetryableAPIError(error.response.text, status_code)
+        else:
+            api_error = PermanentAPIError(error.response.text, status_code)
+    else:
+        api_error = RetryableAPIError(str(error) or type(error).__name__)
+
+    api_error.__cause__ = error
+    return api_error
+
+
+# Connection pools shared by every APIClient pointed at the same backend
+_shared_clients: Dict[str, httpx.AsyncClient] = {}
+_client_refcounts: Dict[str, int] = {}
+
+
+def _acquire_client(base_url: str) -> httpx.AsyncClient:
+    """Get the shared AsyncClient for base_url, creating it on first use"""
+    client = _shared_clients.get(base_url)
+    if client is None or client.is_closed:
+        transport = SizeLimitedTransport(
+            httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=CONNECTION_LIMITS,
+                retries=0,  # Retries are handled by execute_with_retry
+                socket_options=SOCKET_OPTIONS,
+            ),
+            max_bytes=MAX_RESPONSE_BYTES,
+        )
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=TIMEOUT,
+            transport=transport,
+            headers={"User-Agent": "DiscordComplianceBot/1.0"},
+        )
+        _shared_clients[base_url] = client
+        _client_refcounts[base_url] = 0
+
+    _client_refcounts[base_url] += 1
+    return client
+
+
+async def _release_client(base_url: str):
+    """Drop one reference to the shared client, closing it with the last one"""
+    _client_refcounts[base_url] -= 1
+    if _client_refcounts[base_url] > 0:
+        return
+
+    del _client_refcounts[base_url]
+    await _shared_clients.pop(base_url).aclose()
 
 
 class APIClient:
@@ -20,16 +142,84 @@ class APIClient:
 
     def __init__(self, base_url: str = API_BASE_URL):
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=TIMEOUT,
-            headers={"User-Agent": "DiscordComplianceBot/1.0"},
-        )
+        self.client = _acquire_client(self.base_url)
+        self._closed = False
+        self._breakers = {route: CircuitBreaker(route) for route in ROUTE_CONCURRENCY}
+        self._bulkheads = {
+            route: asyncio.Semaphore(limit) for route, limit in ROUTE_CONCURRENCY.items()
+        }
+
+        # Identical queries currently in flight, keyed by _query_key
+        self._inflight: Dict[bytes, asyncio.Task] = {}
 
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """Release the shared HTTP client; the pool closes with its last user"""
+        if self._closed:
+            return
+        self._closed = True
+        await _release_client(self.base_url)
+
+    async def _send(self, route: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request, retrying transient failures per the route's policy.
+
+        Raises:
+            CircuitOpenError: If the route's breaker is open
+            RetryableAPIError: If every attempt failed transiently
+            PermanentAPIError: On any other error status
+        """
+        # Encode JSON bodies with orjson rather than httpx's stdlib encoder
+        if "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**kwargs.get("headers", {}), "Content-Type": "application/json"}
+
+        return await execute_with_retry(
+            lambda: self._send_once(route, method, url, **kwargs),
+            name=f"{method} {url}",
+            max_attempts=ROUTE_ATTEMPTS[route],
+        )
+
+    async def _send_once(self, route: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a single request through the route's circuit breaker and bulkhead.
+
+        Only server-side faults (5xx, 408, transport errors) count as failures;
+        client errors like 404/409/429 mean the backend is up.
+
+        Raises:
+            CircuitOpenError: If the route's breaker is open
+            RetryableAPIError: On network errors or 408/429/5xx
+            PermanentAPIError: On any other error status
+            PayloadTooLargeError: If the response exceeds MAX_RESPONSE_BYTES
+        """
+        breaker = self._breakers[route]
+        if not breaker.can_execute():
+            raise CircuitOpenError(route, breaker.retry_after())
+
+        try:
+            async with self._bulkheads[route]:
+                response = await self.client.request(method, url, timeout=TIMEOUTS[route], **kwargs)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            breaker.record_outcome(status_code < 500 and status_code != 408)
+            raise classify_http_error(e) from e
+        except httpx.TransportError as e:
+            breaker.record_outcome(False)
+            raise classify_http_error(e) from e
+        except PayloadTooLargeError:
+            breaker.record_outcome(False)
+            raise
+
+        breaker.record_outcome(True)
+        return response
 
+    def _invalidate_admin_cache(self):
+        """Drop cached admin views after a write that changes them"""
+        APIClient.get_admin_stats.cache_clear(self)
+        APIClient.get_flagged_queries.cache_clear(self)
+
+    @async_ttl_cache(ttl=5.0, cache_if=lambda health: health.get("status") == "healthy")
     async def health_check(self) -> Dict[str, Any]:
         """
         Check API health status.
@@ -38,38 +228,69 @@ class APIClient:
             Health status dictionary
         """
         try:
-            response = await self.client.get("/health")
+            response = await self.client.get("/health", timeout=TIMEOUTS["health"])
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error("api.health_check.failed", error=str(e))
             return {"status": "unhealthy", "error": str(e)}
 
+    @staticmethod
+    def _query_key(query: str, session_id: Optional[str], user_id: Optional[str]) -> bytes:
+        """Hash a whitespace/case-normalized query with its session (and user, unless shared)"""
+        normalized = " ".join(query.lower().split())
+        raw = "\x1f".join((normalized, session_id or "", user_id or ""))
+        return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
     async def submit_query(
         self,
         query: str,
         user_id: str,
         session_id: Optional[str] = None,
+        share_across_users: bool = False,
     ) -> Dict[str, Any]:
         """
         Submit compliance query to API.
+        Concurrent identical queries share a single backend call.
 
         Args:
             query: User's compliance question
             user_id: Discord user ID
             session_id: Optional session ID for context
+            share_across_users: Also coalesce with other users' identical queries.
+                The shared response (and its query_id) is logged against
+                whichever user's call reached the API first.
 
         Returns:
             Query response with answer, confidence, risk, sources
 
         Raises:
-            httpx.HTTPStatusError: If API returns error status
+            CircuitOpenError: If the query circuit is open
+            RetryableAPIError: On network errors or 408/429/5xx
+            PermanentAPIError: If the API rejects the query
         """
-        payload = {
-            "query": query,
-            "user_id": user_id,
-            "session_id": session_id,
-        }
+        key = self._query_key(query, session_id, None if share_across_users else user_id)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            logger.info("api.query.coalesced", user_id=user_id)
+        else:
+            payload = {
+                "query": query,
+                "user_id": user_id,
+                "session_id": session_id,
+            }
+            task = asyncio.create_task(self._post_query(payload))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one caller being cancelled doesn't cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _post_query(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a query payload to the API and log the outcome"""
+        query = payload["query"]
+        user_id = payload["user_id"]
 
         logger.info(
             "api.query.submit",
@@ -78,9 +299,8 @@ class APIClient:
         )
 
         try:
-            response = await self.client.post("/api/v1/query", json=payload)
-            response.raise_for_status()
-            data = response.json()
+            response = await self._send("query", "POST", "/api/v1/query", json=payload)
+            data = orjson.loads(response.content)
 
             logger.info(
                 "api.query.success",
@@ -90,11 +310,11 @@ class APIClient:
 
             return data
 
-        except httpx.HTTPStatusError as e:
+        except APIError as e:
             logger.error(
                 "api.query.http_error",
-                status_code=e.response.status_code,
-                error=e.response.text,
+                status_code=e.status_code,
+                error=str(e),
             )
             raise
 
@@ -140,15 +360,15 @@ class APIClient:
         logger.info("api.feedback.submit", query_id=query_id, overall_rating=overall_rating)
 
         try:
-            response = await self.client.post("/api/v1/feedback", json=payload)
-            response.raise_for_status()
-            return response.json()
+            response = await self._send("feedback", "POST", "/api/v1/feedback", json=payload)
+            self._invalidate_admin_cache()
+            return orjson.loads(response.content)
 
-        except httpx.HTTPStatusError as e:
+        except APIError as e:
             logger.error(
                 "api.feedback.http_error",
-                status_code=e.response.status_code,
-                error=e.response.text,
+                status_code=e.status_code,
+                error=str(e),
             )
             raise
 
@@ -156,6 +376,63 @@ class APIClient:
             logger.error("api.feedback.failed", error=str(e))
             raise
 
+    async def submit_feedback_bulk(
+        self,
+        items: List[Dict[str, Any]],
+    ) -> List[Union[Dict[str, Any], APIError]]:
+        """
+        Submit several feedback payloads in a single request.
+
+        Args:
+            items: Feedback payloads (same fields as submit_feedback)
+
+        Returns:
+            Per-item results in request order. Successful items are the
+            confirmation dict; rejected items are an APIError carrying
+            the item's own status code, so callers can handle them exactly
+            like a single submit_feedback failure.
+
+        Raises:
+            APIError: If the batch request itself fails
+        """
+        logger.info("api.feedback.bulk_submit", num_items=len(items))
+
+        try:
+            response = await self._send("feedback", "POST", "/api/v1/feedback/bulk", json={"items": items})
+            results = orjson.loads(response.content)["results"]
+            self._invalidate_admin_cache()
+
+        except APIError as e:
+            logger.error(
+                "api.feedback.bulk_http_error",
+                status_code=e.status_code,
+                error=str(e),
+            )
+            raise
+
+        except Exception as e:
+            logger.error("api.feedback.bulk_failed", error=str(e))
+            raise
+
+        outcomes = []
+        for result in results:
+            if result.get("status") == "success":
+                outcomes.append(result)
+                continue
+
+            item_response = httpx.Response(
+                status_code=result.get("status_code", 500),
+                json={"detail": result.get("detail")},
+                request=response.request,
+            )
+            outcomes.append(classify_http_error(httpx.HTTPStatusError(
+                f"Feedback rejected: {result.get('detail')}",
+                request=response.request,
+                response=item_response,
+            )))
+
+        return outcomes
+
     async def get_query_history(
         self,
         user_id: str,
@@ -174,18 +451,19 @@ class APIClient:
         logger.info("api.history.get", user_id=user_id, limit=limit)
 
         try:
-            response = await self.client.get(
+            response = await self._send(
+                "history",
+                "GET",
                 f"/api/v1/history/{user_id}",
                 params={"limit": limit},
             )
-            response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
-        except httpx.HTTPStatusError as e:
+        except APIError as e:
             logger.error(
                 "api.history.http_error",
-                status_code=e.response.status_code,
-                error=e.response.text,
+                status_code=e.status_code,
+                error=str(e),
             )
             raise
 
@@ -193,6 +471,7 @@ class APIClient:
             logger.error("api.history.failed", error=str(e))
             raise
 
+    @async_ttl_cache(ttl=30.0)
     async def get_admin_stats(self, admin_token: str) -> Dict[str, Any]:
         """
         Get system statistics (admin only).
@@ -204,17 +483,19 @@ class APIClient:
             System statistics
         """
         try:
-            response = await self.client.get(
+            response = await self._send(
+                "admin",
+                "GET",
                 "/admin/stats",
                 headers={"X-Admin-Token": admin_token},
             )
-            response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
         except Exception as e:
             logger.error("api.admin.stats.failed", error=str(e))
             raise
 
+    @async_ttl_cache(ttl=30.0)
     async def get_flagged_queries(
         self,
         admin_token: str,
@@ -231,13 +512,14 @@ class APIClient:
             List of flagged queries
         """
         try:
-            response = await self.client.get(
+            response = await self._send(
+                "admin",
+                "GET",
                 "/admin/queries/flagged",
                 headers={"X-Admin-Token": admin_token},
                 params={"limit": limit},
             )
-            response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
         except Exception as e:
             logger.error("api.admin.flagged.failed", error=str(e))
@@ -0,0 +1,88 @@
+"""
+Lightweight in-process caching helpers for the API client
+"""
+
+import functools
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+
+def async_ttl_cache(
+    ttl: float,
+    cache_if: Optional[Callable[[Any], bool]] = None,
+    maxsize: int = 128,
+):
+    """
+    Cache an async method's result per instance and argument set for `ttl` seconds.
+
+    Each instance gets its own LRU-bounded cache, held weakly so caching
+    never keeps an instance alive. Exceptions are never cached. The wrapped
+    method gains a `cache_clear(instance=None)` method for explicit
+    invalidation of one instance's cache, or of all of them.
+
+    Args:
+        ttl: Time-to-live in seconds
+        cache_if: Optional predicate; results for which it returns False are not cached
+        maxsize: Entries kept per instance before the least recently used is evicted
+    """
+    def decorator(func):
+        caches: "weakref.WeakKeyDictionary[Any, LRUDict]" = weakref.WeakKeyDictionary()
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = caches.get(self)
+            if cache is None:
+                cache = caches[self] = LRUDict(maxsize)
+
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            value = await func(self, *args, **kwargs)
+            if cache_if is None or cache_if(value):
+                cache[key] = (now + ttl, value)
+            return value
+
+        def cache_clear(instance: Any = None):
+            """Drop cached results for `instance`, or for every instance if None"""
+            if instance is None:
+                caches.clear()
+            else:
+                caches.pop(instance, None)
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+class LRUDict(OrderedDict):
+    """
+    Dict bounded to `maxsize` entries, evicting the least recently used.
+    Reads via [] or get() count as use.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Circuit breaker for calls to the FastAPI backend
+Fails fast while the backend is down instead of waiting on timeouts
+"""
+
+import time
+
+from utils.logger import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is short-circuited because its breaker is open"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Circuit '{name}' is open; retry in {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    CLOSED -> OPEN after `failure_threshold` consecutive failures.
+    OPEN -> HALF_OPEN once `timeout_duration` seconds have passed.
+    HALF_OPEN -> CLOSED after `success_threshold` successes, or back to OPEN on any failure.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        timeout_duration: float = 30.0,
+        success_threshold: int = 2,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.timeout_duration = timeout_duration
+        self.success_threshold = success_threshold
+
+        self._state = CLOSED
+        self._failures = 0
+        self._successes = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Current state, promoting OPEN to HALF_OPEN once the timeout has elapsed"""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.timeout_duration:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def can_execute(self) -> bool:
+        """Whether a call may go through right now"""
+        return self.state != OPEN
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through"""
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self.timeout_duration - (time.monotonic() - self._opened_at))
+
+    def record_outcome(self, success: bool):
+        """
+        Record the result of a call.
+
+        Args:
+            success: Whether the call succeeded
+        """
+        state = self.state
+
+        if success:
+            self._failures = 0
+            if state == HALF_OPEN:
+                self._successes += 1
+                if self._successes >= self.success_threshold:
+                    self._transition(CLOSED)
+            return
+
+        if state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._transition(OPEN)
+
+    def _transition(self, new_state: str):
+        """Move to a new state and reset counters"""
+        old_state = self._state
+        self._state = new_state
+        self._failures = 0
+        self._successes = 0
+        if new_state == OPEN:
+            self._opened_at = time.monotonic()
+
+        log = logger.warning if new_state == OPEN else logger.info
+        log("api.circuit.transition", circuit=self.name, from_state=old_state, to_state=new_state)
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Slash command tree helpers
+"""
+
+import hashlib
+
+import orjson
+from discord import app_commands
+
+
+def command_tree_signature(tree: app_commands.CommandTree) -> bytes:
+    """
+    Hash the global command tree (names, descriptions, options).
+
+    Args:
+        tree: Bot command tree
+
+    Returns:
+        Digest that changes whenever the synced payload would change
+    """
+    payload = [command.to_dict(tree) for command in tree.get_commands()]
+    return hashlib.blake2b(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).digest()
\ No newline at end of file
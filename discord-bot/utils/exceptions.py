@@ -0,0 +1,29 @@
+"""
+Exceptions raised by APIClient
+Classifies backend failures so retries only apply to transient errors
+"""
+
+from typing import Optional
+
+
+class APIError(Exception):
+    """
+    Base class for failed calls to the FastAPI backend.
+    The underlying httpx error is chained as __cause__.
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RetryableAPIError(APIError):
+    """Transient failure (network error, timeout, 408/429/5xx); safe to retry"""
+
+
+class PermanentAPIError(APIError):
+    """Request rejected by the API (auth or other 4xx); retrying won't help"""
+
+
+class PayloadTooLargeError(PermanentAPIError):
+    """API response body exceeded the client's size limit"""
\ No newline at end of file
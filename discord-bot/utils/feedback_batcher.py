@@ -0,0 +1,114 @@
+"""
+Async batching for feedback submissions
+Coalesces button-click feedback into bulk API calls
+"""
+
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
+
+from utils.logger import logger
+from utils.api_client import APIClient
+
+
+class FeedbackBatcher:
+    """
+    Queue feedback payloads and flush them to the API in batches.
+    A batch is sent when it reaches max_batch_size or when the oldest
+    queued item has waited max_wait_ms, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        api_client: APIClient,
+        max_batch_size: int = 50,
+        max_wait_ms: int = 50,
+    ):
+        self.api = api_client
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background flush loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                "feedback_batcher.started",
+                max_batch_size=self.max_batch_size,
+                max_wait_ms=int(self.max_wait * 1000),
+            )
+
+    async def stop(self):
+        """Stop the flush loop and fail anything still queued"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Feedback batcher stopped"))
+
+        logger.info("feedback_batcher.stopped")
+
+    async def enqueue(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a feedback payload and wait for its result.
+
+        Args:
+            payload: Feedback payload (same fields as APIClient.submit_feedback)
+
+        Returns:
+            Feedback submission confirmation
+
+        Raises:
+            APIError: If the API rejects this item
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((payload, future))
+        return await future
+
+    async def _run(self):
+        """Collect batches and flush them until cancelled"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Send one batch and resolve each caller's future"""
+        try:
+            results = await self.api.submit_feedback_bulk([payload for payload, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+        logger.debug("feedback_batcher.flushed", batch_size=len(batch))
\ No newline at end of file
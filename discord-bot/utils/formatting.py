@@ -0,0 +1,17 @@
+"""
+Text formatting helpers for Discord embeds
+"""
+
+
+def truncate(text: str, limit: int) -> str:
+    """
+    Truncate text to `limit` characters, appending an ellipsis if cut.
+
+    Args:
+        text: Text to truncate
+        limit: Maximum characters to keep before the ellipsis
+
+    Returns:
+        Original text, or its first `limit` characters followed by "..."
+    """
+    return f"{text[:limit]}..." if len(text) > limit else text
\ No newline at end of file
@@ -3,15 +3,31 @@ Structured logging configuration for Discord bot
 """
 
 import os
+import logging
+
+import orjson
 import structlog
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOGGER_NAME = "compliance_bot"
+
+_CONFIGURED = False
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """Serialize with orjson, decoded to str for the stdlib logger factory"""
+    return orjson.dumps(obj, **kwargs).decode()
 
 
 def setup_logging():
     """
     Configure structlog for Discord bot with JSON output.
+    Safe to call repeatedly; structlog is only configured once.
     """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return structlog.get_logger(LOGGER_NAME)
+
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
@@ -19,14 +35,19 @@ def setup_logging():
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
+        # Drop below-level calls before any event dict is built
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(LOG_LEVEL.upper())
+        ),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
-    return structlog.get_logger()
+    _CONFIGURED = True
+    return structlog.get_logger(LOGGER_NAME)
 
 
 logger = setup_logging()
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Retry helpers for calls to the FastAPI backend
+"""
+
+import asyncio
+import random
+from typing import Awaitable, Callable, TypeVar
+
+from utils.logger import logger
+from utils.exceptions import RetryableAPIError
+
+T = TypeVar("T")
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    Args:
+        attempt: Zero-based attempt number
+        base: Delay scale in seconds for the first attempt
+        cap: Maximum delay in seconds
+
+    Returns:
+        Random delay in [0, min(cap, base * 2**attempt)]
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+async def backoff(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """
+    Sleep for a full-jitter backoff delay.
+
+    Args:
+        attempt: Zero-based attempt number
+        base: Delay scale in seconds for the first attempt
+        cap: Maximum delay in seconds
+
+    Returns:
+        The delay that was slept
+    """
+    delay = backoff_delay(attempt, base, cap)
+    await asyncio.sleep(delay)
+    return delay
+
+
+async def execute_with_retry(
+    operation: Callable[[], Awaitable[T]],
+    name: str,
+    max_attempts: int = 3,
+    base: float = 0.5,
+    cap: float = 5.0,
+) -> T:
+    """
+    Run an API call, retrying transient failures with full-jitter backoff.
+
+    Only RetryableAPIError is retried; permanent errors and open circuits
+    propagate immediately.
+
+    Args:
+        operation: Factory returning a fresh awaitable for each attempt
+        name: Operation name for logs
+        max_attempts: Total attempts, including the first
+        base: Delay scale in seconds for the first retry
+        cap: Maximum delay in seconds
+
+    Returns:
+        The operation's result
+
+    Raises:
+        RetryableAPIError: If the last attempt still fails transiently
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await operation()
+        except RetryableAPIError as e:
+            if attempt == max_attempts - 1:
+                raise
+
+            delay = backoff_delay(attempt, base, cap)
+            logger.warning(
+                "api.retrying",
+                operation=name,
+                attempt=attempt + 1,
+                max_attempts=max_attempts,
+                status_code=e.status_code,
+                retry_in=round(delay, 2),
+            )
+            await asyncio.sleep(delay)
\ No newline at end of file
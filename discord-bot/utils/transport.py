@@ -0,0 +1,58 @@
+"""
+httpx transport that caps response body size
+Aborts oversized responses while they stream in, before they are buffered
+"""
+
+from typing import AsyncIterator
+
+import httpx
+
+from utils.exceptions import PayloadTooLargeError
+
+
+class _SizeLimitedStream(httpx.AsyncByteStream):
+    """Response stream that raises once more than max_bytes have been received"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, max_bytes: int):
+        self._stream = stream
+        self._max_bytes = max_bytes
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        received = 0
+        async for chunk in self._stream:
+            received += len(chunk)
+            if received > self._max_bytes:
+                raise PayloadTooLargeError(f"Response body exceeded {self._max_bytes} bytes")
+            yield chunk
+
+    async def aclose(self):
+        await self._stream.aclose()
+
+
+class SizeLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps another transport and rejects responses larger than max_bytes.
+    Checks Content-Length up front and counts wire bytes for chunked bodies.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_bytes: int):
+        self._transport = transport
+        self.max_bytes = max_bytes
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and int(content_length) > self.max_bytes:
+            await response.aclose()
+            raise PayloadTooLargeError(f"Response body of {content_length} bytes exceeds {self.max_bytes}")
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_SizeLimitedStream(response.stream, self.max_bytes),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self):
+        await self._transport.aclose()
\ No newline at end of file
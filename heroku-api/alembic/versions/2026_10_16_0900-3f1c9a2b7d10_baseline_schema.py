@@ -0,0 +1,185 @@
+"""baseline schema
+
+Tables as first created by init_db's create_all. Databases bootstrapped that
+way already have them, so each table is only created when missing; later
+revisions then bring both kinds of database to the same schema.
+
+Revision ID: 3f1c9a2b7d10
+Revises:
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c9a2b7d10"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("discord_id", sa.String(20), nullable=False),
+            sa.Column("discord_username", sa.String(100), nullable=False),
+            sa.Column("discord_discriminator", sa.String(10), nullable=False),
+            sa.Column("discord_avatar", sa.String(200), nullable=True),
+            sa.Column("role", sa.String(50), nullable=False),
+            sa.Column("permissions", sa.JSON(), nullable=False),
+            sa.Column("department", sa.String(100), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=False),
+            sa.Column("is_banned", sa.Boolean(), nullable=False),
+            sa.Column("ban_reason", sa.Text(), nullable=True),
+            sa.Column("total_queries", sa.Integer(), nullable=False),
+            sa.Column("queries_today", sa.Integer(), nullable=False),
+            sa.Column("last_query_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("rate_limit_tier", sa.String(20), nullable=False),
+            sa.Column("daily_query_limit", sa.Integer(), nullable=False),
+            sa.Column("guild_id", sa.String(20), nullable=True),
+            sa.Column("guild_name", sa.String(200), nullable=True),
+            sa.Column("language", sa.String(10), nullable=False),
+            sa.Column("timezone", sa.String(50), nullable=False),
+            sa.Column("notification_preferences", sa.JSON(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("last_login_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index("ix_users_discord_id", "users", ["discord_id"], unique=True)
+        op.create_index("ix_users_guild_id", "users", ["guild_id"])
+        op.create_index("idx_user_discord_id", "users", ["discord_id"])
+        op.create_index("idx_user_guild_id", "users", ["guild_id"])
+        op.create_index("idx_user_role", "users", ["role"])
+        op.create_index("idx_user_active_last_query", "users", ["is_active", "last_query_at"])
+        op.create_index("idx_user_banned_created", "users", ["is_banned", "created_at"])
+
+    if "query_logs" not in existing:
+        op.create_table(
+            "query_logs",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("query_text", sa.Text(), nullable=False),
+            sa.Column("query_hash", sa.String(64), nullable=False),
+            sa.Column("response_text", sa.Text(), nullable=False),
+            sa.Column("confidence_score", sa.Float(), nullable=False),
+            sa.Column("risk_level", sa.String(20), nullable=False),
+            sa.Column("model_used", sa.String(50), nullable=False),
+            sa.Column("response_time_ms", sa.Integer(), nullable=False),
+            sa.Column("tokens_used", sa.Integer(), nullable=False),
+            sa.Column("rag_chunks_used", sa.Integer(), nullable=False),
+            sa.Column("rag_sources", sa.JSON(), nullable=False),
+            sa.Column("session_id", sa.String(100), nullable=True),
+            sa.Column("context_messages", sa.JSON(), nullable=False),
+            sa.Column("is_flagged", sa.Boolean(), nullable=False),
+            sa.Column("flag_reason", sa.Text(), nullable=True),
+            sa.Column("reviewed_by", postgresql.UUID(as_uuid=True), nullable=True),
+            sa.Column("reviewed_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        )
+        op.create_index("ix_query_logs_user_id", "query_logs", ["user_id"])
+        op.create_index("ix_query_logs_query_hash", "query_logs", ["query_hash"])
+        op.create_index("ix_query_logs_session_id", "query_logs", ["session_id"])
+        op.create_index("ix_query_logs_created_at", "query_logs", ["created_at"])
+        op.create_index("idx_query_user_id", "query_logs", ["user_id"])
+        op.create_index("idx_query_hash", "query_logs", ["query_hash"])
+        op.create_index("idx_query_created_at", "query_logs", ["created_at"])
+        op.create_index("idx_query_session_id", "query_logs", ["session_id"])
+        op.create_index("idx_query_flagged", "query_logs", ["is_flagged"])
+        op.create_index("idx_query_user_created", "query_logs", ["user_id", "created_at"])
+        op.create_index("idx_query_flagged_confidence", "query_logs", ["is_flagged", "confidence_score"])
+
+    if "query_feedbacks" not in existing:
+        op.create_table(
+            "query_feedbacks",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("query_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("query_logs.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("overall_rating", sa.Integer(), nullable=False),
+            sa.Column("helpfulness_rating", sa.Integer(), nullable=False),
+            sa.Column("accuracy_rating", sa.Integer(), nullable=False),
+            sa.Column("feedback_text", sa.Text(), nullable=True),
+            sa.Column("follow_up_needed", sa.Boolean(), nullable=False),
+            sa.Column("follow_up_notes", sa.Text(), nullable=True),
+            sa.Column("escalated", sa.Boolean(), nullable=False),
+            sa.Column("escalation_reason", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        )
+        op.create_index("ix_query_feedbacks_user_id", "query_feedbacks", ["user_id"])
+        op.create_index("ix_query_feedbacks_query_id", "query_feedbacks", ["query_id"], unique=True)
+        op.create_index("idx_feedback_user_id", "query_feedbacks", ["user_id"])
+        op.create_index("idx_feedback_query_id", "query_feedbacks", ["query_id"])
+
+    if "compliance_documents" not in existing:
+        op.create_table(
+            "compliance_documents",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("title", sa.String(500), nullable=False),
+            sa.Column("document_id", sa.String(100), nullable=False),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.Column("content", sa.Text(), nullable=False),
+            sa.Column("summary", sa.Text(), nullable=True),
+            sa.Column("document_type", sa.String(50), nullable=False),
+            sa.Column("category", sa.String(100), nullable=False),
+            sa.Column("subcategory", sa.String(100), nullable=True),
+            sa.Column("keywords", sa.JSON(), nullable=False),
+            sa.Column("department", sa.String(100), nullable=True),
+            sa.Column("access_level", sa.String(50), nullable=False),
+            sa.Column("effective_date", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("expiration_date", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=False),
+            sa.Column("source_url", sa.String(1000), nullable=True),
+            sa.Column("source_hash", sa.String(64), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        )
+        op.create_index("ix_compliance_documents_document_id", "compliance_documents", ["document_id"], unique=True)
+        op.create_index("idx_document_id", "compliance_documents", ["document_id"])
+        op.create_index("idx_document_type", "compliance_documents", ["document_type"])
+        op.create_index("idx_document_category", "compliance_documents", ["category"])
+        op.create_index("idx_document_active", "compliance_documents", ["is_active"])
+
+    if "system_audit_logs" not in existing:
+        op.create_table(
+            "system_audit_logs",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("event_type", sa.String(100), nullable=False),
+            sa.Column("event_category", sa.String(50), nullable=False),
+            sa.Column("severity", sa.String(20), nullable=False),
+            sa.Column("actor_id", postgresql.UUID(as_uuid=True), nullable=True),
+            sa.Column("actor_type", sa.String(50), nullable=False),
+            sa.Column("target_type", sa.String(50), nullable=True),
+            sa.Column("target_id", postgresql.UUID(as_uuid=True), nullable=True),
+            sa.Column("description", sa.Text(), nullable=False),
+            sa.Column("metadata", sa.JSON(), nullable=False),
+            sa.Column("ip_address", sa.String(45), nullable=True),
+            sa.Column("user_agent", sa.String(500), nullable=True),
+            sa.Column("request_id", sa.String(100), nullable=True),
+            sa.Column("retention_days", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        )
+        op.create_index("ix_system_audit_logs_event_type", "system_audit_logs", ["event_type"])
+        op.create_index("ix_system_audit_logs_request_id", "system_audit_logs", ["request_id"])
+        op.create_index("ix_system_audit_logs_created_at", "system_audit_logs", ["created_at"])
+        op.create_index("idx_audit_event_type", "system_audit_logs", ["event_type"])
+        op.create_index("idx_audit_category", "system_audit_logs", ["event_category"])
+        op.create_index("idx_audit_severity", "system_audit_logs", ["severity"])
+        op.create_index("idx_audit_actor_id", "system_audit_logs", ["actor_id"])
+        op.create_index("idx_audit_created_at", "system_audit_logs", ["created_at"])
+        op.create_index("idx_audit_request_id", "system_audit_logs", ["request_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("system_audit_logs")
+    op.drop_table("compliance_documents")
+    op.drop_table("query_feedbacks")
+    op.drop_table("query_logs")
+    op.drop_table("users")
\ No newline at end of file
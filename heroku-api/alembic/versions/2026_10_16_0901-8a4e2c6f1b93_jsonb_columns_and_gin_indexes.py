@@ -0,0 +1,44 @@
+"""jsonb columns and gin indexes
+
+Revision ID: 8a4e2c6f1b93
+Revises: 3f1c9a2b7d10
+Create Date: 2026-10-16 09:01:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4e2c6f1b93"
+down_revision: Union[str, None] = "3f1c9a2b7d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, GIN index) for each JSON column queried by containment
+JSONB_COLUMNS = [
+    ("users", "permissions", "idx_user_permissions_gin"),
+    ("query_logs", "rag_sources", "idx_query_rag_sources_gin"),
+    ("compliance_documents", "keywords", "idx_document_keywords_gin"),
+    ("system_audit_logs", "metadata", "idx_audit_metadata_gin"),
+]
+
+
+def upgrade() -> None:
+    for table, column, index in JSONB_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN "{column}" TYPE jsonb USING "{column}"::jsonb')
+        op.create_index(
+            index,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    for table, column, index in JSONB_COLUMNS:
+        op.drop_index(index, table_name=table, if_exists=True)
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN "{column}" TYPE json USING "{column}"::json')
\ No newline at end of file
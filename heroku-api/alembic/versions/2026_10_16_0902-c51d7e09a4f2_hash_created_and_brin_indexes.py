@@ -0,0 +1,62 @@
+"""hash/created_at btree and brin created_at indexes
+
+Revision ID: c51d7e09a4f2
+Revises: 8a4e2c6f1b93
+Create Date: 2026-10-16 09:02:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c51d7e09a4f2"
+down_revision: Union[str, None] = "8a4e2c6f1b93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Plain created_at btrees are replaced by BRIN on both append-only logs
+    for index, table in (
+        ("ix_query_logs_created_at", "query_logs"),
+        ("idx_query_created_at", "query_logs"),
+        ("ix_system_audit_logs_created_at", "system_audit_logs"),
+        ("idx_audit_created_at", "system_audit_logs"),
+    ):
+        op.drop_index(index, table_name=table, if_exists=True)
+
+    op.create_index(
+        "idx_query_hash_created",
+        "query_logs",
+        ["query_hash", sa.text("created_at DESC")],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_query_created_brin",
+        "query_logs",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_audit_created_brin",
+        "system_audit_logs",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_audit_created_brin", table_name="system_audit_logs", if_exists=True)
+    op.drop_index("idx_query_created_brin", table_name="query_logs", if_exists=True)
+    op.drop_index("idx_query_hash_created", table_name="query_logs", if_exists=True)
+    op.create_index("idx_audit_created_at", "system_audit_logs", ["created_at"])
+    op.create_index("ix_system_audit_logs_created_at", "system_audit_logs", ["created_at"])
+    op.create_index("idx_query_created_at", "query_logs", ["created_at"])
+    op.create_index("ix_query_logs_created_at", "query_logs", ["created_at"])
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""partial user and flagged-query indexes
+
+Revision ID: 6e2b8f4a0c37
+Revises: c51d7e09a4f2
+Create Date: 2026-10-16 09:03:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6e2b8f4a0c37"
+down_revision: Union[str, None] = "c51d7e09a4f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_user_role", table_name="users", if_exists=True)
+    op.drop_index("idx_query_flagged", table_name="query_logs", if_exists=True)
+
+    op.create_index(
+        "idx_user_active_guild",
+        "users",
+        ["guild_id", "role"],
+        postgresql_where=sa.text("is_active AND NOT is_banned"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_query_flagged_pending",
+        "query_logs",
+        ["created_at"],
+        postgresql_where=sa.text("is_flagged AND reviewed_at IS NULL"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_query_flagged_pending", table_name="query_logs", if_exists=True)
+    op.drop_index("idx_user_active_guild", table_name="users", if_exists=True)
+    op.create_index("idx_query_flagged", "query_logs", ["is_flagged"])
+    op.create_index("idx_user_role", "users", ["role"])
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""partition system_audit_logs by month
+
+Rebuilds system_audit_logs as a RANGE (created_at) partitioned table with
+(id, created_at) as primary key. Existing rows are copied into monthly
+partitions covering their range; later months are created by the app's
+ensure_audit_log_partitions job.
+
+Revision ID: a7d3f5b21e68
+Revises: 6e2b8f4a0c37
+Create Date: 2026-10-16 09:04:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d3f5b21e68"
+down_revision: Union[str, None] = "6e2b8f4a0c37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "system_audit_logs"
+OLD_TABLE = "system_audit_logs_unpartitioned"
+
+COLUMNS = """
+    id uuid NOT NULL,
+    event_type varchar(100) NOT NULL,
+    event_category varchar(50) NOT NULL,
+    severity varchar(20) NOT NULL,
+    actor_id uuid,
+    actor_type varchar(50) NOT NULL,
+    target_type varchar(50),
+    target_id uuid,
+    description text NOT NULL,
+    metadata jsonb NOT NULL,
+    ip_address varchar(45),
+    user_agent varchar(500),
+    request_id varchar(100),
+    retention_days integer NOT NULL,
+    created_at timestamptz NOT NULL"""
+
+COLUMN_NAMES = (
+    "id, event_type, event_category, severity, actor_id, actor_type, target_type, target_id, "
+    "description, metadata, ip_address, user_agent, request_id, retention_days, created_at"
+)
+
+# Indexes on the table at this revision, recreated on the partitioned parent
+INDEXES = [
+    ("ix_system_audit_logs_event_type", "(event_type)"),
+    ("ix_system_audit_logs_request_id", "(request_id)"),
+    ("idx_audit_event_type", "(event_type)"),
+    ("idx_audit_category", "(event_category)"),
+    ("idx_audit_severity", "(severity)"),
+    ("idx_audit_actor_id", "(actor_id)"),
+    ("idx_audit_request_id", "(request_id)"),
+    ("idx_audit_created_brin", "USING brin (created_at) WITH (pages_per_range = 32)"),
+    ("idx_audit_metadata_gin", "USING gin (metadata jsonb_path_ops)"),
+]
+
+
+def _months(first: date, last: date):
+    """First days of every month from first's month through last's month"""
+    month = date(first.year, first.month, 1)
+    while month <= last:
+        next_month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+        yield month, next_month
+        month = next_month
+
+
+def _create_indexes() -> None:
+    for name, definition in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {TABLE} {definition}")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    relkind = bind.scalar(sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:t)"), {"t": TABLE})
+    if relkind == "p":
+        # Created partitioned by init_db's create_all; nothing to convert
+        return
+
+    op.execute(f"ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}")
+    op.execute(f"ALTER TABLE {OLD_TABLE} RENAME CONSTRAINT {TABLE}_pkey TO {OLD_TABLE}_pkey")
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.execute(f"CREATE TABLE {TABLE} ({COLUMNS},\n    PRIMARY KEY (id, created_at)\n) PARTITION BY RANGE (created_at)")
+    op.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+
+    # Monthly partitions from the oldest row through next month, so no
+    # existing row lands in the default partition
+    oldest = bind.scalar(sa.text(f"SELECT min(created_at) FROM {OLD_TABLE}"))
+    today = date.today()
+    next_month = date(today.year + today.month // 12, today.month % 12 + 1, 1)
+    for month, following in _months(oldest.date() if oldest else today, next_month):
+        op.execute(
+            f"CREATE TABLE {TABLE}_{month:%Y_%m} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{following.isoformat()}')"
+        )
+
+    op.execute(f"INSERT INTO {TABLE} ({COLUMN_NAMES}) SELECT {COLUMN_NAMES} FROM {OLD_TABLE}")
+    op.execute(f"DROP TABLE {OLD_TABLE}")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute(f"ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}")
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.execute(f"ALTER TABLE {OLD_TABLE} RENAME CONSTRAINT {TABLE}_pkey TO {OLD_TABLE}_pkey")
+
+    op.execute(f"CREATE TABLE {TABLE} ({COLUMNS},\n    PRIMARY KEY (id)\n)")
+    op.execute(f"INSERT INTO {TABLE} ({COLUMN_NAMES}) SELECT {COLUMN_NAMES} FROM {OLD_TABLE}")
+    op.execute(f"DROP TABLE {OLD_TABLE}")
+    _create_indexes()
\ No newline at end of file
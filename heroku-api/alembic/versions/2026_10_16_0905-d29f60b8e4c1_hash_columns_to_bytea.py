@@ -0,0 +1,54 @@
+"""store query_hash/source_hash as bytea
+
+Existing values are hex digests and are decoded to their raw bytes. They
+were SHA-256 digests, so older rows simply never match the BLAKE2b hashes
+new queries are looked up by.
+
+Revision ID: d29f60b8e4c1
+Revises: a7d3f5b21e68
+Create Date: 2026-10-16 09:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d29f60b8e4c1"
+down_revision: Union[str, None] = "a7d3f5b21e68"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HASH_COLUMNS = [
+    ("query_logs", "query_hash"),
+    ("compliance_documents", "source_hash"),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table, column in HASH_COLUMNS:
+        data_type = bind.scalar(
+            sa.text(
+                "SELECT data_type FROM information_schema.columns "
+                "WHERE table_name = :table AND column_name = :column"
+            ),
+            {"table": table, "column": column},
+        )
+        if data_type == "bytea":
+            # Table created from the current models by init_db
+            continue
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE bytea "
+            f"USING decode({column}, 'hex')"
+        )
+
+
+def downgrade() -> None:
+    for table, column in HASH_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(64) "
+            f"USING encode({column}, 'hex')"
+        )
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""drop indexes duplicating index=True/unique columns
+
+Revision ID: 4b8c1e7d92a5
+Revises: d29f60b8e4c1
+Create Date: 2026-10-16 09:06:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b8c1e7d92a5"
+down_revision: Union[str, None] = "d29f60b8e4c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns); user_id and query_hash lead composite indexes
+DUPLICATE_INDEXES = [
+    ("idx_user_discord_id", "users", ["discord_id"]),
+    ("idx_user_guild_id", "users", ["guild_id"]),
+    ("ix_query_logs_user_id", "query_logs", ["user_id"]),
+    ("idx_query_user_id", "query_logs", ["user_id"]),
+    ("ix_query_logs_query_hash", "query_logs", ["query_hash"]),
+    ("idx_query_hash", "query_logs", ["query_hash"]),
+    ("idx_query_session_id", "query_logs", ["session_id"]),
+    ("idx_feedback_user_id", "query_feedbacks", ["user_id"]),
+    ("idx_feedback_query_id", "query_feedbacks", ["query_id"]),
+    ("idx_document_id", "compliance_documents", ["document_id"]),
+    ("idx_audit_event_type", "system_audit_logs", ["event_type"]),
+    ("idx_audit_request_id", "system_audit_logs", ["request_id"]),
+]
+
+
+def upgrade() -> None:
+    for index, table, _ in DUPLICATE_INDEXES:
+        op.drop_index(index, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    for index, table, columns in DUPLICATE_INDEXES:
+        op.create_index(index, table, columns, if_not_exists=True)
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""server-side now() defaults for created_at/updated_at
+
+Revision ID: f03a9c5e6b14
+Revises: 4b8c1e7d92a5
+Create Date: 2026-10-16 09:07:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f03a9c5e6b14"
+down_revision: Union[str, None] = "4b8c1e7d92a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = [
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("query_logs", "created_at"),
+    ("query_feedbacks", "created_at"),
+    ("compliance_documents", "created_at"),
+    ("compliance_documents", "updated_at"),
+    ("system_audit_logs", "created_at"),
+]
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
\ No newline at end of file
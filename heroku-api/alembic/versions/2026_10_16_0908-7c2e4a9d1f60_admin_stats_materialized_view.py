@@ -0,0 +1,62 @@
+"""admin_stats_mv materialized view
+
+Single-row view of the /admin/stats aggregates. The constant id column
+carries a unique index so the view can be refreshed CONCURRENTLY. Change
+the definition with a new revision that drops and recreates the view.
+
+Revision ID: 7c2e4a9d1f60
+Revises: f03a9c5e6b14
+Create Date: 2026-10-16 09:08:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e4a9d1f60"
+down_revision: Union[str, None] = "f03a9c5e6b14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW admin_stats_mv AS
+        SELECT
+            1 AS id,
+            u.total_users,
+            u.active_users_7d,
+            q.total_queries,
+            q.queries_today,
+            q.avg_confidence_score,
+            q.flagged_queries,
+            f.total_feedback,
+            f.avg_overall_rating,
+            d.compliance_documents,
+            now() AS refreshed_at
+        FROM
+            (SELECT count(*) AS total_users,
+                    count(*) FILTER (WHERE last_query_at >= now() - interval '7 days') AS active_users_7d
+             FROM users) u,
+            (SELECT count(*) AS total_queries,
+                    count(*) FILTER (
+                        WHERE created_at >= date_trunc('day', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+                    ) AS queries_today,
+                    avg(confidence_score) AS avg_confidence_score,
+                    count(*) FILTER (WHERE is_flagged OR confidence_score < 0.5) AS flagged_queries
+             FROM query_logs) q,
+            (SELECT count(*) AS total_feedback,
+                    avg(overall_rating) AS avg_overall_rating
+             FROM query_feedbacks) f,
+            (SELECT count(*) AS compliance_documents
+             FROM compliance_documents) d
+        """
+    )
+    op.execute("CREATE UNIQUE INDEX idx_admin_stats_mv_id ON admin_stats_mv (id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS admin_stats_mv")
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""partial index for the admin flagged-query list
+
+Revision ID: 0e5b7a3c8d21
+Revises: 7c2e4a9d1f60
+Create Date: 2026-10-16 09:09:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0e5b7a3c8d21"
+down_revision: Union[str, None] = "7c2e4a9d1f60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_query_flagged_recent",
+        "query_logs",
+        [sa.text("created_at DESC")],
+        postgresql_where=sa.text("is_flagged OR confidence_score < 0.5"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_query_flagged_recent", table_name="query_logs", if_exists=True)
\ No newline at end of file
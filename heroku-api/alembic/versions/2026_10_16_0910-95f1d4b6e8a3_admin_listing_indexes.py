@@ -0,0 +1,40 @@
+"""ordered indexes for the admin user and audit log listings
+
+Revision ID: 95f1d4b6e8a3
+Revises: 0e5b7a3c8d21
+Create Date: 2026-10-16 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "95f1d4b6e8a3"
+down_revision: Union[str, None] = "0e5b7a3c8d21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_user_created", "users", [sa.text("created_at DESC")], if_not_exists=True)
+    op.create_index("idx_user_role_created", "users", ["role", sa.text("created_at DESC")], if_not_exists=True)
+    op.create_index("idx_audit_created", "system_audit_logs", [sa.text("created_at DESC")], if_not_exists=True)
+    op.create_index(
+        "idx_audit_event_created",
+        "system_audit_logs",
+        ["event_type", sa.text("created_at DESC")],
+        if_not_exists=True,
+    )
+    # Superseded by idx_audit_event_created
+    op.drop_index("ix_system_audit_logs_event_type", table_name="system_audit_logs", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_system_audit_logs_event_type", "system_audit_logs", ["event_type"], if_not_exists=True)
+    op.drop_index("idx_audit_event_created", table_name="system_audit_logs", if_exists=True)
+    op.drop_index("idx_audit_created", table_name="system_audit_logs", if_exists=True)
+    op.drop_index("idx_user_role_created", table_name="users", if_exists=True)
+    op.drop_index("idx_user_created", table_name="users", if_exists=True)
\ No newline at end of file
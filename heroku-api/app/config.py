@@ -4,7 +4,7 @@ Ensures all required environment variables are set at startup.
 """
 
 import os
-from typing import Optional
+from typing import FrozenSet, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
 
@@ -74,5 +74,18 @@ class Settings(BaseSettings):
         return v.strip()
 
 
+def parse_cors_origins(value: str) -> FrozenSet[str]:
+    """
+    Parse a comma-separated origin list.
+
+    Args:
+        value: Comma-separated CORS origins
+
+    Returns:
+        Set of stripped, non-empty origins
+    """
+    return frozenset(origin.strip() for origin in value.split(",") if origin.strip())
+
+
 # Global settings instance
 settings = Settings()
\ No newline at end of file
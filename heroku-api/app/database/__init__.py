@@ -1,12 +1,13 @@
 """Database package - SQLAlchemy async configuration and models"""
 
-from .connection import engine, async_session_factory, get_session
+from .connection import engine, async_session_factory, get_session, get_readonly_session
 from .models import Base, User, QueryLog, QueryFeedback, ComplianceDocument, SystemAuditLog
 
 __all__ = [
     "engine",
     "async_session_factory",
     "get_session",
+    "get_readonly_session",
     "Base",
     "User",
     "QueryLog",
@@ -3,9 +3,12 @@ Database models for S&P Compliance Discord Bot
 5 models with full audit trail and RBAC support
 """
 
+import hashlib
+import os
+import time
 import uuid
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import List, Optional, Tuple
 
 from sqlalchemy import (
     JSON,
@@ -13,18 +16,55 @@ from sqlalchemy import (
     DateTime,
     Float,
     Integer,
+    LargeBinary,
     String,
     Text,
     Index,
     ForeignKey,
+    desc,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, selectinload
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    48-bit Unix millisecond timestamp, then version/variant bits and 74 random
+    bits, so new rows land on the rightmost page of the primary key btree.
+
+    Returns:
+        UUIDv7 value
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms << 80) | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def hash_bytes(value: str) -> bytes:
+    """
+    Content hash stored in query_hash/source_hash columns.
+
+    Args:
+        value: Text to hash
+
+    Returns:
+        32-byte BLAKE2b digest (raw, not hex-encoded)
+    """
+    return hashlib.blake2b(value.encode(), digest_size=32).digest()
 
 
 class Base(DeclarativeBase):
     """Base class for all models"""
-    pass
+
+    # Fetch server-generated timestamps via RETURNING in the same INSERT/UPDATE,
+    # so reading them afterwards never triggers a lazy load on the async session
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class User(Base):
@@ -45,7 +85,7 @@ class User(Base):
 
     # RBAC
     role: Mapped[str] = mapped_column(String(50), nullable=False, default="user")  # user, admin, compliance_officer
-    permissions: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    permissions: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
     department: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
     # Status
@@ -72,22 +112,42 @@ class User(Base):
     notification_preferences: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
 
     # Audit Fields
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    # Relationships
-    queries: Mapped[list["QueryLog"]] = relationship("QueryLog", back_populates="user", cascade="all, delete-orphan")
-    feedbacks: Mapped[list["QueryFeedback"]] = relationship("QueryFeedback", back_populates="user", cascade="all, delete-orphan")
+    # Relationships (never lazy-loaded: use with_queries() or an explicit loader option).
+    # passive_deletes lets the FK's ON DELETE CASCADE remove children without loading them.
+    queries: Mapped[list["QueryLog"]] = relationship(
+        "QueryLog", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    feedbacks: Mapped[list["QueryFeedback"]] = relationship(
+        "QueryFeedback", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+
+    @staticmethod
+    def with_queries():
+        """
+        Loader option that fetches users' queries and their feedback with
+        one SELECT ... WHERE user_id IN (...) per level instead of one per user.
+
+        Usage:
+            select(User).options(User.with_queries())
+        """
+        return selectinload(User.queries).selectinload(QueryLog.feedback)
 
     # Indexes
     __table_args__ = (
-        Index("idx_user_discord_id", "discord_id"),
-        Index("idx_user_guild_id", "guild_id"),
-        Index("idx_user_role", "role"),
         # Composite indexes for common query patterns
         Index("idx_user_active_last_query", "is_active", "last_query_at"),
         Index("idx_user_banned_created", "is_banned", "created_at"),
+        # Admin user listing: newest first, optionally filtered by role
+        Index("idx_user_created", desc("created_at")),
+        Index("idx_user_role_created", "role", desc("created_at")),
+        # Partial index covering only users dashboards care about
+        Index("idx_user_active_guild", "guild_id", "role", postgresql_where=text("is_active AND NOT is_banned")),
+        # GIN indexes accelerate top-level containment (@>) filters on JSONB
+        Index("idx_user_permissions_gin", "permissions", postgresql_using="gin", postgresql_ops={"permissions": "jsonb_path_ops"}),
     )
 
 
@@ -99,14 +159,14 @@ class QueryLog(Base):
     __tablename__ = "query_logs"
 
     # Primary Key
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # User Reference
-    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)  # Leads idx_query_user_created
 
     # Query Content
     query_text: Mapped[str] = mapped_column(Text, nullable=False)
-    query_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)  # For deduplication
+    query_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)  # For deduplication (hash_bytes); leads idx_query_hash_created
 
     # Response
     response_text: Mapped[str] = mapped_column(Text, nullable=False)
@@ -120,7 +180,7 @@ class QueryLog(Base):
 
     # RAG Context
     rag_chunks_used: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    rag_sources: Mapped[list] = mapped_column(JSON, nullable=False, default=list)  # List of source documents
+    rag_sources: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)  # List of source documents
 
     # Session Tracking
     session_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
@@ -133,7 +193,7 @@ class QueryLog(Base):
     reviewed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Audit
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="queries")
@@ -141,14 +201,18 @@ class QueryLog(Base):
 
     # Indexes
     __table_args__ = (
-        Index("idx_query_user_id", "user_id"),
-        Index("idx_query_hash", "query_hash"),
-        Index("idx_query_created_at", "created_at"),
-        Index("idx_query_session_id", "session_id"),
-        Index("idx_query_flagged", "is_flagged"),
+        # Dedup lookups: query_hash match within a recent created_at window
+        Index("idx_query_hash_created", "query_hash", desc("created_at")),
+        # Append-only table: BRIN is a fraction of a btree's size for time-range scans
+        Index("idx_query_created_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        # Review queue: flagged rows nobody has reviewed yet
+        Index("idx_query_flagged_pending", "created_at", postgresql_where=text("is_flagged AND reviewed_at IS NULL")),
+        # Admin flagged list: newest flagged or low-confidence rows first
+        Index("idx_query_flagged_recent", desc("created_at"), postgresql_where=text("is_flagged OR confidence_score < 0.5")),
         # Composite indexes for common query patterns
         Index("idx_query_user_created", "user_id", "created_at"),
         Index("idx_query_flagged_confidence", "is_flagged", "confidence_score"),
+        Index("idx_query_rag_sources_gin", "rag_sources", postgresql_using="gin", postgresql_ops={"rag_sources": "jsonb_path_ops"}),
     )
 
 
@@ -160,7 +224,7 @@ class QueryFeedback(Base):
     __tablename__ = "query_feedbacks"
 
     # Primary Key
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # References
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -181,18 +245,12 @@ class QueryFeedback(Base):
     escalation_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Audit
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="feedbacks")
     query: Mapped["QueryLog"] = relationship("QueryLog", back_populates="feedback")
 
-    # Indexes
-    __table_args__ = (
-        Index("idx_feedback_user_id", "user_id"),
-        Index("idx_feedback_query_id", "query_id"),
-    )
-
 
 class ComplianceDocument(Base):
     """
@@ -217,7 +275,7 @@ class ComplianceDocument(Base):
     document_type: Mapped[str] = mapped_column(String(50), nullable=False)  # policy, procedure, regulation
     category: Mapped[str] = mapped_column(String(100), nullable=False)
     subcategory: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    keywords: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    keywords: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
 
     # Access Control
     department: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
@@ -230,18 +288,18 @@ class ComplianceDocument(Base):
 
     # Source
     source_url: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
-    source_hash: Mapped[str] = mapped_column(String(64), nullable=False)  # SHA256 of content
+    source_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)  # hash_bytes of content
 
     # Audit
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Indexes
     __table_args__ = (
-        Index("idx_document_id", "document_id"),
         Index("idx_document_type", "document_type"),
         Index("idx_document_category", "category"),
         Index("idx_document_active", "is_active"),
+        Index("idx_document_keywords_gin", "keywords", postgresql_using="gin", postgresql_ops={"keywords": "jsonb_path_ops"}),
     )
 
 
@@ -253,10 +311,10 @@ class SystemAuditLog(Base):
     __tablename__ = "system_audit_logs"
 
     # Primary Key
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Event Type
-    event_type: Mapped[str] = mapped_column(String(100), nullable=False, index=True)  # user_created, query_flagged, etc.
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)  # user_created, query_flagged, etc.
     event_category: Mapped[str] = mapped_column(String(50), nullable=False)  # auth, query, admin, system
     severity: Mapped[str] = mapped_column(String(20), nullable=False, default="info")  # debug, info, warning, error, critical
 
@@ -270,7 +328,8 @@ class SystemAuditLog(Base):
 
     # Details
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    metadata: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    # Declarative reserves the "metadata" attribute; the column keeps its name
+    event_metadata: Mapped[dict] = mapped_column("metadata", JSONB, nullable=False, default=dict)
 
     # Request Context
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
@@ -280,18 +339,52 @@ class SystemAuditLog(Base):
     # GDPR Compliance
     retention_days: Mapped[int] = mapped_column(Integer, nullable=False, default=90)
 
-    # Audit
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, index=True)
+    # Audit (part of the primary key: PostgreSQL requires the partition key in unique indexes)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, server_default=func.now())
 
     # Relationships
-    actor: Mapped[Optional["User"]] = relationship("User", foreign_keys=[actor_id])
+    # actor_id has no FK constraint (system actors, partitioned table), so spell out the join
+    actor: Mapped[Optional["User"]] = relationship("User", primaryjoin="foreign(SystemAuditLog.actor_id) == User.id")
 
     # Indexes
     __table_args__ = (
-        Index("idx_audit_event_type", "event_type"),
         Index("idx_audit_category", "event_category"),
         Index("idx_audit_severity", "severity"),
         Index("idx_audit_actor_id", "actor_id"),
-        Index("idx_audit_created_at", "created_at"),
-        Index("idx_audit_request_id", "request_id"),
-    )
\ No newline at end of file
+        # Admin audit log: newest first, optionally filtered by event type
+        # (idx_audit_event_created also serves plain event_type lookups)
+        Index("idx_audit_created", desc("created_at")),
+        Index("idx_audit_event_created", "event_type", desc("created_at")),
+        # Retention purges scan by age; BRIN suits the append-only log
+        Index("idx_audit_created_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        Index("idx_audit_metadata_gin", "metadata", postgresql_using="gin", postgresql_ops={"metadata": "jsonb_path_ops"}),
+        # Monthly range partitions: retention purges drop whole partitions
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+
+def audit_log_partition_ranges(today: date, months_ahead: int = 2) -> List[Tuple[str, date, date]]:
+    """
+    Monthly system_audit_logs partitions for the current and upcoming months.
+
+    Args:
+        today: Date whose month is the first partition
+        months_ahead: Additional future months to include
+
+    Returns:
+        (partition name, first day, first day of next month) per month
+    """
+    table = SystemAuditLog.__tablename__
+    ranges = []
+
+    month = date(today.year, today.month, 1)
+    for _ in range(months_ahead + 1):
+        next_month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+        ranges.append((f"{table}_{month:%Y_%m}", month, next_month))
+        month = next_month
+
+    return ranges
+
+
+# Created by the 7c2e4a9d1f60 Alembic revision
+ADMIN_STATS_VIEW = "admin_stats_mv"
\ No newline at end of file
@@ -3,22 +3,115 @@ Document ingestion pipeline for RAG system
 Downloads, processes, and stores compliance documents
 """
 
-import os
+import asyncio
 import hashlib
-from typing import List, Dict, Any
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-import tempfile
 
+import fitz  # PyMuPDF
 import httpx
-from pypdf import PdfReader
+import numpy as np
+import orjson
 import structlog
 
 from .splitter import RecursiveTextSplitter
 from .embedder import Embedder
 from .store import VectorStore
+# Shared with retrieval: one model and one Redis pool per process
+from .retriever import get_embedder, get_vector_store
 
 logger = structlog.get_logger()
 
+# PDFs below this page count are extracted in-process; the pool isn't worth it
+PDF_PARALLEL_MIN_PAGES = 4
+PDF_WORKERS = os.cpu_count() or 1
+
+# Chunks per embed/store pipeline stage: one batch is embedded while the
+# previous one is written, so at most two batches are held in memory
+INGEST_BATCH_SIZE = 256
+
+# Concurrent embedding shards per ingest. Each shard runs in a worker thread;
+# on CPU torch already spreads one batch over all cores, so 1 (off-loop only)
+# is the default and higher values help on GPU or many-core hosts
+EMBED_PARALLEL = max(1, int(os.getenv("EMBED_PARALLEL", "1")))
+
+# Redis hash per document: source_url, etag, last_modified, sha256 of the last ingest
+# and "inputs" (hash of the title, type, category and metadata it was ingested with)
+INGEST_CACHE_PREFIX = "ingest:etag:"
+
+# Downloads larger than this are aborted mid-stream
+MAX_PDF_BYTES = int(os.getenv("MAX_PDF_BYTES", str(50 * 1024 * 1024)))
+
+# Worker processes for PDF text extraction (created on first large PDF)
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+# Shared download client: keeps connections (and TLS sessions) across ingests
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Splitter singleton (loads the tokenizer once)
+_splitter: Optional[RecursiveTextSplitter] = None
+_splitter_lock = threading.Lock()
+
+
+def _get_splitter() -> RecursiveTextSplitter:
+    """Get or create text splitter singleton"""
+    global _splitter
+    if _splitter is None:
+        with _splitter_lock:
+            if _splitter is None:
+                _splitter = RecursiveTextSplitter()
+    return _splitter
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get or create the PDF extraction process pool"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        with _pdf_pool_lock:
+            if _pdf_pool is None:
+                # Workers start from a clean forkserver process: forking this one
+                # would copy its torch threads, worker threads and event loop
+                _pdf_pool = ProcessPoolExecutor(
+                    max_workers=PDF_WORKERS,
+                    mp_context=multiprocessing.get_context("forkserver"),
+                )
+    return _pdf_pool
+
+
+def close_pdf_pool() -> None:
+    """Shut down the PDF extraction process pool (called on app shutdown)"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is not None:
+            _pdf_pool.shutdown(wait=False, cancel_futures=True)
+            _pdf_pool = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared download client"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared download client (called on app shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 async def ingest_document(
     source_url: str,
@@ -40,7 +133,7 @@ async def ingest_document(
         metadata: Additional metadata
 
     Returns:
-        Dict with ingestion results
+        Dict with ingestion results ("content" holds the extracted text on success)
     """
     document_title = document_title or document_id
     metadata = metadata or {}
@@ -51,22 +144,47 @@ async def ingest_document(
         source_url=source_url,
     )
 
-    # 1. Download document
+    vector_store = get_vector_store()
+
+    # Validators from the last successful ingest of this URL with the same
+    # chunk metadata; changed metadata means every chunk must be rewritten
+    cache_key = f"{INGEST_CACHE_PREFIX}{document_id}"
+    inputs_hash = _ingest_inputs_hash(document_title, document_type, category, metadata)
+    cached = {
+        key.decode(): value.decode()
+        for key, value in (await asyncio.to_thread(vector_store.client.hgetall, cache_key)).items()
+    }
+    if cached.get("source_url") != source_url or cached.get("inputs") != inputs_hash:
+        cached = {}
+
+    # 1. Download document (conditional GET when validators are cached)
     try:
-        content = await _download_pdf(source_url)
+        content, validators = await _download_pdf(source_url, cached)
     except Exception as e:
         logger.error("ingest.download_failed", document_id=document_id, error=str(e))
         raise
 
+    # 304 Not Modified, or same bytes as last time: nothing to re-embed
+    content_hash = hashlib.sha256(content).hexdigest() if content is not None else None
+    if content is None or content_hash == cached.get("sha256"):
+        logger.info("ingest.unchanged", document_id=document_id, not_modified=content is None)
+        return {
+            "document_id": document_id,
+            "document_title": document_title,
+            "status": "unchanged",
+            "chunks_added": 0,
+            "source_url": source_url,
+        }
+
     # 2. Extract text from PDF
     try:
-        text = _extract_text_from_pdf(content)
+        text = await asyncio.to_thread(_extract_text_from_pdf, content)
     except Exception as e:
         logger.error("ingest.extraction_failed", document_id=document_id, error=str(e))
         raise
 
     # 3. Split into chunks
-    splitter = RecursiveTextSplitter()
+    splitter = _get_splitter()
     chunks = splitter.split_text(text)
 
     if not chunks:
@@ -78,34 +196,29 @@ async def ingest_document(
             "chunks_added": 0,
         }
 
-    # 4. Generate embeddings
-    embedder = Embedder()
-    embeddings = embedder.embed_texts(chunks, batch_size=32)
-
-    # 5. Prepare chunks with metadata
-    chunk_dicts = []
-    for i, (chunk_text, embedding) in enumerate(zip(chunks, embeddings)):
-        chunk_metadata = {
-            "document_id": document_id,
-            "document_title": document_title,
-            "document_type": document_type,
-            "category": category,
-            "source": source_url,
-            "chunk_index": i,
-            "total_chunks": len(chunks),
-            "ingested_at": datetime.utcnow().isoformat(),
-            **metadata,
-        }
+    # 4. Prepare metadata
+    # Shared by every chunk; only chunk_index varies
+    base_metadata = {
+        "document_id": document_id,
+        "document_title": document_title,
+        "document_type": document_type,
+        "category": category,
+        "source": source_url,
+        "total_chunks": len(chunks),
+        "ingested_at": datetime.utcnow().isoformat(),
+        **metadata,
+    }
 
-        chunk_dicts.append({
-            "text": chunk_text,
-            "embedding": embedding,
-            "metadata": chunk_metadata,
-        })
+    # 5. Generate embeddings and store in vector database
+    num_added = await _embed_and_store(get_embedder(), vector_store, chunks, base_metadata)
 
-    # 6. Store in vector database
-    vector_store = VectorStore()
-    num_added = vector_store.add_chunks(chunk_dicts)
+    # Remember what was ingested so unchanged re-ingests short-circuit
+    await asyncio.to_thread(vector_store.client.hset, cache_key, mapping={
+        "source_url": source_url,
+        "sha256": content_hash,
+        "inputs": inputs_hash,
+        **validators,
+    })
 
     logger.info(
         "ingest.complete",
@@ -121,21 +234,136 @@ async def ingest_document(
         "chunks_added": num_added,
         "total_characters": len(text),
         "source_url": source_url,
+        "content": text,
     }
 
 
-async def _download_pdf(url: str) -> bytes:
+def _ingest_inputs_hash(
+    document_title: str,
+    document_type: str,
+    category: str,
+    metadata: Dict[str, Any],
+) -> str:
+    """Hash of the ingest arguments that end up in chunk metadata"""
+    inputs = orjson.dumps(
+        [document_title, document_type, category, metadata],
+        option=orjson.OPT_SORT_KEYS,
+        default=str,
+    )
+    return hashlib.sha256(inputs).hexdigest()
+
+
+async def _embed_and_store(
+    embedder: Embedder,
+    vector_store: VectorStore,
+    chunks: List[str],
+    base_metadata: Dict[str, Any],
+) -> int:
+    """
+    Embed and store chunks as a two-stage pipeline: batch i is embedded while
+    batch i-1 is written to Redis. Chunks of the document's previous version
+    are pruned once every batch is stored.
+
+    Args:
+        embedder: Embedder to use
+        vector_store: Vector store to write to
+        chunks: Chunk texts, in document order
+        base_metadata: Metadata shared by all chunks (chunk_index is added)
+
+    Returns:
+        Number of chunks written
+    """
+    num_added = 0
+    keep_ids = set()
+    previous_batch: List[Dict[str, Any]] = []
+
+    for start in range(0, len(chunks), INGEST_BATCH_SIZE):
+        texts = chunks[start:start + INGEST_BATCH_SIZE]
+
+        if previous_batch:
+            embeddings, written = await asyncio.gather(
+                _embed_all(embedder, texts),
+                asyncio.to_thread(vector_store.add_chunks, previous_batch),
+            )
+            num_added += written
+        else:
+            embeddings = await _embed_all(embedder, texts)
+
+        previous_batch = [
+            {
+                "text": chunk_text,
+                "embedding": embedding,
+                "metadata": {**base_metadata, "chunk_index": start + i},
+            }
+            for i, (chunk_text, embedding) in enumerate(zip(texts, embeddings))
+        ]
+        keep_ids.update(vector_store.chunk_ids(previous_batch))
+
+    if previous_batch:
+        num_added += await asyncio.to_thread(vector_store.add_chunks, previous_batch)
+
+    # Replace chunks from the previous version of the document
+    await asyncio.to_thread(vector_store.prune_document, base_metadata["document_id"], keep_ids)
+
+    return num_added
+
+
+async def _embed_all(
+    embedder: Embedder,
+    chunks: List[str],
+    batch_size: int = 64,
+    parallel: int = EMBED_PARALLEL,
+) -> np.ndarray:
+    """
+    Embed chunks off the event loop, split into up to `parallel` concurrent shards.
+
+    Args:
+        embedder: Embedder to use
+        chunks: Chunk texts
+        batch_size: Model batch size within each shard
+        parallel: Maximum number of shards run concurrently
+
+    Returns:
+        Embedding matrix in chunk order, shape (len(chunks), embed_dim)
+    """
+    step = -(-len(chunks) // parallel)  # ceil division
+    shards = [chunks[start:start + step] for start in range(0, len(chunks), step)]
+
+    results = await asyncio.gather(
+        *(asyncio.to_thread(embedder.embed_texts, shard, batch_size) for shard in shards)
+    )
+
+    return results[0] if len(results) == 1 else np.concatenate(results)
+
+
+async def _download_pdf(
+    url: str,
+    cached: Dict[str, str] = None,
+) -> Tuple[Optional[bytes], Dict[str, str]]:
     """
-    Download PDF from URL.
+    Download PDF from URL, streaming into a buffer capped at MAX_PDF_BYTES.
 
     Args:
         url: PDF URL
+        cached: Validators from the previous download ("etag", "last_modified")
 
     Returns:
-        PDF content as bytes
+        (PDF content, new validators); content is None if the server replied 304
+
+    Raises:
+        ValueError: If the document exceeds MAX_PDF_BYTES
     """
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-        response = await client.get(url)
+    cached = cached or {}
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    async with _get_http_client().stream("GET", url, headers=headers) as response:
+        if response.status_code == 304:
+            return None, {key: cached[key] for key in ("etag", "last_modified") if key in cached}
+
         response.raise_for_status()
 
         content_type = response.headers.get("content-type", "")
@@ -146,12 +374,28 @@ async def _download_pdf(url: str) -> bytes:
                 content_type=content_type,
             )
 
-        return response.content
+        content_length = int(response.headers.get("content-length") or 0)
+        if content_length > MAX_PDF_BYTES:
+            raise ValueError(f"PDF too large: {content_length} bytes (limit {MAX_PDF_BYTES})")
+
+        buffer = bytearray()
+        async for chunk in response.aiter_bytes(65536):
+            buffer.extend(chunk)
+            if len(buffer) > MAX_PDF_BYTES:
+                raise ValueError(f"PDF too large: over {MAX_PDF_BYTES} bytes")
+
+        validators = {
+            "etag": response.headers.get("etag", ""),
+            "last_modified": response.headers.get("last-modified", ""),
+        }
+
+        return bytes(buffer), validators
 
 
 def _extract_text_from_pdf(pdf_content: bytes) -> str:
     """
     Extract text from PDF bytes.
+    Large PDFs are split into page ranges extracted in parallel worker processes.
 
     Args:
         pdf_content: PDF file content
@@ -159,44 +403,65 @@ def _extract_text_from_pdf(pdf_content: bytes) -> str:
     Returns:
         Extracted text
     """
-    # Write to temp file (pypdf requires file-like object)
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
-        tmp_file.write(pdf_content)
-        tmp_path = tmp_file.name
-
-    try:
-        reader = PdfReader(tmp_path)
+    # PyMuPDF opens the bytes in memory; no temp file needed
+    with fitz.open(stream=pdf_content, filetype="pdf") as doc:
+        num_pages = doc.page_count
+
+    if num_pages < PDF_PARALLEL_MIN_PAGES:
+        text_parts = _extract_page_range(pdf_content, 0, num_pages)
+    else:
+        # One contiguous page range per worker, so each reopens the PDF once
+        step = -(-num_pages // PDF_WORKERS)  # ceil division
+        starts = range(0, num_pages, step)
         text_parts = []
+        for part in _get_pdf_pool().map(
+            _extract_page_range,
+            [pdf_content] * len(starts),
+            starts,
+            [min(start + step, num_pages) for start in starts],
+        ):
+            text_parts.extend(part)
+
+    full_text = "\n\n".join(text_parts)
+
+    logger.debug(
+        "ingest.text_extracted",
+        num_pages=num_pages,
+        text_length=len(full_text),
+    )
+
+    return full_text
+
 
-        for page_num, page in enumerate(reader.pages, start=1):
+def _extract_page_range(pdf_content: bytes, start: int, stop: int) -> List[str]:
+    """
+    Extract non-empty page texts for pages [start, stop). Runs in pool workers.
+
+    Args:
+        pdf_content: PDF file content
+        start: First page index (0-based)
+        stop: Page index to stop before
+
+    Returns:
+        Page texts in page order
+    """
+    text_parts = []
+
+    with fitz.open(stream=pdf_content, filetype="pdf") as doc:
+        for page_index in range(start, stop):
             try:
-                page_text = page.extract_text()
+                page_text = doc[page_index].get_text("text")
                 if page_text:
                     text_parts.append(page_text)
             except Exception as e:
                 logger.warning(
                     "ingest.page_extraction_failed",
-                    page_num=page_num,
+                    page_num=page_index + 1,
                     error=str(e),
                 )
                 continue
 
-        full_text = "\n\n".join(text_parts)
-
-        logger.debug(
-            "ingest.text_extracted",
-            num_pages=len(reader.pages),
-            text_length=len(full_text),
-        )
-
-        return full_text
-
-    finally:
-        # Clean up temp file
-        try:
-            os.unlink(tmp_path)
-        except Exception:
-            pass
+    return text_parts
 
 
 async def delete_document(document_id: str) -> Dict[str, Any]:
@@ -209,8 +474,9 @@ async def delete_document(document_id: str) -> Dict[str, Any]:
     Returns:
         Dict with deletion results
     """
-    vector_store = VectorStore()
-    num_deleted = vector_store.delete_by_document(document_id)
+    vector_store = get_vector_store()
+    num_deleted = await asyncio.to_thread(vector_store.delete_by_document, document_id)
+    await asyncio.to_thread(vector_store.client.delete, f"{INGEST_CACHE_PREFIX}{document_id}")
 
     logger.info(
         "ingest.document_deleted",
@@ -257,7 +523,7 @@ async def ingest_text(
     )
 
     # 1. Split into chunks
-    splitter = RecursiveTextSplitter()
+    splitter = _get_splitter()
     chunks = splitter.split_text(text)
 
     if not chunks:
@@ -268,34 +534,22 @@ async def ingest_text(
             "chunks_added": 0,
         }
 
-    # 2. Generate embeddings
-    embedder = Embedder()
-    embeddings = embedder.embed_texts(chunks, batch_size=32)
-
-    # 3. Prepare chunks with metadata
-    chunk_dicts = []
-    for i, (chunk_text, embedding) in enumerate(zip(chunks, embeddings)):
-        chunk_metadata = {
-            "document_id": document_id,
-            "document_title": document_title,
-            "document_type": document_type,
-            "category": category,
-            "source": "direct_input",
-            "chunk_index": i,
-            "total_chunks": len(chunks),
-            "ingested_at": datetime.utcnow().isoformat(),
-            **metadata,
-        }
-
-        chunk_dicts.append({
-            "text": chunk_text,
-            "embedding": embedding,
-            "metadata": chunk_metadata,
-        })
+    # 2. Prepare metadata
+    # Shared by every chunk; only chunk_index varies
+    base_metadata = {
+        "document_id": document_id,
+        "document_title": document_title,
+        "document_type": document_type,
+        "category": category,
+        "source": "direct_input",
+        "total_chunks": len(chunks),
+        "ingested_at": datetime.utcnow().isoformat(),
+        **metadata,
+    }
 
-    # 4. Store in vector database
-    vector_store = VectorStore()
-    num_added = vector_store.add_chunks(chunk_dicts)
+    # 3. Generate embeddings and store in vector database
+    vector_store = get_vector_store()
+    num_added = await _embed_and_store(get_embedder(), vector_store, chunks, base_metadata)
 
     logger.info(
         "ingest.text_complete",
@@ -4,9 +4,11 @@ Uses Reciprocal Rank Fusion for result merging
 """
 
 import os
-from typing import List, Dict, Any
+import threading
+from itertools import chain
+from typing import List, Dict, Any, Tuple
 
-from rank_bm25 import BM25Okapi
+import numpy as np
 import structlog
 
 from .embedder import Embedder
@@ -14,27 +16,47 @@ from .store import VectorStore
 
 logger = structlog.get_logger()
 
+# Default number of results, read once at import
+TOP_K_RAG = int(os.getenv("TOP_K_RAG", "5"))
+
 # Global instances (initialized on first use)
 _embedder: Embedder = None
 _vector_store: VectorStore = None
+# Held while the model loads, so callers wait for the startup warmup
+_embedder_lock = threading.Lock()
 
 
-def _get_embedder() -> Embedder:
-    """Get or create embedder singleton"""
+def get_embedder() -> Embedder:
+    """Get or create the process-wide embedder (shared by retrieval and ingestion)"""
     global _embedder
     if _embedder is None:
-        _embedder = Embedder()
+        with _embedder_lock:
+            if _embedder is None:
+                _embedder = Embedder()
     return _embedder
 
 
-def _get_vector_store() -> VectorStore:
-    """Get or create vector store singleton"""
+def warm_embedder() -> None:
+    """Load and warm the embedder singleton (blocking; run in a worker thread)"""
+    get_embedder().warmup()
+
+
+def get_vector_store() -> VectorStore:
+    """Get or create the process-wide vector store (shared by retrieval, ingestion and health checks)"""
     global _vector_store
     if _vector_store is None:
         _vector_store = VectorStore()
     return _vector_store
 
 
+def close_vector_store() -> None:
+    """Close the shared vector store connection (app shutdown)"""
+    global _vector_store
+    if _vector_store is not None:
+        _vector_store.close()
+        _vector_store = None
+
+
 def hybrid_retrieve(
     query: str,
     top_k: int = None,
@@ -56,11 +78,11 @@ def hybrid_retrieve(
     Returns:
         List of relevant chunks with combined scores
     """
-    top_k = top_k or int(os.getenv("TOP_K_RAG", "5"))
+    top_k = top_k or TOP_K_RAG
 
     # Get embedder and vector store
-    embedder = _get_embedder()
-    vector_store = _get_vector_store()
+    embedder = get_embedder()
+    vector_store = get_vector_store()
 
     # 1. Vector similarity search
     query_embedding = embedder.embed_query(query)
@@ -91,6 +113,7 @@ def hybrid_retrieve(
             bm25_results,
             vector_weight,
             bm25_weight,
+            top_k=top_k,
         )
     else:
         fused_results = vector_results
@@ -116,6 +139,7 @@ def _bm25_search(
 ) -> List[Dict[str, Any]]:
     """
     Perform BM25 keyword search.
+    RediSearch keeps the inverted index on chunk_text and scores server-side.
 
     Args:
         query: Search query
@@ -126,34 +150,7 @@ def _bm25_search(
     Returns:
         List of matching chunks
     """
-    # Get all chunks (or filtered subset)
-    # Note: In production, maintain a separate BM25 index
-    # For now, we use vector search with wildcard and filter by keyword match
-
-    # Tokenize query
-    query_tokens = query.lower().split()
-
-    # Simple keyword matching fallback
-    # In production, maintain proper BM25 index in Redis or separate service
-    results = vector_store.search(
-        query_embedding=[0.0] * vector_store.embed_dim,  # Dummy vector
-        top_k=top_k * 3,
-        filters=filters,
-    )
-
-    # Score by keyword overlap
-    scored_results = []
-    for result in results:
-        text_tokens = result["text"].lower().split()
-        overlap = len(set(query_tokens) & set(text_tokens))
-        if overlap > 0:
-            result["score"] = overlap / len(query_tokens)
-            scored_results.append(result)
-
-    # Sort by score
-    scored_results.sort(key=lambda x: x["score"], reverse=True)
-
-    return scored_results[:top_k]
+    return vector_store.text_search(query, top_k=top_k, filters=filters)
 
 
 def _reciprocal_rank_fusion(
@@ -162,6 +159,7 @@ def _reciprocal_rank_fusion(
     weight_a: float = 0.7,
     weight_b: float = 0.3,
     k: int = 60,
+    top_k: int = None,
 ) -> List[Dict[str, Any]]:
     """
     Combine two result lists using Reciprocal Rank Fusion.
@@ -174,42 +172,34 @@ def _reciprocal_rank_fusion(
         weight_a: Weight for first list
         weight_b: Weight for second list
         k: Constant for RRF (default 60)
+        top_k: Only build result dicts for the best top_k (default: all)
 
     Returns:
         Fused and sorted results
     """
-    # Build document ID to result mapping
-    doc_map = {}
-
-    # Add results from A
-    for rank, result in enumerate(results_a, start=1):
-        doc_id = result.get("document_id", "") + str(result.get("chunk_index", 0))
-        rrf_score = weight_a * (1.0 / (k + rank))
-
-        if doc_id not in doc_map:
-            doc_map[doc_id] = {**result, "rrf_score": 0.0}
-
-        doc_map[doc_id]["rrf_score"] += rrf_score
-
-    # Add results from B
-    for rank, result in enumerate(results_b, start=1):
-        doc_id = result.get("document_id", "") + str(result.get("chunk_index", 0))
-        rrf_score = weight_b * (1.0 / (k + rank))
-
-        if doc_id not in doc_map:
-            doc_map[doc_id] = {**result, "rrf_score": 0.0}
-
-        doc_map[doc_id]["rrf_score"] += rrf_score
-
-    # Sort by RRF score
-    fused_results = sorted(
-        doc_map.values(),
-        key=lambda x: x["rrf_score"],
-        reverse=True,
-    )
+    # Compact int slot per distinct chunk; first occurrence supplies the result fields
+    slots: Dict[Tuple[str, int], int] = {}
+    first_seen: List[Dict[str, Any]] = []
+    result_slots = np.empty(len(results_a) + len(results_b), dtype=np.intp)
+
+    for position, result in enumerate(chain(results_a, results_b)):
+        key = (result.get("document_id", ""), result.get("chunk_index", 0))
+        slot = slots.get(key)
+        if slot is None:
+            slot = slots[key] = len(first_seen)
+            first_seen.append(result)
+        result_slots[position] = slot
+
+    # Per-position RRF contributions, scatter-summed into the chunk slots
+    contributions = np.concatenate((
+        weight_a / (k + np.arange(1, len(results_a) + 1)),
+        weight_b / (k + np.arange(1, len(results_b) + 1)),
+    ))
+    scores = np.zeros(len(first_seen))
+    np.add.at(scores, result_slots, contributions)
+
+    # Stable sort keeps first-seen order among ties
+    order = np.argsort(-scores, kind="stable")[:top_k]
 
     # Replace score with RRF score for consistency
-    for result in fused_results:
-        result["score"] = result.pop("rrf_score")
-
-    return fused_results
\ No newline at end of file
+    return [{**first_seen[slot], "score": float(scores[slot])} for slot in order]
\ No newline at end of file
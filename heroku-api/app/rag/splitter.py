@@ -5,6 +5,7 @@ Uses recursive character splitting with overlap for context preservation
 
 import os
 import re
+from functools import lru_cache
 from typing import List
 
 import structlog
@@ -12,10 +13,31 @@ import structlog
 logger = structlog.get_logger()
 
 
+@lru_cache(maxsize=None)
+def _load_tokenizer(name: str):
+    """
+    Load the fast (Rust) tokenizer for a model, once per process.
+
+    Args:
+        name: Hugging Face model name
+
+    Returns:
+        Tokenizer, or None if it cannot be loaded (chars/4 estimate is used)
+    """
+    try:
+        from transformers import AutoTokenizer
+        return AutoTokenizer.from_pretrained(name, use_fast=True)
+    except Exception as e:
+        logger.warning("splitter.tokenizer_unavailable", tokenizer=name, error=str(e))
+        return None
+
+
 class RecursiveTextSplitter:
     """
-    Recursively split text into chunks of specified size with overlap.
-    Preserves context by maintaining overlap between chunks.
+    Split text into chunks of specified size with overlap.
+    Text is tokenized in one regex pass over all separators; pieces are then
+    packed greedily into chunks. Preserves context by maintaining overlap
+    between chunks.
     """
 
     def __init__(
@@ -23,6 +45,7 @@ class RecursiveTextSplitter:
         chunk_size: int = None,
         chunk_overlap: int = None,
         separators: List[str] = None,
+        tokenizer_name: str = None,
     ):
         """
         Initialize text splitter.
@@ -31,6 +54,7 @@ class RecursiveTextSplitter:
             chunk_size: Maximum tokens per chunk (default from env)
             chunk_overlap: Token overlap between chunks (default from env)
             separators: List of separators to try, in order
+            tokenizer_name: Model whose tokenizer counts tokens (default: embedding model)
         """
         self.chunk_size = chunk_size or int(os.getenv("CHUNK_SIZE", "512"))
         self.chunk_overlap = chunk_overlap or int(os.getenv("CHUNK_OVERLAP", "50"))
@@ -44,6 +68,18 @@ class RecursiveTextSplitter:
             "",      # Characters
         ]
 
+        # One alternation, tried in list order at each position;
+        # the capture group keeps separators in re.split output
+        non_empty = [re.escape(sep) for sep in self.separators if sep]
+        self._sep_re = re.compile("(" + "|".join(non_empty) + ")") if non_empty else None
+        # Empty separator: pieces longer than a chunk are cut into character windows
+        self._split_chars = "" in self.separators
+
+        # Count tokens with the embedding model's tokenizer so chunks fit its limit
+        self._tokenizer = _load_tokenizer(
+            tokenizer_name or os.getenv("EMBED_MODEL", "thenlper/gte-small")
+        )
+
         logger.info(
             "splitter.initialized",
             chunk_size=self.chunk_size,
@@ -64,24 +100,30 @@ class RecursiveTextSplitter:
             return []
 
         chunks = []
-        current_chunk = ""
-        sentences = self._split_by_separators(text, self.separators)
-
-        for sentence in sentences:
-            # Estimate token count (rough: 1 token ≈ 4 characters)
-            sentence_tokens = len(sentence) // 4
-
-            if len(current_chunk) // 4 + sentence_tokens <= self.chunk_size:
-                current_chunk += sentence
+        # Pieces of the chunk being built, joined once on flush
+        buffer: List[str] = []
+        buffer_tokens = 0
+
+        # All pieces are tokenized in one batch; the loop only sums integers
+        sentences = self._split_by_separators(text)
+        sentence_counts = self._count_tokens(sentences)
+
+        for sentence, sentence_tokens in zip(sentences, sentence_counts):
+            if buffer_tokens + sentence_tokens <= self.chunk_size:
+                buffer.append(sentence)
+                buffer_tokens += sentence_tokens
             else:
+                current_chunk = "".join(buffer)
                 if current_chunk:
                     chunks.append(current_chunk.strip())
 
                 # Start new chunk with overlap from previous
                 overlap_text = self._get_overlap(current_chunk)
-                current_chunk = overlap_text + sentence
+                buffer = [overlap_text, sentence]
+                buffer_tokens = self._count_tokens([overlap_text])[0] + sentence_tokens
 
         # Add final chunk
+        current_chunk = "".join(buffer)
         if current_chunk:
             chunks.append(current_chunk.strip())
 
@@ -93,45 +135,50 @@ class RecursiveTextSplitter:
 
         return chunks
 
-    def _split_by_separators(
-        self, text: str, separators: List[str]
-    ) -> List[str]:
+    def _split_by_separators(self, text: str) -> List[str]:
         """
-        Split text using the first separator that works.
+        Split text at every separator in a single regex pass.
 
         Args:
             text: Text to split
-            separators: List of separators to try
 
         Returns:
-            List of text pieces
+            List of text pieces, each ending with its separator
         """
-        if not separators:
-            return [text]
+        if self._sep_re is None:
+            tokens = [text]
+        else:
+            # Alternates piece, separator, piece, ..., piece
+            tokens = self._sep_re.split(text)
+
+        max_chars = self.chunk_size * 4
+        result = []
+        for i in range(0, len(tokens), 2):
+            piece = tokens[i] + tokens[i + 1] if i + 1 < len(tokens) else tokens[i]
+            if not piece:
+                continue
+            if self._split_chars and len(piece) > max_chars:
+                result.extend(piece[j:j + max_chars] for j in range(0, len(piece), max_chars))
+            else:
+                result.append(piece)
 
-        separator = separators[0]
-        remaining_separators = separators[1:]
+        return result
 
-        if separator:
-            splits = text.split(separator)
-        else:
-            # Empty separator means split into characters
-            splits = list(text)
-
-        # If we got good splits, return them with separator preserved
-        if len(splits) > 1:
-            result = []
-            for i, split in enumerate(splits):
-                if split:
-                    # Add separator back (except for last split)
-                    if i < len(splits) - 1 and separator:
-                        result.append(split + separator)
-                    else:
-                        result.append(split)
-            return result
-
-        # If no splits, try next separator
-        return self._split_by_separators(text, remaining_separators)
+    def _count_tokens(self, pieces: List[str]) -> List[int]:
+        """
+        Count tokens for each piece.
+
+        Args:
+            pieces: Text pieces
+
+        Returns:
+            Token count per piece (rough 1 token ≈ 4 characters without a tokenizer,
+            rounded up so short pieces are never free)
+        """
+        if self._tokenizer is None or not pieces:
+            return [(len(piece) + 3) // 4 for piece in pieces]
+
+        return self._tokenizer(pieces, add_special_tokens=False, return_length=True)["length"]
 
     def _get_overlap(self, text: str) -> str:
         """
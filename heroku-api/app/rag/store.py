@@ -4,10 +4,14 @@ Uses RediSearch for vector similarity search
 """
 
 import os
-from typing import List, Dict, Any
+from itertools import batched
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Set, Tuple
 import hashlib
 import json
+import re
 
+import numpy as np
+import orjson
 import redis
 from redis.commands.search.field import TextField, VectorField, NumericField, TagField
 from redis.commands.search.indexDefinition import IndexDefinition, IndexType
@@ -16,6 +20,63 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Chunks written per bulk HSET script call in add_chunks
+ADD_CHUNKS_BATCH_SIZE = 200
+
+# Query words for keyword search (no RediSearch syntax characters)
+_WORD_RE = re.compile(r"\w+")
+
+# Keys unlinked per UNLINK call in delete_by_document
+DELETE_BATCH_SIZE = 1000
+
+# Chunk hash fields, in the order add_chunks packs their values into ARGV
+CHUNK_FIELDS = (
+    b"chunk_text",
+    b"embedding",
+    b"document_id",
+    b"chunk_index",
+    b"document_type",
+    b"category",
+    b"meta",
+)
+
+# Metadata kept as top-level (indexed) hash fields; everything else goes in "meta"
+INDEXED_METADATA = frozenset({"document_id", "chunk_index", "document_type", "category"})
+
+# Metadata that changes on every ingest; left out of chunk ids so unchanged chunks are skipped
+VOLATILE_METADATA = frozenset({"ingested_at"})
+
+# Fields fetched for search results
+RESULT_FIELDS = ("chunk_text", "document_id", "chunk_index", "meta")
+
+# HSETs a batch of chunk hashes server-side; ARGV holds len(CHUNK_FIELDS) values per key
+_BULK_HSET_LUA = """
+local fields = {%s}
+local n = #fields
+for i = 1, #KEYS do
+    local args = {}
+    local base = (i - 1) * n
+    for j = 1, n do
+        args[2 * j - 1] = fields[j]
+        args[2 * j] = ARGV[base + j]
+    end
+    redis.call("HSET", KEYS[i], unpack(args))
+end
+return #KEYS
+""" % ", ".join(f'"{field.decode()}"' for field in CHUNK_FIELDS)
+
+# HNSW graph parameters, fixed at index creation
+HNSW_M = int(os.getenv("HNSW_M", "16"))
+HNSW_EF_CONSTRUCTION = int(os.getenv("HNSW_EF_CONSTRUCTION", "200"))
+
+# Query-time EF_RUNTIME per recall/latency profile
+EF_RUNTIME_PROFILES = {
+    "fast": 32,
+    "balanced": 100,
+    "recall_max": 400,
+}
+DEFAULT_SEARCH_PROFILE = os.getenv("HNSW_PROFILE", "balanced")
+
 
 class VectorStore:
     """
@@ -43,6 +104,9 @@ class VectorStore:
             socket_connect_timeout=5,
         )
 
+        # Loaded lazily via EVALSHA (falls back to EVAL on NOSCRIPT)
+        self._bulk_hset = self.client.register_script(_BULK_HSET_LUA)
+
         # Initialize index
         self._create_index()
 
@@ -53,30 +117,48 @@ class VectorStore:
         )
 
     def _create_index(self):
-        """Create RediSearch index if it doesn't exist"""
+        """Create RediSearch index if it doesn't exist, migrating FLAT/COSINE indexes to HNSW/IP"""
         try:
             # Check if index exists
-            self.client.ft(self.index_name).info()
-            logger.debug("vectorstore.index_exists", index_name=self.index_name)
-            return
+            info = self.client.ft(self.index_name).info()
         except redis.ResponseError:
             # Index doesn't exist, create it
-            pass
+            info = None
+
+        if info is not None:
+            algorithm = self._vector_attribute(info, "algorithm")
+            metric = self._vector_attribute(info, "distance_metric")
+            if algorithm in (None, "HNSW") and metric in (None, "IP"):
+                logger.debug("vectorstore.index_exists", index_name=self.index_name)
+                return
+
+            # Drop only the index definition; the chunk hashes are rewritten
+            # to the current layout and re-indexed
+            logger.info(
+                "vectorstore.index_migrating",
+                index_name=self.index_name,
+                from_algorithm=algorithm,
+                from_metric=metric,
+            )
+            self.client.ft(self.index_name).dropindex(delete_documents=False)
+            self._rewrite_legacy_chunks()
 
         schema = (
             TextField("chunk_text", weight=1.0),
             VectorField(
                 "embedding",
-                "FLAT",
+                "HNSW",
                 {
                     "TYPE": "FLOAT32",
                     "DIM": self.embed_dim,
-                    "DISTANCE_METRIC": "COSINE",
+                    # Vectors are unit-normalized before storage, so inner
+                    # product ranks like cosine without per-candidate norms
+                    "DISTANCE_METRIC": "IP",
+                    "M": HNSW_M,
+                    "EF_CONSTRUCTION": HNSW_EF_CONSTRUCTION,
                 },
             ),
             TextField("document_id"),
-            TextField("document_title"),
-            TextField("source"),
             NumericField("chunk_index"),
             TagField("document_type"),
             TagField("category"),
@@ -94,57 +176,235 @@ class VectorStore:
 
         logger.info("vectorstore.index_created", index_name=self.index_name)
 
-    def add_chunks(self, chunks: List[Dict[str, Any]]) -> int:
+    def _rewrite_legacy_chunks(self) -> int:
+        """
+        Bring chunk hashes written for the FLAT/COSINE index up to the current layout,
+        so the HNSW/IP index does not rank them by raw (unnormalized) inner product.
+        Embeddings are unit-normalized, document_title/source move into "meta", and
+        each chunk id is recorded in its document's chunk set so re-ingests prune it.
+
+        Returns:
+            Number of chunk hashes rewritten
+        """
+        legacy_fields = (b"embedding", b"document_id", b"document_title", b"source", b"meta")
+        prefix = f"{self.index_name}:"
+        num_rewritten = 0
+
+        for keys in batched(self.client.scan_iter(match=f"{prefix}*", count=1000), ADD_CHUNKS_BATCH_SIZE):
+            pipeline = self.client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.hmget(key, legacy_fields)
+            rows = pipeline.execute()
+
+            pipeline = self.client.pipeline(transaction=False)
+            for key, (embedding, document_id, title, source, meta) in zip(keys, rows):
+                if embedding is None or meta is not None:
+                    continue
+                pipeline.hset(key, mapping={
+                    "embedding": self._embedding_to_bytes(np.frombuffer(embedding, dtype=np.float32)),
+                    "meta": orjson.dumps({
+                        "document_title": (title or b"").decode(),
+                        "source": (source or b"").decode(),
+                    }),
+                })
+                pipeline.hdel(key, "document_title", "source")
+                if document_id is not None:
+                    chunk_id = key.decode()[len(prefix):]
+                    pipeline.sadd(self._document_chunks_key(document_id.decode()), chunk_id)
+                num_rewritten += 1
+            pipeline.execute()
+
+        logger.info(
+            "vectorstore.legacy_chunks_rewritten",
+            index_name=self.index_name,
+            num_chunks=num_rewritten,
+        )
+
+        return num_rewritten
+
+    @staticmethod
+    def _vector_attribute(info: Dict[str, Any], name: str) -> Optional[str]:
+        """Read an embedding field property (e.g. algorithm, distance_metric) from FT.INFO output"""
+        for attribute in info.get("attributes", []):
+            fields = [f.decode() if isinstance(f, bytes) else str(f) for f in attribute]
+            if "embedding" in fields and name in fields:
+                return fields[fields.index(name) + 1].upper()
+        return None
+
+    def add_chunks(self, chunks: Iterable[Dict[str, Any]], prune_stale: bool = False) -> int:
         """
         Add chunks to vector store.
+        Consumed in batches of ADD_CHUNKS_BATCH_SIZE, so a generator is never
+        materialized in full. Each document keeps a set of its stored chunk
+        ids; chunks already in it are skipped, so re-ingesting unchanged
+        content writes nothing.
 
         Args:
-            chunks: List of chunk dicts with 'text', 'embedding', 'metadata'
+            chunks: Iterable of chunk dicts with 'text', 'embedding', 'metadata'
+            prune_stale: Chunks are each document's complete set; delete stored
+                chunks of those documents that are not among them
 
         Returns:
-            Number of chunks added
+            Number of chunks written
         """
-        if not chunks:
-            return 0
+        num_written = 0
+        num_seen = 0
+        # Ids seen per document; only needed (and only kept) for pruning
+        seen_ids: Dict[str, Set[str]] = {}
+
+        for batch in batched(chunks, ADD_CHUNKS_BATCH_SIZE):
+            num_seen += len(batch)
+            num_written += self._add_batch(batch, seen_ids if prune_stale else None)
+
+        if prune_stale:
+            for document_id, keep_ids in seen_ids.items():
+                self.prune_document(document_id, keep_ids)
+
+        if num_seen:
+            logger.info(
+                "vectorstore.chunks_added",
+                num_chunks=num_written,
+                num_skipped=num_seen - num_written,
+                index_name=self.index_name,
+            )
 
-        pipeline = self.client.pipeline(transaction=False)
+        return num_written
+
+    def _add_batch(
+        self,
+        chunks: Sequence[Dict[str, Any]],
+        seen_ids: Optional[Dict[str, Set[str]]] = None,
+    ) -> int:
+        """
+        Write the chunks of one batch that are not stored yet.
 
+        Args:
+            chunks: Chunk dicts of the batch
+            seen_ids: If given, collects each chunk id under its document id
+
+        Returns:
+            Number of chunks written
+        """
+        # (chunk_id, chunk) pairs grouped per document
+        by_document: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
         for chunk in chunks:
-            chunk_id = self._generate_chunk_id(chunk)
-            key = f"{self.index_name}:{chunk_id}"
-
-            # Prepare data for Redis
-            metadata = chunk.get("metadata", {})
-            embedding_bytes = self._embedding_to_bytes(chunk["embedding"])
-
-            data = {
-                "chunk_text": chunk["text"],
-                "embedding": embedding_bytes,
-                "document_id": metadata.get("document_id", "unknown"),
-                "document_title": metadata.get("document_title", ""),
-                "source": metadata.get("source", ""),
-                "chunk_index": metadata.get("chunk_index", 0),
-                "document_type": metadata.get("document_type", "unknown"),
-                "category": metadata.get("category", "general"),
-            }
-
-            pipeline.hset(key, mapping=data)
+            document_id = str(chunk.get("metadata", {}).get("document_id", "unknown"))
+            by_document.setdefault(document_id, []).append((self._generate_chunk_id(chunk), chunk))
+
+        # One SMISMEMBER per document filters out chunks already stored
+        new_ids: Dict[str, List[str]] = {}
+        pending: List[Tuple[str, Dict[str, Any]]] = []
+        for document_id, entries in by_document.items():
+            stored = self.client.smismember(
+                self._document_chunks_key(document_id),
+                [chunk_id for chunk_id, _ in entries],
+            )
+            new_entries = [entry for entry, is_stored in zip(entries, stored) if not is_stored]
+            new_ids[document_id] = [chunk_id for chunk_id, _ in new_entries]
+            pending.extend(new_entries)
+
+        self._write_chunks(pending)
 
+        # Record ids only after their hashes are written
+        pipeline = self.client.pipeline(transaction=False)
+        for document_id, ids in new_ids.items():
+            if ids:
+                pipeline.sadd(self._document_chunks_key(document_id), *ids)
         pipeline.execute()
 
-        logger.info(
-            "vectorstore.chunks_added",
-            num_chunks=len(chunks),
-            index_name=self.index_name,
-        )
+        if seen_ids is not None:
+            for document_id, entries in by_document.items():
+                seen_ids.setdefault(document_id, set()).update(chunk_id for chunk_id, _ in entries)
+
+        return len(pending)
+
+    def chunk_ids(self, chunks: List[Dict[str, Any]]) -> List[str]:
+        """
+        Ids under which add_chunks stores the given chunks.
+
+        Args:
+            chunks: List of chunk dicts with 'text' and 'metadata'
+
+        Returns:
+            Chunk ids, in input order
+        """
+        return [self._generate_chunk_id(chunk) for chunk in chunks]
+
+    def prune_document(self, document_id: str, keep_ids: Set[str]) -> int:
+        """
+        Delete a document's stored chunks whose ids are not in keep_ids.
+
+        Args:
+            document_id: Document whose chunks are pruned
+            keep_ids: Chunk ids of the document's current version
+
+        Returns:
+            Number of chunks deleted
+        """
+        ids_key = self._document_chunks_key(document_id)
+        stale = [
+            chunk_id for chunk_id in (member.decode() for member in self.client.smembers(ids_key))
+            if chunk_id not in keep_ids
+        ]
+        if not stale:
+            return 0
+
+        self._unlink_keys([f"{self.index_name}:{chunk_id}" for chunk_id in stale])
+        self.client.srem(ids_key, *stale)
 
-        return len(chunks)
+        logger.info("vectorstore.chunks_pruned", document_id=document_id, num_chunks=len(stale))
+
+        return len(stale)
+
+    def _write_chunks(self, entries: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        HSET chunk hashes in batches via the bulk script.
+
+        Args:
+            entries: (chunk_id, chunk dict) pairs to write
+        """
+        num_fields = len(CHUNK_FIELDS)
+
+        for start in range(0, len(entries), ADD_CHUNKS_BATCH_SIZE):
+            keys = []
+            values = []
+
+            for chunk_id, chunk in entries[start:start + ADD_CHUNKS_BATCH_SIZE]:
+                keys.append(f"{self.index_name}:{chunk_id}".encode())
+
+                # Prepare data for Redis, pre-encoded in CHUNK_FIELDS order
+                metadata = chunk.get("metadata", {})
+
+                values.extend((
+                    chunk["text"].encode(),
+                    self._embedding_to_bytes(chunk["embedding"]),
+                    str(metadata.get("document_id", "unknown")).encode(),
+                    str(metadata.get("chunk_index", 0)).encode(),
+                    str(metadata.get("document_type", "unknown")).encode(),
+                    str(metadata.get("category", "general")).encode(),
+                    # Read-only context (title, source, ...) packed into one field
+                    orjson.dumps({
+                        key: value for key, value in metadata.items() if key not in INDEXED_METADATA
+                    }),
+                ))
+
+            try:
+                self._bulk_hset(keys=keys, args=values)
+            except redis.ResponseError as e:
+                # Scripting unavailable (e.g. disabled on a managed plan): HSETs are
+                # idempotent, so rewrite the whole batch through a pipeline
+                logger.warning("vectorstore.bulk_hset_fallback", error=str(e))
+                pipeline = self.client.pipeline(transaction=False)
+                for i, key in enumerate(keys):
+                    pipeline.hset(key, mapping=dict(zip(CHUNK_FIELDS, values[i * num_fields:(i + 1) * num_fields])))
+                pipeline.execute()
 
     def search(
         self,
-        query_embedding: List[float],
+        query_embedding: Sequence[float],
         top_k: int = 5,
         filters: Dict[str, Any] = None,
+        profile: str = None,
     ) -> List[Dict[str, Any]]:
         """
         Search for similar chunks using vector similarity.
@@ -153,54 +413,40 @@ class VectorStore:
             query_embedding: Query embedding vector
             top_k: Number of results to return
             filters: Optional metadata filters
+            profile: "fast", "balanced" or "recall_max" (default from env)
 
         Returns:
             List of matching chunks with scores
         """
         # Convert embedding to bytes
         query_vector = self._embedding_to_bytes(query_embedding)
+        ef_runtime = EF_RUNTIME_PROFILES[profile or DEFAULT_SEARCH_PROFILE]
 
-        # Build query
-        base_query = f"*=>[KNN {top_k} @embedding $vec AS score]"
-
-        # Add filters if provided
-        if filters:
-            filter_parts = []
-            for key, value in filters.items():
-                if key == "document_type" or key == "category":
-                    filter_parts.append(f"@{key}:{{{value}}}")
-                elif key == "document_id":
-                    filter_parts.append(f"@{key}:{value}")
-
-            if filter_parts:
-                base_query = "(" + " ".join(filter_parts) + f")=>[KNN {top_k} @embedding $vec AS score]"
+        # Build query, pre-filtered by metadata if provided
+        knn_clause = f"[KNN {top_k} @embedding $vec EF_RUNTIME $ef AS score]"
+        filter_clause = self._filter_clause(filters)
+        if filter_clause:
+            base_query = f"({filter_clause})=>{knn_clause}"
+        else:
+            base_query = f"*=>{knn_clause}"
 
         query = (
             Query(base_query)
             .sort_by("score")
-            .return_fields("chunk_text", "document_id", "document_title", "source", "chunk_index", "score")
+            .return_fields(*RESULT_FIELDS, "score")
             .dialect(2)
         )
 
         try:
             results = self.client.ft(self.index_name).search(
                 query,
-                query_params={"vec": query_vector},
+                query_params={"vec": query_vector, "ef": ef_runtime},
             )
         except redis.ResponseError as e:
             logger.error("vectorstore.search_error", error=str(e))
             return []
 
-        chunks = []
-        for doc in results.docs:
-            chunks.append({
-                "text": doc.chunk_text,
-                "document_id": doc.document_id,
-                "document_title": doc.document_title,
-                "source": doc.source,
-                "chunk_index": int(doc.chunk_index),
-                "score": float(doc.score),
-            })
+        chunks = [self._doc_to_chunk(doc) for doc in results.docs]
 
         logger.debug(
             "vectorstore.search_complete",
@@ -210,39 +456,112 @@ class VectorStore:
 
         return chunks
 
-    def delete_by_document(self, document_id: str) -> int:
+    def text_search(
+        self,
+        query_text: str,
+        top_k: int = 5,
+        filters: Dict[str, Any] = None,
+    ) -> List[Dict[str, Any]]:
         """
-        Delete all chunks for a document.
+        Keyword search over chunk_text, scored with BM25 inside RediSearch.
 
         Args:
-            document_id: Document ID to delete
+            query_text: Free-text query; any of its words may match
+            top_k: Number of results to return
+            filters: Optional metadata filters
 
         Returns:
-            Number of chunks deleted
+            List of matching chunks with BM25 scores, best first
         """
-        query = Query(f"@document_id:{document_id}").return_fields("id")
+        # Word tokens only, so no RediSearch syntax needs escaping
+        # Each distinct word once, in query order
+        terms = list(dict.fromkeys(_WORD_RE.findall(query_text.lower())))
+        if not terms:
+            return []
+
+        search_clause = "@chunk_text:(" + "|".join(terms) + ")"
+        filter_clause = self._filter_clause(filters)
+        if filter_clause:
+            search_clause = f"{search_clause} {filter_clause}"
+
+        query = (
+            Query(search_clause)
+            .scorer("BM25")
+            .with_scores()
+            .paging(0, top_k)
+            .return_fields(*RESULT_FIELDS)
+            .dialect(2)
+        )
 
         try:
             results = self.client.ft(self.index_name).search(query)
-        except redis.ResponseError:
-            return 0
+        except redis.ResponseError as e:
+            logger.error("vectorstore.text_search_error", error=str(e))
+            return []
 
-        if not results.docs:
-            return 0
+        chunks = [self._doc_to_chunk(doc) for doc in results.docs]
 
-        pipeline = self.client.pipeline(transaction=False)
-        for doc in results.docs:
-            pipeline.delete(doc.id)
+        logger.debug(
+            "vectorstore.text_search_complete",
+            num_results=len(chunks),
+            top_k=top_k,
+        )
 
-        pipeline.execute()
+        return chunks
 
-        logger.info(
-            "vectorstore.document_deleted",
-            document_id=document_id,
-            num_chunks=len(results.docs),
-        )
+    def delete_by_document(self, document_id: str) -> int:
+        """
+        Delete all chunks for a document.
+
+        Args:
+            document_id: Document ID to delete
+
+        Returns:
+            Number of chunks deleted
+        """
+        # Known chunk ids first (no search needed), then whatever the index
+        # still matches, e.g. chunks stored before the id set existed
+        ids_key = self._document_chunks_key(document_id)
+        num_deleted = self._unlink_keys([
+            f"{self.index_name}:{member.decode()}" for member in self.client.smembers(ids_key)
+        ])
+        self.client.unlink(ids_key)
+
+        # Ids only (NOCONTENT); unlinked keys leave the index, so re-query from 0
+        query = Query(f"@document_id:{document_id}").no_content().paging(0, DELETE_BATCH_SIZE)
+        while True:
+            try:
+                results = self.client.ft(self.index_name).search(query)
+            except redis.ResponseError:
+                break
+            removed = self._unlink_keys([doc.id for doc in results.docs])
+            if not removed:
+                break
+            num_deleted += removed
+
+        if num_deleted:
+            logger.info(
+                "vectorstore.document_deleted",
+                document_id=document_id,
+                num_chunks=num_deleted,
+            )
 
-        return len(results.docs)
+        return num_deleted
+
+    def _unlink_keys(self, keys: List[str]) -> int:
+        """
+        UNLINK keys in batches (memory is freed off the main thread).
+
+        Args:
+            keys: Keys to remove
+
+        Returns:
+            Number of keys that existed
+        """
+        num_removed = 0
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            num_removed += self.client.unlink(*keys[start:start + DELETE_BATCH_SIZE])
+        return num_removed
 
     def count_chunks(self) -> int:
         """
@@ -257,22 +576,68 @@ class VectorStore:
         except redis.ResponseError:
             return 0
 
+    @staticmethod
+    def _doc_to_chunk(doc: Any) -> Dict[str, Any]:
+        """Build a result dict from a search document, unpacking its meta field"""
+        meta_raw = getattr(doc, "meta", None)
+        meta = orjson.loads(meta_raw) if meta_raw else {}
+
+        return {
+            "text": doc.chunk_text,
+            "document_id": doc.document_id,
+            "document_title": meta.get("document_title", ""),
+            "source": meta.get("source", ""),
+            "chunk_index": int(doc.chunk_index),
+            "score": float(doc.score),
+        }
+
+    def _filter_clause(self, filters: Dict[str, Any] = None) -> str:
+        """Build the RediSearch metadata filter clause ("" if no usable filters)"""
+        if not filters:
+            return ""
+
+        filter_parts = []
+        for key, value in filters.items():
+            if key == "document_type" or key == "category":
+                filter_parts.append(f"@{key}:{{{value}}}")
+            elif key == "document_id":
+                filter_parts.append(f"@{key}:{value}")
+
+        return " ".join(filter_parts)
+
+    def _document_chunks_key(self, document_id: str) -> str:
+        """Redis set holding the chunk ids stored for a document"""
+        return f"doc:{self.index_name}:{document_id}:chunks"
+
     def _generate_chunk_id(self, chunk: Dict[str, Any]) -> str:
-        """Generate unique ID for chunk based on content"""
+        """
+        Generate unique ID for chunk based on content (64-bit BLAKE2b, 16 hex chars).
+        Covers the full text and the stored metadata, so an edited chunk or a
+        re-ingest with a new title, type or category gets a new id and is rewritten.
+        """
         metadata = chunk.get("metadata", {})
-        content = f"{metadata.get('document_id', '')}:{metadata.get('chunk_index', 0)}:{chunk['text'][:100]}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
-
-    def _embedding_to_bytes(self, embedding: List[float]) -> bytes:
-        """Convert embedding list to bytes for Redis"""
-        import struct
-        return struct.pack(f"{len(embedding)}f", *embedding)
-
-    def _bytes_to_embedding(self, data: bytes) -> List[float]:
-        """Convert bytes back to embedding list"""
-        import struct
-        num_floats = len(data) // 4
-        return list(struct.unpack(f"{num_floats}f", data))
+        content = f"{metadata.get('document_id', '')}:{metadata.get('chunk_index', 0)}:{chunk['text']}"
+        stored_metadata = orjson.dumps(
+            {key: value for key, value in metadata.items() if key not in VOLATILE_METADATA},
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+        return hashlib.blake2b(content.encode() + b"\0" + stored_metadata, digest_size=8).hexdigest()
+
+    def _embedding_to_bytes(self, embedding: Sequence[float]) -> bytes:
+        """
+        Convert embedding (list or array, any float dtype) to unit-length FLOAT32
+        bytes for Redis. Zero vectors (empty texts) stay zero.
+        """
+        vector = np.array(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tobytes()
+
+    def _bytes_to_embedding(self, data: bytes) -> np.ndarray:
+        """Convert FLOAT32 bytes back to an embedding array (read-only view of data)"""
+        return np.frombuffer(data, dtype=np.float32)
 
     def close(self):
         """Close Redis connection"""
@@ -3,19 +3,36 @@ Admin endpoints for system management
 7 endpoints: stats, users, permissions, flagged queries, audit log, model retrain, GDPR deletion
 """
 
+import asyncio
 import os
-from datetime import datetime, timedelta
-from typing import List, Optional
+import time
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Header
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import delete, select, func, or_, desc, text
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
-from app.database.connection import get_session
-from app.database.models import User, QueryLog, QueryFeedback, ComplianceDocument, SystemAuditLog
+from app.database.connection import (
+    async_session_factory,
+    get_session,
+    get_readonly_session,
+    readonly_session_factory,
+    refresh_admin_stats,
+)
+from app.database.models import (
+    ADMIN_STATS_VIEW,
+    User,
+    QueryLog,
+    QueryFeedback,
+    ComplianceDocument,
+    SystemAuditLog,
+    hash_bytes,
+)
 from app.models.exceptions import InsufficientPermissionsException
 from app.rag.ingest import ingest_document
 
@@ -28,6 +45,11 @@ if not ADMIN_TOKEN:
     logger.critical("admin.token_not_set")
     raise ValueError("ADMIN_TOKEN environment variable must be set for security")
 
+# /admin/stats is memoized in-process; aggregates change slowly
+_STATS_TTL = 30.0
+_stats_cache: Optional[Tuple[float, "SystemStatsResponse"]] = None
+_stats_lock = asyncio.Lock()
+
 
 async def verify_admin(x_admin_token: str = Header(...)) -> None:
     """
@@ -115,102 +137,99 @@ class ModelRetrainRequest(BaseModel):
     document_id: str = Field(..., description="Unique document identifier")
     document_title: str = Field(..., description="Document title")
     document_type: str = Field(..., description="Type: policy, guideline, regulation")
+    category: str = Field("compliance", description="Category for filtering")
+    effective_date: Optional[datetime] = Field(None, description="Date the document takes effect (default: now)")
     force_reindex: bool = Field(False, description="Force reindex if already exists")
 
 
 @router.get("/stats", response_model=SystemStatsResponse)
 async def get_system_stats(
-    session: AsyncSession = Depends(get_session),
+    refresh: bool = False,
     _: None = Depends(verify_admin),
 ):
     """
     Get system-wide statistics and analytics.
     Requires admin token in X-Admin-Token header.
+
+    Results are cached for _STATS_TTL seconds and the aggregates come from a
+    periodically refreshed materialized view; pass ?refresh=true to refresh
+    the view and recompute.
     """
-    logger.info("admin.stats.requested")
+    global _stats_cache
 
-    # Calculate 7 days ago
-    seven_days_ago = datetime.utcnow() - timedelta(days=7)
+    logger.info("admin.stats.requested", refresh=refresh)
 
-    # 1. User statistics
-    total_users_result = await session.execute(select(func.count(User.id)))
-    total_users = total_users_result.scalar()
+    if not refresh and _stats_cache and time.monotonic() - _stats_cache[0] < _STATS_TTL:
+        return _stats_cache[1]
 
-    active_users_result = await session.execute(
-        select(func.count(User.id)).where(User.last_query_at >= seven_days_ago)
-    )
-    active_users_7d = active_users_result.scalar() or 0
+    async with _stats_lock:
+        # Another request may have refreshed the cache while we waited
+        if not refresh and _stats_cache and time.monotonic() - _stats_cache[0] < _STATS_TTL:
+            return _stats_cache[1]
 
-    # 2. Query statistics
-    total_queries_result = await session.execute(select(func.count(QueryLog.id)))
-    total_queries = total_queries_result.scalar() or 0
+        if refresh:
+            await refresh_admin_stats()
 
-    queries_today_result = await session.execute(
-        select(func.count(QueryLog.id)).where(
-            QueryLog.created_at >= datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        )
-    )
-    queries_today = queries_today_result.scalar() or 0
+        stats = await _compute_system_stats()
+        _stats_cache = (time.monotonic(), stats)
+        return stats
 
-    # 3. Average confidence
-    avg_confidence_result = await session.execute(
-        select(func.avg(QueryLog.confidence_score))
-    )
-    avg_confidence = avg_confidence_result.scalar() or 0.0
 
-    # 4. Feedback statistics
-    total_feedback_result = await session.execute(select(func.count(QueryFeedback.id)))
-    total_feedback = total_feedback_result.scalar() or 0
+async def _compute_system_stats() -> SystemStatsResponse:
+    """
+    Run the queries behind /admin/stats concurrently.
 
-    avg_rating_result = await session.execute(
-        select(func.avg(QueryFeedback.overall_rating))
-    )
-    avg_rating = avg_rating_result.scalar() or 0.0
-
-    # 5. Flagged queries
-    flagged_result = await session.execute(
-        select(func.count(QueryLog.id)).where(
-            or_(
-                QueryLog.is_flagged == True,
-                QueryLog.confidence_score < 0.5,
+    Each query gets its own pooled session; an AsyncSession must never be
+    shared between concurrently running coroutines.
+    """
+
+    async def fetch_aggregates():
+        # Precomputed by the materialized view (see refresh_admin_stats)
+        async with readonly_session_factory() as session:
+            result = await session.execute(
+                text(
+                    "SELECT total_users, active_users_7d, total_queries, queries_today, "
+                    "avg_confidence_score, total_feedback, avg_overall_rating, "
+                    f"flagged_queries, compliance_documents FROM {ADMIN_STATS_VIEW}"
+                )
             )
-        )
-    )
-    flagged_queries = flagged_result.scalar() or 0
+            return result.mappings().one()
 
-    # 6. Compliance documents
-    docs_result = await session.execute(select(func.count(ComplianceDocument.id)))
-    compliance_docs = docs_result.scalar() or 0
+    async def fetch_oldest_log():
+        # System uptime (approximate from oldest audit log)
+        async with readonly_session_factory() as session:
+            result = await session.execute(
+                select(SystemAuditLog.created_at).order_by(SystemAuditLog.created_at.asc()).limit(1)
+            )
+            return result.scalar_one_or_none()
+
+    stats, oldest_log = await asyncio.gather(fetch_aggregates(), fetch_oldest_log())
 
-    # 7. System uptime (approximate from oldest audit log)
-    oldest_log_result = await session.execute(
-        select(SystemAuditLog.timestamp).order_by(SystemAuditLog.timestamp.asc()).limit(1)
-    )
-    oldest_log = oldest_log_result.scalar_one_or_none()
     uptime_hours = 0.0
     if oldest_log:
-        uptime_hours = (datetime.utcnow() - oldest_log).total_seconds() / 3600
+        # created_at is timestamptz, so compare against an aware "now"
+        uptime_hours = (datetime.now(timezone.utc) - oldest_log).total_seconds() / 3600
 
     return SystemStatsResponse(
-        total_users=total_users,
-        active_users_7d=active_users_7d,
-        total_queries=total_queries,
-        queries_today=queries_today,
-        avg_confidence_score=round(avg_confidence, 3),
-        total_feedback=total_feedback,
-        avg_overall_rating=round(avg_rating, 2),
-        flagged_queries=flagged_queries,
-        compliance_documents=compliance_docs,
+        total_users=stats["total_users"],
+        active_users_7d=stats["active_users_7d"],
+        total_queries=stats["total_queries"],
+        queries_today=stats["queries_today"],
+        avg_confidence_score=round(stats["avg_confidence_score"] or 0.0, 3),
+        total_feedback=stats["total_feedback"],
+        avg_overall_rating=round(stats["avg_overall_rating"] or 0.0, 2),
+        flagged_queries=stats["flagged_queries"],
+        compliance_documents=stats["compliance_documents"],
         system_uptime_hours=round(uptime_hours, 1),
     )
 
 
-@router.get("/users", response_model=List[UserListItem])
+@router.get("/users", response_model=List[UserListItem], response_class=ORJSONResponse)
 async def list_users(
     limit: int = 50,
     offset: int = 0,
     role: Optional[str] = None,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_readonly_session),
     _: None = Depends(verify_admin),
 ):
     """
@@ -219,29 +238,30 @@ async def list_users(
     """
     logger.info("admin.users.list", limit=limit, offset=offset, role=role)
 
-    query = select(User).order_by(User.created_at.desc()).limit(limit).offset(offset)
+    # Plain column rows, no ORM identity map; orjson encodes UUIDs and
+    # datetimes itself, so rows go out without per-item model validation
+    query = (
+        select(
+            User.id.label("user_id"),
+            User.discord_id,
+            User.discord_username,
+            User.role,
+            User.total_queries,
+            User.queries_today,
+            User.last_query_at,
+            User.is_banned,
+            User.created_at,
+        )
+        .order_by(User.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
 
     if role:
         query = query.where(User.role == role)
 
     result = await session.execute(query)
-    users = result.scalars().all()
-
-    user_list = []
-    for user in users:
-        user_list.append(UserListItem(
-            user_id=str(user.id),
-            discord_id=user.discord_id,
-            discord_username=user.discord_username,
-            role=user.role,
-            total_queries=user.total_queries,
-            queries_today=user.queries_today,
-            last_query_at=user.last_query_at.isoformat() if user.last_query_at else None,
-            is_banned=user.is_banned,
-            created_at=user.created_at.isoformat(),
-        ))
-
-    return user_list
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.put("/users/{user_id}")
@@ -280,21 +300,21 @@ async def update_user_permissions(
 
         if request.is_banned and request.ban_reason:
             user.ban_reason = request.ban_reason
-            user.banned_at = datetime.utcnow()
+            user.banned_at = datetime.now(timezone.utc)
         elif not request.is_banned:
             user.ban_reason = None
             user.banned_at = None
 
-    user.updated_at = datetime.utcnow()
-
-    await session.commit()
-
-    # Create audit log
+    # Audit entry commits atomically with the update
     audit_log = SystemAuditLog(
         event_type="user_permissions_updated",
+        event_category="admin",
         actor_id=None,  # Admin action
-        target_resource=f"user:{user_id}",
-        action_details={
+        actor_type="api",
+        target_type="user",
+        target_id=user.id,
+        description=f"Updated user {user_id}: {', '.join(updated_fields) or 'no changes'}",
+        event_metadata={
             "updates": updated_fields,
             "new_role": user.role,
             "is_banned": user.is_banned,
@@ -312,11 +332,11 @@ async def update_user_permissions(
     }
 
 
-@router.get("/queries/flagged", response_model=List[FlaggedQueryResponse])
+@router.get("/queries/flagged", response_model=List[FlaggedQueryResponse], response_class=ORJSONResponse)
 async def get_flagged_queries(
     limit: int = 50,
     include_escalated: bool = True,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_readonly_session),
     _: None = Depends(verify_admin),
 ):
     """
@@ -325,50 +345,44 @@ async def get_flagged_queries(
     """
     logger.info("admin.queries.flagged", limit=limit, include_escalated=include_escalated)
 
-    # Build query for flagged queries
+    # Only add the escalation predicate when requested, so the plain case
+    # matches the idx_query_flagged_recent partial index
+    conditions = [
+        QueryLog.is_flagged == True,
+        QueryLog.confidence_score < 0.5,
+    ]
+    if include_escalated:
+        conditions.append(QueryFeedback.escalated == True)
+
     query = (
-        select(QueryLog, User, QueryFeedback)
+        select(
+            QueryLog.id.label("query_id"),
+            User.id.label("user_id"),
+            User.discord_username,
+            QueryLog.query_text,
+            func.left(QueryLog.response_text, 1000).label("response_text"),  # Truncate for admin view
+            QueryLog.confidence_score,
+            QueryLog.risk_level,
+            func.coalesce(QueryFeedback.escalated, False).label("is_escalated"),
+            QueryFeedback.feedback_text,
+            QueryLog.created_at,
+        )
         .join(User, User.id == QueryLog.user_id)
         .outerjoin(QueryFeedback, QueryFeedback.query_id == QueryLog.id)
-        .where(
-            or_(
-                QueryLog.is_flagged == True,
-                QueryLog.confidence_score < 0.5,
-                and_(
-                    QueryFeedback.escalated == True if include_escalated else False,
-                )
-            )
-        )
+        .where(or_(*conditions))
         .order_by(desc(QueryLog.created_at))
         .limit(limit)
     )
 
     result = await session.execute(query)
-    rows = result.all()
-
-    flagged_list = []
-    for query_log, user, feedback in rows:
-        flagged_list.append(FlaggedQueryResponse(
-            query_id=str(query_log.id),
-            user_id=str(user.id),
-            discord_username=user.discord_username,
-            query_text=query_log.query_text,
-            response_text=query_log.response_text[:1000],  # Truncate for admin view
-            confidence_score=query_log.confidence_score,
-            risk_level=query_log.risk_level,
-            is_escalated=feedback.escalated if feedback else False,
-            feedback_text=feedback.feedback_text if feedback else None,
-            created_at=query_log.created_at.isoformat(),
-        ))
-
-    return flagged_list
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.get("/audit-log", response_model=List[AuditLogResponse])
 async def get_audit_log(
     limit: int = 100,
     event_type: Optional[str] = None,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_readonly_session),
     _: None = Depends(verify_admin),
 ):
     """
@@ -383,7 +397,7 @@ async def get_audit_log(
     query = (
         select(SystemAuditLog)
         .options(selectinload(SystemAuditLog.actor))
-        .order_by(desc(SystemAuditLog.timestamp))
+        .order_by(desc(SystemAuditLog.created_at))
         .limit(limit)
     )
 
@@ -403,17 +417,18 @@ async def get_audit_log(
             event_type=log.event_type,
             actor_id=str(log.actor_id) if log.actor_id else None,
             actor_username=actor_username,
-            target_resource=log.target_resource,
-            action_details=log.action_details,
-            timestamp=log.timestamp.isoformat(),
+            target_resource=f"{log.target_type}:{log.target_id}" if log.target_type else None,
+            action_details=log.event_metadata,
+            timestamp=log.created_at.isoformat(),
         ))
 
     return audit_list
 
 
-@router.post("/model/retrain")
+@router.post("/model/retrain", status_code=202)
 async def trigger_model_retrain(
     request: ModelRetrainRequest,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     _: None = Depends(verify_admin),
 ):
@@ -421,6 +436,9 @@ async def trigger_model_retrain(
     Trigger model retraining by ingesting a new compliance document.
     Downloads PDF, extracts text, chunks it, embeds, and stores in Redis.
     Requires admin token in X-Admin-Token header.
+
+    Returns 202 once the document is recorded; ingestion runs as a
+    background task and its outcome is written to the audit log.
     """
     logger.info(
         "admin.model.retrain",
@@ -435,77 +453,170 @@ async def trigger_model_retrain(
     )
     existing_doc = existing.scalar_one_or_none()
 
-    if existing_doc and not request.force_reindex:
+    # Inactive documents never finished ingesting, so they can be retried as-is
+    if existing_doc and existing_doc.is_active and not request.force_reindex:
         raise HTTPException(
             status_code=409,
             detail=f"Document {request.document_id} already exists. Use force_reindex=true to reindex.",
         )
 
-    try:
-        # Ingest document (downloads, extracts, chunks, embeds, stores in Redis)
-        await ingest_document(
-            source_url=request.document_url,
+    # Record the document before ingesting; new documents stay inactive
+    # until _ingest_and_finalize has stored their chunks and content.
+    # The version is bumped there, once the new content is known to differ.
+    if existing_doc:
+        existing_doc.title = request.document_title
+        existing_doc.document_type = request.document_type
+        existing_doc.category = request.category
+        existing_doc.source_url = request.document_url
+        if request.effective_date is not None:
+            existing_doc.effective_date = request.effective_date
+        doc = existing_doc
+    else:
+        doc = ComplianceDocument(
             document_id=request.document_id,
-            document_title=request.document_title,
+            title=request.document_title,
+            document_type=request.document_type,
+            category=request.category,
+            content="",
+            source_hash=hash_bytes(""),
+            effective_date=request.effective_date or datetime.now(timezone.utc),
+            source_url=request.document_url,
+            version=1,
+            is_active=False,
         )
+        session.add(doc)
+        await session.flush()
 
-        # Create or update document record
-        if existing_doc:
-            existing_doc.version += 1
-            existing_doc.last_indexed_at = datetime.utcnow()
-            existing_doc.updated_at = datetime.utcnow()
-            doc = existing_doc
-        else:
-            doc = ComplianceDocument(
-                document_id=request.document_id,
-                title=request.document_title,
-                document_type=request.document_type,
-                source_url=request.document_url,
-                version=1,
-                is_active=True,
-                last_indexed_at=datetime.utcnow(),
-            )
-            session.add(doc)
+    audit_log = SystemAuditLog(
+        event_type="model_retrain_started",
+        event_category="admin",
+        actor_id=None,  # Admin action
+        actor_type="api",
+        target_type="document",
+        target_id=doc.id,
+        description=f"Ingestion of document {request.document_id} started",
+        event_metadata={
+            "document_id": request.document_id,
+            "document_title": request.document_title,
+            "document_url": request.document_url,
+            "version": doc.version,
+            "force_reindex": request.force_reindex,
+        },
+    )
+    session.add(audit_log)
+    # Commit now so the row exists before the background task looks it up
+    await session.commit()
 
-        await session.commit()
-        await session.refresh(doc)
+    background_tasks.add_task(
+        _ingest_and_finalize,
+        document_id=request.document_id,
+        document_url=request.document_url,
+        document_title=request.document_title,
+        document_type=request.document_type,
+        category=request.category,
+    )
 
-        # Create audit log
-        audit_log = SystemAuditLog(
-            event_type="model_retrained",
-            actor_id=None,  # Admin action
-            target_resource=f"document:{request.document_id}",
-            action_details={
-                "document_title": request.document_title,
-                "document_url": request.document_url,
-                "version": doc.version,
-                "force_reindex": request.force_reindex,
-            },
-        )
-        session.add(audit_log)
-        await session.commit()
+    logger.info(
+        "admin.model.retrain.accepted",
+        document_id=request.document_id,
+        version=doc.version,
+    )
 
-        logger.info(
-            "admin.model.retrain.success",
-            document_id=request.document_id,
-            version=doc.version,
-        )
+    return {
+        "status": "accepted",
+        "document_id": request.document_id,
+        "version": doc.version,
+        "message": "Document ingestion started",
+    }
 
-        return {
-            "status": "success",
-            "document_id": str(doc.id),
-            "document_title": doc.title,
-            "version": doc.version,
-            "message": "Document ingested and model updated successfully",
-        }
 
+async def _ingest_and_finalize(
+    document_id: str,
+    document_url: str,
+    document_title: str,
+    document_type: str,
+    category: str,
+) -> None:
+    """
+    Ingest a document after the retrain request has returned.
+
+    Runs with its own session: the request session is closed by the time
+    background tasks start. On success the document's content is stored, it
+    is marked active and, if it was already active, its version is bumped.
+    Unchanged sources and failures leave the version alone. Every outcome
+    gets an audit entry.
+    """
+    content = None
+    try:
+        # Ingest document (downloads, extracts, chunks, embeds, stores in Redis)
+        result = await ingest_document(
+            source_url=document_url,
+            document_id=document_id,
+            document_title=document_title,
+            document_type=document_type,
+            category=category,
+        )
     except Exception as e:
-        logger.error(
-            "admin.model.retrain.failed",
-            error=str(e),
-            document_id=request.document_id,
+        logger.error("admin.model.retrain.failed", error=str(e), document_id=document_id)
+        ingest_status = "error"
+        details = {"document_url": document_url, "error": str(e)}
+    else:
+        ingest_status = result.get("status")
+        content = result.pop("content", None)
+        details = {
+            "document_title": document_title,
+            "document_url": document_url,
+            "ingest_status": ingest_status,
+            "chunks_added": result.get("chunks_added", 0),
+        }
+        if ingest_status == "failed":
+            details["reason"] = result.get("reason")
+
+    async with async_session_factory() as session:
+        result_doc = await session.execute(
+            select(ComplianceDocument).where(ComplianceDocument.document_id == document_id)
         )
-        raise HTTPException(status_code=500, detail=f"Document ingestion failed: {str(e)}")
+        doc = result_doc.scalar_one_or_none()
+
+        if ingest_status == "success":
+            event_type, severity = "model_retrained", "info"
+            description = f"Document {document_id} ingested"
+            if doc is not None:
+                if doc.is_active:
+                    doc.version += 1
+                doc.is_active = True
+                doc.content = content or ""
+                doc.source_hash = hash_bytes(doc.content)
+        elif ingest_status == "unchanged":
+            # Chunks from the last successful ingest are still in place
+            event_type, severity = "model_retrain_unchanged", "info"
+            description = f"Document {document_id} unchanged since last ingest"
+            if doc is not None:
+                doc.is_active = True
+        else:
+            # The document stays inactive, so the request can simply be retried
+            event_type, severity = "model_retrain_failed", "error"
+            description = f"Ingestion of document {document_id} failed"
+
+        session.add(SystemAuditLog(
+            event_type=event_type,
+            event_category="admin",
+            severity=severity,
+            actor_id=None,  # Admin action
+            actor_type="system",
+            target_type="document",
+            target_id=doc.id if doc else None,
+            description=description,
+            event_metadata={
+                **details,
+                "document_id": document_id,
+                "version": doc.version if doc else None,
+            },
+        ))
+        await session.commit()
+
+    if event_type != "model_retrain_failed":
+        logger.info("admin.model.retrain.success", document_id=document_id, ingest_status=ingest_status)
 
 
 @router.post("/users/{user_id}/gdpr-deletion-token")
@@ -595,25 +706,27 @@ async def gdpr_delete_user_data(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Count data to be deleted
-    queries_result = await session.execute(
-        select(func.count(QueryLog.id)).where(QueryLog.user_id == user.id)
+    # Each DELETE ... RETURNING runs as a CTE and is counted server-side,
+    # so deleting and counting is one round-trip per table.
+    # Feedback goes first (foreign key constraint).
+    deleted_feedback = (
+        delete(QueryFeedback)
+        .where(QueryFeedback.user_id == user.id)
+        .returning(QueryFeedback.id)
+        .cte("deleted_feedback")
     )
-    query_count = queries_result.scalar() or 0
-
-    feedback_result = await session.execute(
-        select(func.count(QueryFeedback.id)).where(QueryFeedback.user_id == user.id)
+    feedback_count = await session.scalar(
+        select(func.count()).select_from(deleted_feedback)
     )
-    feedback_count = feedback_result.scalar() or 0
 
-    # Delete feedback first (foreign key constraint)
-    await session.execute(
-        QueryFeedback.__table__.delete().where(QueryFeedback.user_id == user.id)
+    deleted_queries = (
+        delete(QueryLog)
+        .where(QueryLog.user_id == user.id)
+        .returning(QueryLog.id)
+        .cte("deleted_queries")
     )
-
-    # Delete queries
-    await session.execute(
-        QueryLog.__table__.delete().where(QueryLog.user_id == user.id)
+    query_count = await session.scalar(
+        select(func.count()).select_from(deleted_queries)
     )
 
     # Reset user statistics
@@ -621,14 +734,17 @@ async def gdpr_delete_user_data(
     user.queries_today = 0
     user.last_query_at = None
 
-    await session.commit()
-
-    # Create audit log
+    # Create audit log; it commits together with the deletes below
     audit_log = SystemAuditLog(
         event_type="gdpr_data_deletion",
+        event_category="admin",
+        severity="warning",
         actor_id=None,  # Admin action
-        target_resource=f"user:{user_id}",
-        action_details={
+        actor_type="api",
+        target_type="user",
+        target_id=user.id,
+        description=f"Deleted all queries and feedback for user {user_id}",
+        event_metadata={
             "queries_deleted": query_count,
             "feedback_deleted": feedback_count,
             "discord_id": user.discord_id,
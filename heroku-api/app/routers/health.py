@@ -3,19 +3,21 @@ Health check endpoints for monitoring and observability
 5 endpoints: basic, detailed, ready, live, metrics
 """
 
+import asyncio
 import os
 import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Dict, Tuple
 
 from fastapi import APIRouter, Response
 from pydantic import BaseModel
+from sqlalchemy import text
 import structlog
 import psutil
 
-from app.database.connection import engine
+from app.database.connection import probe_engine
 from app.services.grok4_rag_service import health_check as grok4_health
-from app.rag.store import VectorStore
+from app.rag.retriever import get_vector_store
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/health", tags=["health"])
@@ -23,6 +25,16 @@ router = APIRouter(prefix="/health", tags=["health"])
 # Track startup time
 _startup_time = time.time()
 
+ENVIRONMENT = os.getenv("ENVIRONMENT", "unknown")
+
+# /metrics serves CPU and chunk-count samples up to this many seconds old
+METRICS_TTL = 5.0
+_metrics_cache: Dict[str, Any] = {"t": 0.0, "cpu": 0.0, "chunks": 0}
+
+# cpu_percent(interval=None) reports usage since the previous call; the
+# first call has no baseline, so take it at import
+psutil.cpu_percent(interval=None)
+
 
 class HealthResponse(BaseModel):
     """Basic health response"""
@@ -53,66 +65,41 @@ async def health_basic():
     }
 
 
-@router.get("/detailed", response_model=DetailedHealthResponse)
-async def health_detailed():
-    """
-    Detailed health check with all components.
-    Checks database, Grok-4, Redis, and system resources.
-    """
-    components = {}
-    overall_status = "healthy"
-
-    # 1. Database check
+async def _check_db() -> Tuple[str, Dict[str, Any], bool]:
+    """Database connectivity check"""
     try:
-        async with engine.connect() as conn:
-            await conn.execute("SELECT 1")
-        components["database"] = {
-            "status": "healthy",
-            "type": "postgresql",
-        }
+        async with probe_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return "database", {"status": "healthy", "type": "postgresql"}, False
     except Exception as e:
-        components["database"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
-        overall_status = "degraded"
+        return "database", {"status": "unhealthy", "error": str(e)}, True
 
-    # 2. Grok-4 API check
+
+async def _check_grok4() -> Tuple[str, Dict[str, Any], bool]:
+    """Grok-4 API availability check"""
     try:
         grok4_available = await grok4_health()
-        components["grok4"] = {
+        return "grok4", {
             "status": "healthy" if grok4_available else "unhealthy",
             "model": "grok-4-latest",
-        }
-        if not grok4_available:
-            overall_status = "degraded"
+        }, not grok4_available
     except Exception as e:
-        components["grok4"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
-        overall_status = "degraded"
+        return "grok4", {"status": "unhealthy", "error": str(e)}, True
 
-    # 3. Redis vector store check
-    try:
-        vector_store = VectorStore()
-        chunk_count = vector_store.count_chunks()
-        vector_store.close()
 
-        components["redis"] = {
-            "status": "healthy",
-            "chunks_stored": chunk_count,
-        }
+async def _check_redis() -> Tuple[str, Dict[str, Any], bool]:
+    """Redis vector store check (sync client, run in a worker thread)"""
+    try:
+        chunk_count = await asyncio.to_thread(get_vector_store().count_chunks)
+        return "redis", {"status": "healthy", "chunks_stored": chunk_count}, False
     except Exception as e:
-        components["redis"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
-        overall_status = "degraded"
+        return "redis", {"status": "unhealthy", "error": str(e)}, True
 
-    # 4. System resources
+
+async def _check_system() -> Tuple[str, Dict[str, Any], bool]:
+    """System resource usage; degraded when any resource is above 90%"""
     try:
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage("/")
 
@@ -123,16 +110,41 @@ async def health_detailed():
             "disk_percent": disk.percent,
             "disk_free_gb": disk.free / (1024 * 1024 * 1024),
         }
+        constrained = cpu_percent > 90 or memory.percent > 90 or disk.percent > 90
+        return "system", system_info, constrained
+    except Exception as e:
+        return "system", {"error": str(e)}, False
 
-        # Warn if resources are constrained
-        if cpu_percent > 90 or memory.percent > 90 or disk.percent > 90:
-            overall_status = "degraded"
 
-    except Exception as e:
-        system_info = {"error": str(e)}
+@router.get("/detailed", response_model=DetailedHealthResponse)
+async def health_detailed():
+    """
+    Detailed health check with all components.
+    Checks database, Grok-4, Redis, and system resources concurrently.
+    """
+    results = await asyncio.gather(
+        _check_db(),
+        _check_grok4(),
+        _check_redis(),
+        _check_system(),
+        return_exceptions=True,
+    )
+
+    components = {}
+    system_info = {}
+    degraded = False
+    for name, result in zip(("database", "grok4", "redis", "system"), results):
+        if isinstance(result, BaseException):
+            result = (name, {"status": "unhealthy", "error": str(result)}, True)
+        _, info, is_degraded = result
+        if name == "system":
+            system_info = info
+        else:
+            components[name] = info
+        degraded = degraded or is_degraded
 
     return {
-        "status": overall_status,
+        "status": "degraded" if degraded else "healthy",
         "timestamp": datetime.utcnow().isoformat(),
         "uptime_seconds": time.time() - _startup_time,
         "components": components,
@@ -149,8 +161,8 @@ async def health_ready(response: Response):
     # Check critical components
     try:
         # Database must be accessible
-        async with engine.connect() as conn:
-            await conn.execute("SELECT 1")
+        async with probe_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
 
         # Grok-4 should be available
         grok4_available = await grok4_health()
@@ -186,15 +198,20 @@ async def health_metrics():
     Returns application and system metrics.
     """
     try:
+        # CPU and chunk count are sampled at most once per METRICS_TTL
+        now = time.monotonic()
+        if now - _metrics_cache["t"] > METRICS_TTL:
+            _metrics_cache["cpu"] = psutil.cpu_percent(interval=None)
+            _metrics_cache["chunks"] = await asyncio.to_thread(get_vector_store().count_chunks)
+            _metrics_cache["t"] = now
+
         # System metrics
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        cpu_percent = _metrics_cache["cpu"]
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage("/")
 
         # Application metrics
-        vector_store = VectorStore()
-        chunk_count = vector_store.count_chunks()
-        vector_store.close()
+        chunk_count = _metrics_cache["chunks"]
 
         metrics = {
             "system": {
@@ -208,7 +225,7 @@ async def health_metrics():
             },
             "application": {
                 "uptime_seconds": time.time() - _startup_time,
-                "environment": os.getenv("ENVIRONMENT", "unknown"),
+                "environment": ENVIRONMENT,
                 "rag_chunks_stored": chunk_count,
                 "python_version": os.sys.version.split()[0],
             },
@@ -3,19 +3,20 @@ Main compliance query endpoints
 3 endpoints: query, feedback, history
 """
 
-import hashlib
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import select, func
+from sqlalchemy import select, func, lambda_stmt, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
-from app.database.connection import get_session
-from app.database.models import User, QueryLog, QueryFeedback
+from app.database.connection import get_session, get_readonly_session
+from app.database.models import User, QueryLog, QueryFeedback, hash_bytes
 from app.services.grok4_rag_service import ask_compliance
 from app.models.exceptions import InvalidQueryException, RateLimitExceededException
 
@@ -92,6 +93,11 @@ class FeedbackRequest(BaseModel):
     escalated: bool = False
 
 
+class BulkFeedbackRequest(BaseModel):
+    """Batch of feedback submissions"""
+    items: List[FeedbackRequest] = Field(..., min_length=1, max_length=100)
+
+
 class QueryHistoryResponse(BaseModel):
     """Query history item"""
     query_id: str
@@ -184,14 +190,17 @@ async def process_query(
         )
 
     # 4. Query deduplication check
-    query_hash = hashlib.sha256(request.query.encode()).hexdigest()
-    recent_duplicate = await session.execute(
-        select(QueryLog)
-        .where(QueryLog.user_id == user.id)
+    query_hash = hash_bytes(request.query)
+    user_id = user.id
+    dedup_cutoff = datetime.utcnow() - timedelta(minutes=5)
+    # lambda_stmt caches the construct itself; closure values become bound parameters
+    recent_duplicate = await session.execute(lambda_stmt(
+        lambda: select(QueryLog)
+        .where(QueryLog.user_id == user_id)
         .where(QueryLog.query_hash == query_hash)
-        .where(QueryLog.created_at > datetime.utcnow() - timedelta(minutes=5))
+        .where(QueryLog.created_at > dedup_cutoff)
         .limit(1)
-    )
+    ))
     duplicate = recent_duplicate.scalar_one_or_none()
 
     if duplicate:
@@ -240,7 +249,7 @@ async def process_query(
     # 8. Update user stats
     user.total_queries += 1
     user.queries_today += 1
-    user.last_query_at = datetime.utcnow()
+    user.last_query_at = datetime.now(timezone.utc)
 
     await session.commit()
     await session.refresh(query_log)
@@ -271,8 +280,78 @@ async def submit_feedback(
     """
     Submit feedback for a query response.
     """
+    feedback = await _create_feedback(session, request)
+    await session.commit()
+
+    logger.info(
+        "feedback.submitted",
+        query_id=request.query_id,
+        overall_rating=request.overall_rating,
+        escalated=request.escalated,
+    )
+
+    return {"status": "success", "feedback_id": str(feedback.id)}
+
+
+@router.post("/feedback/bulk")
+async def submit_feedback_bulk(
+    request: BulkFeedbackRequest,
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Submit a batch of feedback items in one request.
+    Each item succeeds or fails independently (one savepoint per item);
+    results are returned in order.
+    """
+    results = []
+    seen_query_ids = set()
+
+    for item in request.items:
+        if item.query_id in seen_query_ids:
+            results.append({"status": "error", "status_code": 409, "detail": "Feedback already submitted"})
+            continue
+
+        try:
+            # A failed item rolls back to its savepoint, keeping the session usable
+            async with session.begin_nested():
+                feedback = await _create_feedback(session, item)
+        except HTTPException as e:
+            results.append({"status": "error", "status_code": e.status_code, "detail": e.detail})
+            continue
+        except IntegrityError:
+            # Feedback for this query was inserted concurrently
+            results.append({"status": "error", "status_code": 409, "detail": "Feedback already submitted"})
+            continue
+
+        seen_query_ids.add(item.query_id)
+        results.append({"status": "success", "feedback_id": str(feedback.id)})
+
+    await session.commit()
+
+    logger.info(
+        "feedback.bulk_submitted",
+        num_items=len(request.items),
+        num_accepted=len(seen_query_ids),
+    )
+
+    return {"results": results}
+
+
+async def _create_feedback(session: AsyncSession, request: FeedbackRequest) -> QueryFeedback:
+    """
+    Validate and stage a feedback row (caller commits).
+
+    Raises:
+        HTTPException: 400 if query_id is not a UUID, 404 if the query doesn't
+            exist, 409 if feedback already exists
+    """
+    try:
+        query_id = UUID(request.query_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid query_id")
+
     # 1. Get query log
-    query_log = await session.get(QueryLog, UUID(request.query_id))
+    query_log = await session.get(QueryLog, query_id)
     if not query_log:
         raise HTTPException(status_code=404, detail="Query not found")
 
@@ -297,23 +376,16 @@ async def submit_feedback(
     )
 
     session.add(feedback)
-    await session.commit()
-
-    logger.info(
-        "feedback.submitted",
-        query_id=request.query_id,
-        overall_rating=request.overall_rating,
-        escalated=request.escalated,
-    )
+    await session.flush()
 
-    return {"status": "success", "feedback_id": str(feedback.id)}
+    return feedback
 
 
 @router.get("/history/{user_id}", response_model=List[QueryHistoryResponse])
 async def get_query_history(
     user_id: str,
     limit: int = 20,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_readonly_session),
 ):
     """
     Get query history for a user.
@@ -394,23 +466,29 @@ async def _check_rate_limit(user_id: str):
 
 
 async def _get_or_create_user(session: AsyncSession, discord_id: str) -> User:
-    """Get existing user or create new one"""
-    result = await session.execute(
-        select(User).where(User.discord_id == discord_id)
-    )
-    user = result.scalar_one_or_none()
+    """
+    Get existing user or create new one in a single INSERT ... ON CONFLICT.
 
-    if not user:
-        user = User(
-            discord_id=discord_id,
-            discord_username=f"user_{discord_id}",
-            discord_discriminator="0000",
-            role="user",
-        )
-        session.add(user)
-        await session.commit()
-        await session.refresh(user)
+    The conflict branch touches last_login_at so RETURNING yields the row in
+    both cases; xmax = 0 only for freshly inserted tuples.
+    """
+    stmt = pg_insert(User).values(
+        discord_id=discord_id,
+        discord_username=f"user_{discord_id}",
+        discord_discriminator="0000",
+        role="user",
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[User.discord_id],
+        set_={"last_login_at": func.now()},
+    ).returning(User, literal_column("xmax = 0").label("inserted"))
+
+    result = await session.execute(stmt, execution_options={"populate_existing": True})
+    user, inserted = result.one()
+    # Release the row lock before the slow model call
+    await session.commit()
 
+    if inserted:
         logger.info("user.created", discord_id=discord_id, user_id=str(user.id))
 
     return user
@@ -3,13 +3,15 @@ FastAPI main application for Discord S&P Compliance Bot
 Heroku-ready with Grok-4 + RAG integration
 """
 
+import asyncio
+import contextlib
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 import structlog
 from opentelemetry import trace
@@ -17,6 +19,7 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
 
+from app.config import parse_cors_origins
 from app.routers import health_router, query_router, admin_router
 from app.models.exceptions import (
     ComplianceAPIException,
@@ -27,7 +30,14 @@ from app.models.exceptions import (
     ExternalAPIException,
     ComplianceProcessingException,
 )
-from app.database.connection import engine
+from app.database.connection import (
+    engine,
+    ensure_audit_log_partitions,
+    probe_engine,
+    refresh_admin_stats,
+)
+from app.rag.retriever import close_vector_store, warm_embedder
+from app.rag.ingest import close_http_client, close_pdf_pool
 
 # Configure structured logging
 structlog.configure(
@@ -48,8 +58,13 @@ logger = structlog.get_logger()
 
 # Environment configuration
 ENVIRONMENT = os.getenv("ENVIRONMENT", "production")
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "https://discord.com").split(",")
+# Parsed once; CORSMiddleware checks request origins against this set
+CORS_ORIGINS = parse_cors_origins(os.getenv("CORS_ORIGINS", "https://discord.com"))
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Seconds between admin_stats_mv refreshes
+ADMIN_STATS_REFRESH_SECONDS = float(os.getenv("ADMIN_STATS_REFRESH_SECONDS", "120"))
+# Seconds between checks for upcoming system_audit_logs partitions
+AUDIT_PARTITION_INTERVAL_SECONDS = 24 * 3600
 
 # OpenTelemetry setup for observability
 if ENVIRONMENT == "production":
@@ -79,11 +94,50 @@ async def lifespan(app: FastAPI):
         logger.error("app.database.connection_failed", error=str(e))
         raise
 
+    # Load the embedding model off the event loop; startup does not wait for it
+    warmup_task = asyncio.create_task(asyncio.to_thread(warm_embedder))
+    warmup_task.add_done_callback(_log_warmup_failure)
+
+    stats_refresh_task = asyncio.create_task(_refresh_admin_stats_loop())
+    partition_task = asyncio.create_task(_audit_partition_loop())
+
     yield
 
     # Shutdown
     logger.info("app.shutdown")
+    for task in (stats_refresh_task, partition_task):
+        task.cancel()
+    for task in (stats_refresh_task, partition_task):
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await close_http_client()
+    close_pdf_pool()
+    close_vector_store()
     await engine.dispose()
+    await probe_engine.dispose()
+
+
+def _log_warmup_failure(task: asyncio.Task) -> None:
+    """Log embedder warmup errors; the model loads lazily on first use instead"""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("app.embedder.warmup_failed", error=str(task.exception()))
+
+
+async def _refresh_admin_stats_loop() -> None:
+    """Refresh the admin stats materialized view every ADMIN_STATS_REFRESH_SECONDS"""
+    while True:
+        await asyncio.sleep(ADMIN_STATS_REFRESH_SECONDS)
+        try:
+            await refresh_admin_stats()
+        except Exception as e:
+            logger.error("app.admin_stats.refresh_failed", error=str(e))
+
+
+async def _audit_partition_loop() -> None:
+    """Create upcoming audit log partitions at startup and then daily"""
+    while True:
+        await ensure_audit_log_partitions()
+        await asyncio.sleep(AUDIT_PARTITION_INTERVAL_SECONDS)
 
 
 # Create FastAPI application
@@ -145,7 +199,7 @@ async def model_not_available_handler(request: Request, exc: ModelNotAvailableEx
         message=exc.message,
         context=exc.context,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "model_unavailable",
@@ -158,7 +212,7 @@ async def model_not_available_handler(request: Request, exc: ModelNotAvailableEx
 @app.exception_handler(InvalidQueryException)
 async def invalid_query_handler(request: Request, exc: InvalidQueryException):
     """Handle invalid query requests"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "invalid_query",
@@ -171,7 +225,7 @@ async def invalid_query_handler(request: Request, exc: InvalidQueryException):
 @app.exception_handler(InsufficientPermissionsException)
 async def insufficient_permissions_handler(request: Request, exc: InsufficientPermissionsException):
     """Handle permission errors"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "insufficient_permissions",
@@ -184,7 +238,7 @@ async def insufficient_permissions_handler(request: Request, exc: InsufficientPe
 @app.exception_handler(RateLimitExceededException)
 async def rate_limit_handler(request: Request, exc: RateLimitExceededException):
     """Handle rate limiting"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "rate_limit_exceeded",
@@ -205,7 +259,7 @@ async def external_api_handler(request: Request, exc: ExternalAPIException):
         service=exc.context.get("service"),
         error=exc.message,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "external_api_error",
@@ -218,7 +272,7 @@ async def external_api_handler(request: Request, exc: ExternalAPIException):
 @app.exception_handler(ComplianceProcessingException)
 async def compliance_processing_handler(request: Request, exc: ComplianceProcessingException):
     """Handle compliance processing errors"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "processing_error",
@@ -237,7 +291,7 @@ async def generic_api_handler(request: Request, exc: ComplianceAPIException):
         message=exc.message,
         context=exc.context,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "api_error",
@@ -250,7 +304,7 @@ async def generic_api_handler(request: Request, exc: ComplianceAPIException):
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle Pydantic validation errors"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "validation_error",
@@ -269,7 +323,7 @@ async def generic_exception_handler(request: Request, exc: Exception):
         error=str(exc),
         error_type=type(exc).__name__,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "internal_server_error",
@@ -307,6 +361,6 @@ if ENVIRONMENT == "production":
 logger.info(
     "app.configured",
     environment=ENVIRONMENT,
-    cors_origins=CORS_ORIGINS,
+    cors_origins=sorted(CORS_ORIGINS),
     log_level=LOG_LEVEL,
 )
\ No newline at end of file
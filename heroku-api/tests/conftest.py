@@ -31,4 +31,44 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
     from main import app
 
     async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
\ No newline at end of file
+        yield ac
+
+@pytest.fixture
+async def query_ids() -> AsyncGenerator[list, None]:
+    """Commit a throwaway user with three query logs; yields the query ids as strings"""
+    import uuid
+
+    from sqlalchemy import delete
+
+    from app.database.connection import async_session_factory
+    from app.database.models import User, QueryLog, hash_bytes
+
+    async with async_session_factory() as session:
+        user = User(
+            discord_id=str(uuid.uuid4().int)[:18],
+            discord_username="test_user",
+            discord_discriminator="0000",
+        )
+        session.add(user)
+        await session.flush()
+
+        logs = [
+            QueryLog(
+                user_id=user.id,
+                query_text=f"test query {i}",
+                query_hash=hash_bytes(f"test query {i}"),
+                response_text="test answer",
+                confidence_score=0.9,
+                risk_level="low",
+                response_time_ms=1,
+            )
+            for i in range(3)
+        ]
+        session.add_all(logs)
+        await session.commit()
+
+        yield [str(log.id) for log in logs]
+
+        # Query logs and feedback go with the user (ON DELETE CASCADE)
+        await session.execute(delete(User).where(User.id == user.id))
+        await session.commit()
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Tests for database model helpers
+"""
+
+from datetime import date
+
+from app.database.models import audit_log_partition_ranges, hash_bytes
+
+
+def test_partition_ranges_are_contiguous_months():
+    """Test partitions start at the current month and tile the following months"""
+    ranges = audit_log_partition_ranges(date(2026, 10, 16))
+
+    assert ranges == [
+        ("system_audit_logs_2026_10", date(2026, 10, 1), date(2026, 11, 1)),
+        ("system_audit_logs_2026_11", date(2026, 11, 1), date(2026, 12, 1)),
+        ("system_audit_logs_2026_12", date(2026, 12, 1), date(2027, 1, 1)),
+    ]
+
+
+def test_partition_ranges_roll_over_year():
+    """Test December rolls into January of the next year"""
+    ranges = audit_log_partition_ranges(date(2026, 12, 31), months_ahead=1)
+
+    assert ranges == [
+        ("system_audit_logs_2026_12", date(2026, 12, 1), date(2027, 1, 1)),
+        ("system_audit_logs_2027_01", date(2027, 1, 1), date(2027, 2, 1)),
+    ]
+
+
+def test_partition_ranges_current_month_only():
+    """Test months_ahead=0 yields just the current month"""
+    assert audit_log_partition_ranges(date(2027, 1, 1), months_ahead=0) == [
+        ("system_audit_logs_2027_01", date(2027, 1, 1), date(2027, 2, 1)),
+    ]
+
+
+def test_hash_bytes_is_raw_32_byte_digest():
+    """Test hash_bytes fits the LargeBinary(32) hash columns"""
+    digest = hash_bytes("What is the record retention period?")
+
+    assert isinstance(digest, bytes)
+    assert len(digest) == 32
+    assert digest == hash_bytes("What is the record retention period?")
\ No newline at end of file
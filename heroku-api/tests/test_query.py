@@ -0,0 +1,114 @@
+"""
+Tests for compliance query endpoints
+"""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_bulk_feedback_rejects_empty_batch(client: AsyncClient):
+    """Test bulk feedback requires at least one item"""
+    response = await client.post("/api/v1/feedback/bulk", json={"items": []})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_feedback_validates_items(client: AsyncClient):
+    """Test bulk feedback validates each item like single feedback"""
+    item = {
+        "query_id": "550e8400-e29b-41d4-a716-446655440000",
+        "overall_rating": 6,
+        "helpfulness_rating": 5,
+        "accuracy_rating": 5,
+    }
+    response = await client.post("/api/v1/feedback/bulk", json={"items": [item]})
+    assert response.status_code == 422
+
+
+def _feedback_item(query_id: str) -> dict:
+    """Valid feedback payload for query_id"""
+    return {
+        "query_id": query_id,
+        "overall_rating": 5,
+        "helpfulness_rating": 4,
+        "accuracy_rating": 5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_feedback_per_item_results(client: AsyncClient, query_ids: list):
+    """Test each bulk item fails on its own while the rest are stored"""
+    items = [
+        _feedback_item(query_ids[0]),
+        _feedback_item("550e8400-e29b-41d4-a716-446655440000"),
+        _feedback_item("not-a-uuid"),
+        _feedback_item(query_ids[1]),
+    ]
+    response = await client.post("/api/v1/feedback/bulk", json={"items": items})
+    assert response.status_code == 200
+
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["success", "error", "error", "success"]
+    assert results[1]["status_code"] == 404
+    assert results[2]["status_code"] == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_feedback_rejects_in_batch_duplicates(client: AsyncClient, query_ids: list):
+    """Test a query repeated within one batch only gets feedback once"""
+    items = [_feedback_item(query_ids[0]), _feedback_item(query_ids[0])]
+    response = await client.post("/api/v1/feedback/bulk", json={"items": items})
+
+    results = response.json()["results"]
+    assert results[0]["status"] == "success"
+    assert results[1] == {"status": "error", "status_code": 409, "detail": "Feedback already submitted"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_feedback_rejects_existing_feedback(client: AsyncClient, query_ids: list):
+    """Test feedback stored by an earlier request is a per-item 409"""
+    await client.post("/api/v1/feedback", json=_feedback_item(query_ids[0]))
+
+    items = [_feedback_item(query_ids[0]), _feedback_item(query_ids[2])]
+    response = await client.post("/api/v1/feedback/bulk", json={"items": items})
+
+    results = response.json()["results"]
+    assert results[0]["status_code"] == 409
+    assert results[1]["status"] == "success"
+
+
+@pytest.mark.asyncio
+async def test_feedback_rejects_malformed_query_id(client: AsyncClient):
+    """Test a malformed query_id is a 400, not a server error"""
+    response = await client.post("/api/v1/feedback", json=_feedback_item("not-a-uuid"))
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_user_is_idempotent():
+    """Test concurrent first queries from one Discord user create a single row"""
+    import asyncio
+    import uuid
+
+    from sqlalchemy import delete
+
+    from app.database.connection import async_session_factory
+    from app.database.models import User
+    from app.routers.query import _get_or_create_user
+
+    discord_id = str(uuid.uuid4().int)[:18]
+
+    async def get_or_create():
+        async with async_session_factory() as session:
+            return await _get_or_create_user(session, discord_id)
+
+    try:
+        first, second = await asyncio.gather(get_or_create(), get_or_create())
+        again = await get_or_create()
+        assert first.id == second.id == again.id
+        assert again.discord_username == f"user_{discord_id}"
+    finally:
+        async with async_session_factory() as session:
+            await session.execute(delete(User).where(User.discord_id == discord_id))
+            await session.commit()
\ No newline at end of file
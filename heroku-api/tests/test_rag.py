@@ -0,0 +1,159 @@
+"""
+Tests for RAG fusion and text splitting
+"""
+
+import random
+
+import pytest
+
+from app.rag.retriever import _reciprocal_rank_fusion
+from app.rag.splitter import RecursiveTextSplitter
+from app.rag.store import VectorStore
+
+
+def _reference_rrf(results_a, results_b, weight_a=0.7, weight_b=0.3, k=60):
+    """Dict-based RRF the numpy implementation replaced"""
+    doc_map = {}
+    for results, weight in ((results_a, weight_a), (results_b, weight_b)):
+        for rank, result in enumerate(results, start=1):
+            doc_id = (result.get("document_id", ""), result.get("chunk_index", 0))
+            if doc_id not in doc_map:
+                doc_map[doc_id] = {**result, "rrf_score": 0.0}
+            doc_map[doc_id]["rrf_score"] += weight * (1.0 / (k + rank))
+
+    fused = sorted(doc_map.values(), key=lambda x: x["rrf_score"], reverse=True)
+    for result in fused:
+        result["score"] = result.pop("rrf_score")
+    return fused
+
+
+def _results(rng: random.Random, n: int):
+    """n distinct search results drawn from a small pool, so the two lists overlap"""
+    keys = rng.sample([(f"doc{d}", c) for d in range(5) for c in range(8)], n)
+    return [
+        {"document_id": document_id, "chunk_index": chunk_index, "text": f"{document_id}:{chunk_index}", "score": rng.random()}
+        for document_id, chunk_index in keys
+    ]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_rrf_matches_reference(seed: int):
+    """Test numpy RRF returns the same order and scores as the dict implementation"""
+    rng = random.Random(seed)
+    results_a = _results(rng, rng.randint(0, 20))
+    results_b = _results(rng, rng.randint(0, 20))
+
+    fused = _reciprocal_rank_fusion(results_a, results_b)
+    expected = _reference_rrf(results_a, results_b)
+
+    assert [(r["document_id"], r["chunk_index"]) for r in fused] == [
+        (r["document_id"], r["chunk_index"]) for r in expected
+    ]
+    assert [r["score"] for r in fused] == pytest.approx([r["score"] for r in expected])
+    assert [r["text"] for r in fused] == [r["text"] for r in expected]
+
+
+def test_rrf_top_k_is_a_prefix():
+    """Test top_k truncates the fused ranking without reordering it"""
+    rng = random.Random(0)
+    results_a = _results(rng, 15)
+    results_b = _results(rng, 15)
+
+    full = _reciprocal_rank_fusion(results_a, results_b)
+    top = _reciprocal_rank_fusion(results_a, results_b, top_k=5)
+
+    assert top == full[:5]
+
+
+def test_splitter_estimates_tokens_without_tokenizer():
+    """Test the chars/4 fallback rounds up so short pieces are never free"""
+    splitter = RecursiveTextSplitter(chunk_size=64, chunk_overlap=8)
+    splitter._tokenizer = None
+
+    assert splitter._count_tokens(["", "a", "abcd", "abcde", "x" * 40]) == [0, 1, 1, 2, 10]
+
+
+def test_splitter_counts_match_tokenizer():
+    """Test batched token counts equal per-piece tokenizer lengths"""
+    splitter = RecursiveTextSplitter(chunk_size=64, chunk_overlap=8)
+    if splitter._tokenizer is None:
+        pytest.skip("tokenizer not available")
+
+    pieces = ["Broker-dealers must retain records. ", "", "Rule 17a-4(f)\n", "word " * 30]
+    expected = [len(splitter._tokenizer.encode(piece, add_special_tokens=False)) for piece in pieces]
+
+    assert splitter._count_tokens(pieces) == expected
+
+
+def test_splitter_chunks_fit_chunk_size():
+    """Test packed chunks (overlap included) stay within chunk_size tokens"""
+    splitter = RecursiveTextSplitter(chunk_size=64, chunk_overlap=8)
+    splitter._tokenizer = None
+    text = "\n\n".join(
+        ". ".join(f"Sentence {p}-{s} about record retention" for s in range(6)) for p in range(20)
+    )
+
+    chunks = splitter.split_text(text)
+
+    assert len(chunks) > 1
+    assert all(count <= splitter.chunk_size for count in splitter._count_tokens(chunks))
+
+
+class _FakeRedis:
+    """Just enough of redis-py for VectorStore.add_chunks: chunk-id sets and a pipeline"""
+
+    def __init__(self):
+        self.sets = {}
+
+    def smismember(self, key, members):
+        stored = self.sets.get(key, set())
+        return [member in stored for member in members]
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    def execute(self):
+        return []
+
+
+def _fake_store():
+    """VectorStore over _FakeRedis; returns the store and the list of HSET batches it writes"""
+    store = VectorStore.__new__(VectorStore)
+    store.index_name = "test_docs"
+    store.client = _FakeRedis()
+    writes = []
+    store._bulk_hset = lambda keys, args: writes.append(args)
+    return store, writes
+
+
+def _chunk(**metadata):
+    """One chunk of document doc-1 with the given metadata overrides"""
+    return {
+        "text": "Records must be retained for six years.",
+        "embedding": [1.0, 0.0, 0.0],
+        "metadata": {"document_id": "doc-1", "chunk_index": 0, "category": "retention", **metadata},
+    }
+
+
+def test_add_chunks_skips_unchanged_chunks():
+    """Test re-adding the same chunk, even at a later ingested_at, writes nothing"""
+    store, writes = _fake_store()
+
+    assert store.add_chunks([_chunk(ingested_at="2026-01-01T00:00:00")]) == 1
+    assert store.add_chunks([_chunk(ingested_at="2026-02-01T00:00:00")]) == 0
+    assert len(writes) == 1
+
+
+def test_add_chunks_rewrites_chunks_with_changed_metadata():
+    """Test a new category or title rewrites the chunk so its TAG and meta are current"""
+    store, writes = _fake_store()
+    store.add_chunks([_chunk(category="retention", document_title="Old title")])
+
+    assert store.add_chunks([_chunk(category="recordkeeping", document_title="Old title")]) == 1
+    assert b"recordkeeping" in writes[-1]
+
+    assert store.add_chunks([_chunk(category="recordkeeping", document_title="New title")]) == 1
+    assert b"New title" in writes[-1][-1]
\ No newline at end of file